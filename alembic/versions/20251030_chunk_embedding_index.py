@@ -0,0 +1,91 @@
+"""Build an approximate nearest neighbour index on chunk embeddings."""
+from __future__ import annotations
+
+import logging
+import os
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20251030_chunk_embedding_index"
+down_revision: Union[str, None] = "20251028_message_citations"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LOGGER = logging.getLogger("alembic.runtime.migration")
+
+INDEX_NAME = "ix_chunks_embedding_ann"
+# pgvector refuses to build HNSW/IVFFlat indexes for vectors above this size.
+MAX_INDEXED_DIMENSION = 2000
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
+def _resolve_index_type() -> str:
+    index_type = (os.getenv("VECTORSTORE__INDEX_TYPE") or "hnsw").strip().lower()
+    if index_type not in {"hnsw", "ivfflat"}:
+        raise ValueError(f"Unsupported vector index type '{index_type}'. Expected 'hnsw' or 'ivfflat'.")
+    return index_type
+
+
+def _embedding_dimension() -> int | None:
+    """Read the dimension the chunks.embedding column was created with."""
+
+    bind = op.get_bind()
+    result = bind.execute(
+        sa.text(
+            "SELECT atttypmod FROM pg_attribute "
+            "WHERE attrelid = 'chunks'::regclass AND attname = 'embedding' AND NOT attisdropped"
+        )
+    ).scalar()
+    if result is None or int(result) <= 0:
+        return None
+    return int(result)
+
+
+def upgrade() -> None:
+    """Create an HNSW (default) or IVFFlat cosine index on chunks.embedding."""
+
+    dimension = _embedding_dimension()
+    if dimension is not None and dimension > MAX_INDEXED_DIMENSION:
+        LOGGER.warning(
+            "Skipping %s: embedding dimension %s exceeds the pgvector index limit of %s.",
+            INDEX_NAME,
+            dimension,
+            MAX_INDEXED_DIMENSION,
+        )
+        return
+
+    index_type = _resolve_index_type()
+    if index_type == "hnsw":
+        options = (
+            f"m = {_env_int('VECTORSTORE__HNSW_M', 16)}, "
+            f"ef_construction = {_env_int('VECTORSTORE__HNSW_EF_CONSTRUCTION', 64)}"
+        )
+    else:
+        options = f"lists = {_env_int('VECTORSTORE__IVFFLAT_LISTS', 100)}"
+
+    # Build without blocking concurrent ingestion writes on large tables.
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+            f"ON chunks USING {index_type} (embedding vector_cosine_ops) WITH ({options})"
+        )
+
+
+def downgrade() -> None:
+    """Drop the chunk embedding ANN index."""
+
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
@@ -0,0 +1,45 @@
+"""Denormalise the owning collection onto chunks for scoped vector search."""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20251031_chunk_collection_scope"
+down_revision: Union[str, None] = "20251030_chunk_embedding_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add chunks.collection_id, backfill it from ingestion jobs and index it."""
+
+    op.add_column("chunks", sa.Column("collection_id", sa.String(), nullable=True))
+    op.create_foreign_key(
+        "fk_chunks_collection_id_collections",
+        "chunks",
+        "collections",
+        ["collection_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.execute(
+        """
+        UPDATE chunks AS c
+        SET collection_id = ij.collection_id
+        FROM documents AS d
+        JOIN ingestion_jobs AS ij ON ij.id = d.ingestion_job_id
+        WHERE d.id = c.document_id
+        """
+    )
+    op.create_index("ix_chunks_collection_id", "chunks", ["collection_id"])
+
+
+def downgrade() -> None:
+    """Remove the denormalised collection column."""
+
+    op.drop_index("ix_chunks_collection_id", table_name="chunks")
+    op.drop_constraint("fk_chunks_collection_id_collections", "chunks", type_="foreignkey")
+    op.drop_column("chunks", "collection_id")
@@ -0,0 +1,34 @@
+"""Composite indexes backing keyset pagination of chat sessions and messages."""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20251101_chat_pagination_indexes"
+down_revision: Union[str, None] = "20251031_chunk_collection_scope"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index conversations by (user_id, updated_at) and messages by (conversation_id, created_at)."""
+
+    op.create_index(
+        "ix_conversations_user_id_updated_at",
+        "conversations",
+        ["user_id", "updated_at"],
+    )
+    op.create_index(
+        "ix_messages_conversation_id_created_at",
+        "messages",
+        ["conversation_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the pagination indexes."""
+
+    op.drop_index("ix_messages_conversation_id_created_at", table_name="messages")
+    op.drop_index("ix_conversations_user_id_updated_at", table_name="conversations")
@@ -0,0 +1,60 @@
+"""Semantic answer cache for repeated chat questions."""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = "20251102_answer_cache"
+down_revision: Union[str, None] = "20251101_chat_pagination_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _embedding_dimension() -> int | None:
+    """Match the dimension of chunks.embedding so cached query vectors are comparable."""
+
+    bind = op.get_bind()
+    result = bind.execute(
+        sa.text(
+            "SELECT atttypmod FROM pg_attribute "
+            "WHERE attrelid = 'chunks'::regclass AND attname = 'embedding' AND NOT attisdropped"
+        )
+    ).scalar()
+    if result is None or int(result) <= 0:
+        return None
+    return int(result)
+
+
+def upgrade() -> None:
+    """Create the answer_cache table."""
+
+    op.create_table(
+        "answer_cache",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("scope_key", sa.String(length=64), nullable=False),
+        sa.Column("model_key", sa.String(length=255), nullable=False),
+        sa.Column("query", sa.Text(), nullable=False),
+        sa.Column("query_embedding", Vector(_embedding_dimension()), nullable=False),
+        sa.Column("answer", sa.Text(), nullable=False),
+        sa.Column("context_json", sa.JSON(), nullable=True),
+        sa.Column("citations_json", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_answer_cache_scope_model_expires",
+        "answer_cache",
+        ["scope_key", "model_key", "expires_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the answer_cache table."""
+
+    op.drop_index("ix_answer_cache_scope_model_expires", table_name="answer_cache")
+    op.drop_table("answer_cache")
@@ -0,0 +1,41 @@
+"""Full-text search column and GIN index on chunk content for hybrid retrieval."""
+from __future__ import annotations
+
+import os
+import re
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20251103_chunk_fulltext"
+down_revision: Union[str, None] = "20251102_answer_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_chunks_content_tsv"
+
+
+def _text_search_config() -> str:
+    config = (os.getenv("VECTORSTORE__TEXT_SEARCH_CONFIG") or "simple").strip().lower()
+    if not re.fullmatch(r"[a-z_]+", config):
+        raise ValueError(f"Invalid text search configuration '{config}'.")
+    return config
+
+
+def upgrade() -> None:
+    """Add a generated chunks.content_tsv column and index it with GIN."""
+
+    config = _text_search_config()
+    op.execute(
+        "ALTER TABLE chunks ADD COLUMN content_tsv tsvector "
+        f"GENERATED ALWAYS AS (to_tsvector('{config}'::regconfig, coalesce(content, ''))) STORED"
+    )
+    op.execute(f"CREATE INDEX {INDEX_NAME} ON chunks USING gin (content_tsv)")
+
+
+def downgrade() -> None:
+    """Drop the full-text column and its index."""
+
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+    op.execute("ALTER TABLE chunks DROP COLUMN IF EXISTS content_tsv")
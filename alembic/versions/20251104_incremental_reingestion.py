@@ -0,0 +1,41 @@
+"""Source keys on documents and content hashes on chunks for incremental re-ingestion."""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20251104_incremental_reingestion"
+down_revision: Union[str, None] = "20251103_chunk_fulltext"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add documents.source_key and chunks.content_hash, backfill both and index them."""
+
+    op.add_column("documents", sa.Column("source_key", sa.String(length=1024), nullable=True))
+    op.add_column("chunks", sa.Column("content_hash", sa.String(length=64), nullable=True))
+    op.execute(
+        """
+        UPDATE documents AS d
+        SET source_key = COALESCE(ij.parameters ->> 'original_filename', d.source_path)
+        FROM ingestion_jobs AS ij
+        WHERE ij.id = d.ingestion_job_id
+        """
+    )
+    op.execute("UPDATE documents SET source_key = source_path WHERE source_key IS NULL")
+    op.execute("UPDATE chunks SET content_hash = encode(sha256(convert_to(content, 'UTF8')), 'hex')")
+    op.create_index("ix_documents_source_key", "documents", ["source_key"])
+    op.create_index("ix_chunks_document_id_content_hash", "chunks", ["document_id", "content_hash"])
+
+
+def downgrade() -> None:
+    """Drop the re-ingestion columns and their indexes."""
+
+    op.drop_index("ix_chunks_document_id_content_hash", table_name="chunks")
+    op.drop_index("ix_documents_source_key", table_name="documents")
+    op.drop_column("chunks", "content_hash")
+    op.drop_column("documents", "source_key")
@@ -0,0 +1,28 @@
+"""Index documents by source file hash so duplicate uploads can reuse existing chunks."""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20251105_document_docling_hash"
+down_revision: Union[str, None] = "20251104_incremental_reingestion"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add documents.docling_hash, backfill it from the document metadata and index it."""
+
+    op.add_column("documents", sa.Column("docling_hash", sa.String(length=64), nullable=True))
+    op.execute("UPDATE documents SET docling_hash = metadata_json ->> 'docling_hash' WHERE metadata_json IS NOT NULL")
+    op.create_index("ix_documents_docling_hash", "documents", ["docling_hash"])
+
+
+def downgrade() -> None:
+    """Drop the file hash column."""
+
+    op.drop_index("ix_documents_docling_hash", table_name="documents")
+    op.drop_column("documents", "docling_hash")
@@ -0,0 +1,48 @@
+"""Add a per-page table locating rendered page images for previews."""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20251106_document_pages"
+down_revision: Union[str, None] = "20251105_document_docling_hash"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create document_pages and backfill it from the page metadata copied into each chunk."""
+
+    op.create_table(
+        "document_pages",
+        sa.Column("document_id", sa.String(), nullable=False),
+        sa.Column("page_number", sa.Integer(), nullable=False),
+        sa.Column("image_path", sa.String(length=1024), nullable=True),
+        sa.Column("mimetype", sa.String(length=64), nullable=True),
+        sa.ForeignKeyConstraint(["document_id"], ["documents.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("document_id", "page_number"),
+    )
+    op.execute(
+        """
+        INSERT INTO document_pages (document_id, page_number, image_path)
+        SELECT document_id, page_number, max(image_path)
+        FROM (
+            SELECT
+                document_id,
+                (metadata_json -> 'page_metadata' ->> 'page_number')::integer AS page_number,
+                metadata_json -> 'page_metadata' ->> 'image_path' AS image_path
+            FROM chunks
+            WHERE metadata_json -> 'page_metadata' ->> 'page_number' ~ '^[0-9]+$'
+        ) AS pages
+        GROUP BY document_id, page_number
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the page table."""
+
+    op.drop_table("document_pages")
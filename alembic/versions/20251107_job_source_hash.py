@@ -0,0 +1,25 @@
+"""Store the server-computed SHA-256 of an uploaded source on its ingestion job."""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20251107_job_source_hash"
+down_revision: Union[str, None] = "20251106_document_pages"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add ingestion_jobs.source_sha256; hashes previously kept in client-editable parameters are not trusted."""
+
+    op.add_column("ingestion_jobs", sa.Column("source_sha256", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the source hash column."""
+
+    op.drop_column("ingestion_jobs", "source_sha256")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""Compare per-row chunk persistence with the bulk insert path."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from src.config import load_settings
+from src.infrastructure.database import Document, configure_engine
+from src.infrastructure.embeddings.base import EMBEDDING_DIMENSION
+from src.infrastructure.repositories.document_repo import DocumentRepository
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000], help="Chunk counts to benchmark.")
+    return parser.parse_args()
+
+
+def _fake_chunks(count: int) -> tuple[list[str], list[list[float]], list[dict[str, object]]]:
+    rng = random.Random(count)
+    contents = [f"Benchmark chunk {index} " + "lorem ipsum " * 80 for index in range(count)]
+    embeddings = [[rng.uniform(-1.0, 1.0) for _ in range(EMBEDDING_DIMENSION)] for _ in range(count)]
+    metadata: list[dict[str, object]] = [{"chunk_index": index, "page_number": index // 10 + 1} for index in range(count)]
+    return contents, embeddings, metadata
+
+
+async def _time_per_row(repo: DocumentRepository, document_id: str, chunks) -> float:
+    contents, embeddings, metadata = chunks
+    start = perf_counter()
+    for content, embedding, chunk_metadata in zip(contents, embeddings, metadata, strict=True):
+        await repo.add_chunk(
+            document_id=document_id,
+            content=content,
+            embedding=embedding,
+            embedding_model="benchmark",
+            metadata=chunk_metadata,
+        )
+    return perf_counter() - start
+
+
+async def _time_bulk(repo: DocumentRepository, document_id: str, chunks) -> float:
+    contents, embeddings, metadata = chunks
+    start = perf_counter()
+    await repo.add_chunks_bulk(
+        document_id=document_id,
+        contents=contents,
+        embeddings=embeddings,
+        metadata=metadata,
+        embedding_model="benchmark",
+    )
+    await repo.session.flush()
+    return perf_counter() - start
+
+
+async def main() -> None:
+    args = _parse_args()
+    settings = load_settings()
+    session_factory = configure_engine(settings)
+
+    for size in args.sizes:
+        chunks = _fake_chunks(size)
+        timings: dict[str, float] = {}
+        for label, runner in (("per-row", _time_per_row), ("bulk", _time_bulk)):
+            # Every run happens in a transaction that is rolled back, leaving the database untouched.
+            async with session_factory() as session:  # type: ignore[call-arg]
+                document = Document(title="benchmark", source_path="benchmark", metadata_json={})
+                session.add(document)
+                await session.flush()
+                timings[label] = await runner(DocumentRepository(session), document.id, chunks)
+                await session.rollback()
+        speedup = timings["per-row"] / timings["bulk"] if timings["bulk"] else float("inf")
+        print(
+            f"{size:>6} chunks | per-row={timings['per-row']:8.2f}s | bulk={timings['bulk']:8.2f}s "
+            f"| speedup={speedup:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
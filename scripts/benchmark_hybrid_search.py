@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""Compare recall and latency of vector-only and hybrid (full-text + ANN) search on a fixture corpus."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from sqlalchemy import delete
+
+from src.config import load_settings
+from src.infrastructure.database import Collection, Document, configure_engine
+from src.infrastructure.embeddings.factory import create_embedding_client
+from src.infrastructure.repositories.document_repo import DocumentRepository
+from src.infrastructure.vectorstore.pgvector import PGVectorStore
+
+DEFAULT_FIXTURE = ROOT_DIR / "scripts" / "fixtures" / "hybrid_search_corpus.json"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE, help="JSON file with chunks and queries.")
+    parser.add_argument("-k", type=int, default=5, help="Number of results to evaluate.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per query.")
+    return parser.parse_args()
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def main() -> None:
+    args = _parse_args()
+    fixture = json.loads(args.fixture.read_text(encoding="utf-8"))
+    settings = load_settings()
+    session_factory = configure_engine(settings)
+    embedder = create_embedding_client(settings)
+
+    keys = list(fixture["chunks"])
+    contents = [fixture["chunks"][key] for key in keys]
+    # The fixture is committed so the lexical query (on its own session) can see it; removed in ``finally``.
+    async with session_factory() as session:  # type: ignore[call-arg]
+        repo = DocumentRepository(session)
+        collection = await repo.create_collection(f"benchmark-hybrid-{perf_counter():.0f}")
+        document = Document(title="hybrid benchmark fixture", source_path=str(args.fixture), metadata_json={})
+        session.add(document)
+        await session.flush()
+        chunk_ids = await repo.add_chunks_bulk(
+            document_id=document.id,
+            collection_id=collection.id,
+            contents=contents,
+            embeddings=await embedder.embed(contents),
+            metadata=[{"fixture_key": key} for key in keys],
+            embedding_model=embedder.model_name,
+        )
+        await session.commit()
+        collection_id, document_id = collection.id, document.id
+    key_by_chunk = dict(zip(chunk_ids, keys, strict=True))
+
+    try:
+        for mode in ("vector", "hybrid"):
+            latencies: list[float] = []
+            recalls: list[float] = []
+            for item in fixture["queries"]:
+                relevant = set(item["relevant"])
+                for _ in range(args.repeat):
+                    async with session_factory() as session:  # type: ignore[call-arg]
+                        store = PGVectorStore(
+                            session, embedder, settings=settings.vectorstore, session_factory=session_factory
+                        )
+                        search = store.hybrid_search if mode == "hybrid" else store.similarity_search
+                        start = perf_counter()
+                        results = await search(item["query"], k=args.k, collection_ids=[collection_id])
+                        latencies.append(perf_counter() - start)
+                found = {key_by_chunk.get(str(result["chunk_id"])) for result in results}
+                recalls.append(len(relevant & found) / len(relevant))
+            print(
+                f"{mode:>6} | recall@{args.k}={statistics.mean(recalls):.3f} "
+                f"| p50={_percentile(latencies, 0.5) * 1000:7.2f}ms p95={_percentile(latencies, 0.95) * 1000:7.2f}ms"
+            )
+    finally:
+        async with session_factory() as session:  # type: ignore[call-arg]
+            await session.execute(delete(Document).where(Document.id == document_id))
+            await session.execute(delete(Collection).where(Collection.id == collection_id))
+            await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""Measure time-to-first-token under concurrency with a fresh vs. a pooled HTTP client."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from src.config import Settings, load_settings
+from src.infrastructure.llm import OllamaClient, VLLMClient
+from src.infrastructure.llm.base import LLMClient
+from src.infrastructure.llm.http import close_http_client, create_http_client
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="Parallel requests per round.")
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds per concurrency level.")
+    parser.add_argument("--prompt", default="Reply with the single word: ready.", help="Prompt to send.")
+    return parser.parse_args()
+
+
+def _llm(settings: Settings, http_client: httpx.AsyncClient) -> LLMClient:
+    if settings.llm.provider == "vllm":
+        return VLLMClient(settings, http_client=http_client)
+    return OllamaClient(settings, http_client=http_client)
+
+
+async def _ttft(client: LLMClient, prompt: str) -> float:
+    start = perf_counter()
+    first: float | None = None
+    async for _chunk in client.generate(prompt):
+        if first is None:
+            first = perf_counter() - start
+    return first if first is not None else perf_counter() - start
+
+
+async def _per_request(settings: Settings, prompt: str) -> float:
+    # The previous behaviour: a new client, and hence a new TCP (and TLS) connection, per request.
+    async with create_http_client(settings.llm) as http_client:
+        return await _ttft(_llm(settings, http_client), prompt)
+
+
+async def main() -> None:
+    args = _parse_args()
+    settings = load_settings()
+    pooled_client = create_http_client(settings.llm)
+    pooled = _llm(settings, pooled_client)
+    try:
+        # Warm the pool (and the model) so the first pooled round is not charged for the handshake.
+        await _ttft(pooled, args.prompt)
+        for concurrency in args.concurrency:
+            results: dict[str, list[float]] = {"per-request": [], "pooled": []}
+            for _ in range(args.rounds):
+                results["per-request"] += await asyncio.gather(
+                    *(_per_request(settings, args.prompt) for _ in range(concurrency))
+                )
+                results["pooled"] += await asyncio.gather(*(_ttft(pooled, args.prompt) for _ in range(concurrency)))
+            summary = " | ".join(
+                f"{label}: p50={statistics.median(values) * 1000:7.1f}ms max={max(values) * 1000:7.1f}ms"
+                for label, values in results.items()
+            )
+            print(f"concurrency={concurrency:>3} | {summary}")
+    finally:
+        await pooled_client.aclose()
+        await close_http_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""Compare recall and latency of the pgvector ANN index against exact search."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import load_settings
+from src.infrastructure.database import Chunk, configure_engine
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=50, help="Number of sampled query vectors.")
+    parser.add_argument("-k", type=int, default=10, help="Number of neighbours to compare.")
+    parser.add_argument(
+        "--search-values",
+        type=int,
+        nargs="+",
+        default=[10, 20, 40, 80, 160],
+        help="hnsw.ef_search (or ivfflat.probes) values to sweep.",
+    )
+    return parser.parse_args()
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _top_k(session: AsyncSession, vector: list[float], k: int, settings: dict[str, str]) -> tuple[list[str], float]:
+    """Run one nearest-neighbour query inside its own transaction."""
+
+    async with session.begin():
+        for name, value in settings.items():
+            await session.execute(select(func.set_config(name, value, True)))
+        start = perf_counter()
+        result = await session.execute(
+            select(Chunk.id)
+            .where(Chunk.embedding.isnot(None))
+            .order_by(Chunk.embedding.cosine_distance(vector))
+            .limit(k)
+        )
+        ids = list(result.scalars())
+        elapsed = perf_counter() - start
+    return ids, elapsed
+
+
+async def main() -> None:
+    args = _parse_args()
+    settings = load_settings()
+    session_factory = configure_engine(settings)
+    knob = "ivfflat.probes" if settings.vectorstore.index_type == "ivfflat" else "hnsw.ef_search"
+
+    async with session_factory() as session:  # type: ignore[call-arg]
+        async with session.begin():
+            total = (await session.execute(select(func.count(Chunk.id)).where(Chunk.embedding.isnot(None)))).scalar_one()
+            sample = await session.execute(
+                select(Chunk.embedding)
+                .where(Chunk.embedding.isnot(None))
+                .order_by(text("random()"))
+                .limit(args.queries)
+            )
+            queries = [list(vector) for vector in sample.scalars()]
+        if not queries:
+            print("No embedded chunks found; ingest documents before running the benchmark.")
+            return
+
+        print(f"Corpus: {total} embedded chunks | queries: {len(queries)} | k={args.k} | index={settings.vectorstore.index_type}")
+
+        exact_results: list[list[str]] = []
+        exact_latencies: list[float] = []
+        for vector in queries:
+            ids, elapsed = await _top_k(
+                session,
+                vector,
+                args.k,
+                {"enable_indexscan": "off", "enable_bitmapscan": "off"},
+            )
+            exact_results.append(ids)
+            exact_latencies.append(elapsed)
+        print(
+            f"{'exact':>18} | recall@{args.k}=1.000 | p50={statistics.median(exact_latencies) * 1000:8.2f}ms "
+            f"| p95={_percentile(exact_latencies, 0.95) * 1000:8.2f}ms"
+        )
+
+        for value in args.search_values:
+            recalls: list[float] = []
+            latencies: list[float] = []
+            for vector, expected in zip(queries, exact_results, strict=True):
+                ids, elapsed = await _top_k(session, vector, args.k, {knob: str(value)})
+                latencies.append(elapsed)
+                if expected:
+                    recalls.append(len(set(ids) & set(expected)) / len(expected))
+            recall = statistics.fmean(recalls) if recalls else 0.0
+            print(
+                f"{knob}={value:>4} | recall@{args.k}={recall:.3f} | p50={statistics.median(latencies) * 1000:8.2f}ms "
+                f"| p95={_percentile(latencies, 0.95) * 1000:8.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -56,6 +56,81 @@ class LLMSettings(BaseModel):
     vllm_host: str = "http://localhost:8000"
     vllm_model: str = "qwen3:12b"
     request_timeout: int = 60
+    # Texts per /api/embed request and how many of those requests may be in flight at once.
+    embedding_batch_size: int = 32
+    embedding_concurrency: int = 4
+    # Shared keep-alive pool for streaming completions; HTTP/2 is used only when the 'h2' package is installed.
+    http2: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+
+
+class EmbeddingCacheSettings(BaseModel):
+    """On-disk cache of embeddings keyed by model and normalised text hash."""
+
+    enabled: bool = True
+    path: Path = Path("storage/embedding_cache.sqlite3")
+    max_entries: int = 500_000
+
+
+class VectorStoreSettings(BaseModel):
+    """pgvector index configuration and query-time search parameters."""
+
+    index_type: Literal["hnsw", "ivfflat"] = "hnsw"
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 64
+    hnsw_ef_search: int = 40
+    ivfflat_lists: int = 100
+    ivfflat_probes: int = 10
+    # pgvector >= 0.8 can keep scanning the index until enough rows pass a collection filter.
+    iterative_scan: Literal["off", "strict_order", "relaxed_order"] = "off"
+    # In-process cache of query embeddings shared across requests (0 entries disables it).
+    query_cache_size: int = 1024
+    query_cache_ttl_seconds: float = 600.0
+    # Hybrid (full-text + ANN) search: text search configuration of chunks.content_tsv, candidates
+    # taken from each ranking and the reciprocal rank fusion constant.
+    text_search_config: str = "simple"
+    hybrid_candidates: int = 50
+    rrf_k: int = 60
+
+
+class RerankSettings(BaseModel):
+    """Optional second-stage reranking of retrieved chunks."""
+
+    provider: Literal["none", "local", "ollama", "vllm"] = "none"
+    # Reranker model; for Ollama defaults to the chat model. ``host`` defaults to the provider's LLM host.
+    model: str = ""
+    host: str | None = None
+    # Chunks retrieved for rescoring, and how many of them reach the prompt.
+    candidates: int = 50
+    top_k: int = 5
+    batch_size: int = 16
+    max_concurrency: int = 4
+
+
+class RetrievalSettings(BaseModel):
+    """How retrieved chunks are packed into the LLM prompt."""
+
+    # Estimated tokens of context per prompt; chunks are added in rank order until it is spent.
+    context_token_budget: int = 3000
+    # Characters per token used for the estimate (about 4 for English, lower for dense technical text).
+    chars_per_token: float = 4.0
+    # Shared text of at least this many characters between chunks of one document is sent once.
+    min_overlap_chars: int = 40
+    # Coalesce retrieved neighbouring chunks (by chunk_index/character offsets) into one context block.
+    merge_adjacent_chunks: bool = True
+
+
+class AnswerCacheSettings(BaseModel):
+    """Semantic cache of chat answers keyed by query embedding, collection scope and model."""
+
+    enabled: bool = True
+    # Minimum cosine similarity between a new question and a cached one to replay the answer.
+    similarity_threshold: float = 0.95
+    ttl_seconds: int = 86_400
+    # Without pgvector the nearest entry is found in Python among this many recent candidates.
+    max_candidates: int = 200
 
 
 class GraphRAGSettings(BaseModel):
@@ -85,6 +160,21 @@ class ChunkingSettings(BaseModel):
     default_overlap: int = 150
 
 
+class IngestionSettings(BaseModel):
+    """Tuning knobs for the staged ingestion pipeline."""
+
+    # Items buffered between pipeline stages before the producing stage waits.
+    queue_size: int = 4
+    # Chunks embedded per pipeline batch; persistence of one batch overlaps embedding of the next.
+    embed_batch_size: int = 128
+    # Jobs a single worker process runs concurrently, each with its own database session.
+    worker_concurrency: int = 1
+    # On SIGTERM, in-flight jobs get this long to finish before they are cancelled and requeued.
+    shutdown_grace_seconds: float = 60.0
+    # Idle poll interval while LISTEN/NOTIFY is connected; notifications normally wake workers instantly.
+    fallback_poll_seconds: float = 30.0
+
+
 class StorageSettings(BaseModel):
     """File-system storage configuration for ingestion artefacts."""
 
@@ -106,6 +196,20 @@ class DoclingSettings(BaseModel):
     image_scale: float = 2.0
     accelerator_device: Literal["cpu", "cuda"] = "cpu"
     accelerator_num_threads: int = 0
+    # Conversion worker processes, each keeping a warmed converter; 0 converts in a thread instead.
+    worker_processes: int = 0
+
+
+class PreviewSettings(BaseModel):
+    """Downscaled derivatives of Docling page images served to citation previews."""
+
+    # Longest edge in pixels of ``?size=thumb`` and ``?size=medium``; ``full`` serves the rendered page.
+    thumb_max_edge: int = 480
+    medium_max_edge: int = 1280
+    # Derivatives need Pillow; without it every size falls back to the original image.
+    format: Literal["webp", "jpeg", "png"] = "webp"
+    quality: int = 80
+    model_config = ConfigDict(frozen=True)
 
 
 class Settings(BaseSettings):
@@ -114,11 +218,18 @@ class Settings(BaseSettings):
     fastapi: FastAPISettings = Field(default_factory=FastAPISettings)
     postgres: PostgresSettings = Field(default_factory=PostgresSettings)
     llm: LLMSettings = Field(default_factory=LLMSettings)
+    embedding_cache: EmbeddingCacheSettings = Field(default_factory=EmbeddingCacheSettings)
+    vectorstore: VectorStoreSettings = Field(default_factory=VectorStoreSettings)
+    answer_cache: AnswerCacheSettings = Field(default_factory=AnswerCacheSettings)
+    rerank: RerankSettings = Field(default_factory=RerankSettings)
+    retrieval: RetrievalSettings = Field(default_factory=RetrievalSettings)
     graphrag: GraphRAGSettings = Field(default_factory=GraphRAGSettings)
     bootstrap: BootstrapSettings = Field(default_factory=BootstrapSettings)
     chunking: ChunkingSettings = Field(default_factory=ChunkingSettings)
+    ingestion: IngestionSettings = Field(default_factory=IngestionSettings)
     storage: StorageSettings = Field(default_factory=StorageSettings)
     docling: DoclingSettings = Field(default_factory=DoclingSettings)
+    preview: PreviewSettings = Field(default_factory=PreviewSettings)
 
     model_config = SettingsConfigDict(env_file=".env", env_nested_delimiter="__", case_sensitive=False)
 
@@ -140,10 +251,17 @@ __all__ = [
     "FastAPISettings",
     "PostgresSettings",
     "LLMSettings",
+    "EmbeddingCacheSettings",
+    "VectorStoreSettings",
+    "AnswerCacheSettings",
+    "RerankSettings",
+    "RetrievalSettings",
     "GraphRAGSettings",
     "BootstrapSettings",
     "ChunkingSettings",
+    "IngestionSettings",
     "StorageSettings",
     "DoclingSettings",
+    "PreviewSettings",
     "load_settings",
 ]
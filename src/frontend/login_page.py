@@ -53,7 +53,7 @@ async def chat_page(
 ) -> HTMLResponse:
     """Render the chat workspace with persisted conversations."""
     is_admin = any(role.name == "admin" for role in user.roles)
-    conversations = await retrieval_service.list_sessions(user.id)
+    conversations = (await retrieval_service.list_sessions(user.id)).items
     context = {
         "request": request,
         "is_admin": is_admin,
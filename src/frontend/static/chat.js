@@ -181,6 +181,11 @@
       .filter(Boolean);
     const conversationMeta = new Map();
     let activeStream = null;
+    // Keyset pagination state: the API returns the next (older) page's cursor in X-Next-Cursor.
+    let loadedConversations = [];
+    let conversationCursor = null;
+    let loadedMessages = [];
+    let messageCursor = null;
 
     function setStreamingState(state) {
       const label = state === 'streaming' ? 'Streaming…' : state === 'stopped' ? 'Stopped' : 'Idle';
@@ -515,6 +520,17 @@
         conversationList.appendChild(item);
       });
       ensureConversationPlaceholder();
+      if (conversationCursor) {
+        const moreItem = document.createElement('li');
+        moreItem.className = 'conversation-list__more';
+        const moreButton = document.createElement('button');
+        moreButton.type = 'button';
+        moreButton.className = 'conversation-list__more-button';
+        moreButton.dataset.loadMore = 'true';
+        moreButton.textContent = 'Show older conversations';
+        moreItem.appendChild(moreButton);
+        conversationList.appendChild(moreItem);
+      }
       const targetId =
         selectId && conversationMeta.has(selectId) ? selectId : activeConversationId;
       if (targetId) {
@@ -528,20 +544,49 @@
         if (!response.ok) {
           throw new Error(`Failed with status ${response.status}`);
         }
-        const conversations = await response.json();
-        renderConversationList(conversations, selectId);
+        loadedConversations = await response.json();
+        conversationCursor = response.headers.get('X-Next-Cursor');
+        renderConversationList(loadedConversations, selectId);
       } catch (error) {
         console.error('Failed to refresh conversations', error);
       }
     }
 
-    function renderMessages(messages) {
+    async function loadOlderConversations() {
+      if (!conversationCursor) {
+        return;
+      }
+      try {
+        const response = await utils.fetchWithAuth(
+          `/chat/sessions?before=${encodeURIComponent(conversationCursor)}`,
+        );
+        if (!response.ok) {
+          throw new Error(`Failed with status ${response.status}`);
+        }
+        const older = await response.json();
+        loadedConversations = loadedConversations.concat(older);
+        conversationCursor = response.headers.get('X-Next-Cursor');
+        renderConversationList(loadedConversations, activeConversationId);
+      } catch (error) {
+        console.error('Failed to load older conversations', error);
+      }
+    }
+
+    function renderMessages(messages, options = {}) {
       chatWindow.innerHTML = '';
       if (!Array.isArray(messages) || !messages.length) {
         const placeholder = appendMessage('system', 'No messages yet. Ask something to begin.');
         placeholder.dataset.placeholder = 'true';
         return;
       }
+      if (options.hasOlder) {
+        const loadEarlier = document.createElement('button');
+        loadEarlier.type = 'button';
+        loadEarlier.className = 'chat-window__load-earlier';
+        loadEarlier.textContent = 'Load earlier messages';
+        loadEarlier.addEventListener('click', () => loadEarlierMessages(activeConversationId), { once: true });
+        chatWindow.appendChild(loadEarlier);
+      }
       messages.forEach((message) => {
         const role = message.role === 'assistant' ? 'assistant' : message.role === 'user' ? 'user' : 'system';
         appendMessage(role, message.content || '', {
@@ -560,8 +605,9 @@
         if (!response.ok) {
           throw new Error(`Failed with status ${response.status}`);
         }
-        const messages = await response.json();
-        renderMessages(messages);
+        loadedMessages = await response.json();
+        messageCursor = response.headers.get('X-Next-Cursor');
+        renderMessages(loadedMessages, { hasOlder: Boolean(messageCursor) });
       } catch (error) {
         console.error('Failed to load messages', error);
         chatWindow.innerHTML = '';
@@ -569,6 +615,30 @@
       }
     }
 
+    async function loadEarlierMessages(conversationId) {
+      if (!conversationId || !messageCursor) {
+        return;
+      }
+      try {
+        const response = await utils.fetchWithAuth(
+          `/chat/${conversationId}/messages?before=${encodeURIComponent(messageCursor)}`,
+        );
+        if (!response.ok) {
+          throw new Error(`Failed with status ${response.status}`);
+        }
+        const older = await response.json();
+        if (conversationId !== activeConversationId) {
+          return;
+        }
+        loadedMessages = older.concat(loadedMessages);
+        messageCursor = response.headers.get('X-Next-Cursor');
+        renderMessages(loadedMessages, { hasOlder: Boolean(messageCursor) });
+        chatWindow.scrollTop = 0;
+      } catch (error) {
+        console.error('Failed to load earlier messages', error);
+      }
+    }
+
     async function activateConversation(conversationId, options = {}) {
       if (!conversationId) {
         return;
@@ -580,6 +650,8 @@
       activeConversationId = conversationId;
       setActiveConversationHighlight(conversationId);
       if (options.initialMessages) {
+        loadedMessages = options.initialMessages;
+        messageCursor = null;
         renderMessages(options.initialMessages);
       } else if (!options.skipMessages) {
         await loadMessages(conversationId);
@@ -845,6 +917,14 @@
       wrapper.appendChild(list);
     }
 
+    function withPreviewSize(url, size) {
+      // Page previews are rendered at 2x; the API serves cached downscaled derivatives on request.
+      if (url.origin === global.location.origin && url.pathname.endsWith('/preview') && !url.searchParams.has('size')) {
+        url.searchParams.set('size', size);
+      }
+      return url;
+    }
+
     async function openPreviewResource(previewTarget, title) {
       if (!previewTarget) {
         return;
@@ -852,7 +932,7 @@
 
       let previewWindow = null;
       try {
-        const previewUrl = new URL(previewTarget, global.location.origin);
+        const previewUrl = withPreviewSize(new URL(previewTarget, global.location.origin), 'medium');
         const sameOrigin = previewUrl.origin === global.location.origin;
 
         if (!sameOrigin) {
@@ -939,7 +1019,7 @@
           }
           let absoluteUrl;
           try {
-            absoluteUrl = new URL(page.url, global.location.origin).toString();
+            absoluteUrl = withPreviewSize(new URL(page.url, global.location.origin), 'medium').toString();
           } catch (error) {
             absoluteUrl = page.url;
           }
@@ -1225,6 +1305,12 @@
         await deleteConversation(conversationId, listItem);
         return;
       }
+      const loadMoreButton = target instanceof HTMLElement ? target.closest('[data-load-more]') : null;
+      if (loadMoreButton) {
+        event.preventDefault();
+        await loadOlderConversations();
+        return;
+      }
       const button = target instanceof HTMLElement ? target.closest('button[data-id]') : null;
       if (!button) {
         return;
@@ -358,6 +358,7 @@
       body.append('collection', config.collection);
       body.append('chunk_size', String(config.chunk_size));
       body.append('chunk_overlap', String(config.chunk_overlap));
+      body.append('replace_existing', String(config.replace_existing));
       body.append(
         'metadata',
         JSON.stringify({ include_tables: config.include_tables, generate_citations: config.generate_citations })
@@ -414,6 +415,7 @@
         collection: collectionValue,
         include_tables: formData.get('include_tables') === 'on',
         generate_citations: formData.get('generate_citations') === 'on',
+        replace_existing: formData.get('replace_existing') === 'on',
       };
 
       resetPipeline();
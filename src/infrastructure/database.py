@@ -1,6 +1,8 @@
 """Database configuration and ORM models."""
 from __future__ import annotations
 
+import os
+import re
 from datetime import datetime
 from enum import Enum as PyEnum
 from typing import Any, Optional
@@ -8,9 +10,12 @@ from uuid import uuid4
 
 from sqlalchemy import (
     Boolean,
+    Column,
+    Computed,
     DateTime,
     Enum as SAEnum,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     MetaData,
@@ -19,8 +24,11 @@ from sqlalchemy import (
     UniqueConstraint,
     func,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.schema import CreateColumn
 
 from pgvector.sqlalchemy import Vector
 
@@ -45,6 +53,30 @@ NAMING_CONVENTION = {
 
 metadata = MetaData(naming_convention=NAMING_CONVENTION)
 
+# pgvector can only build HNSW/IVFFlat indexes for vectors of up to 2000 dimensions.
+ANN_INDEX_MAX_DIMENSION = 2000
+CHUNK_EMBEDDING_INDEX_NAME = "ix_chunks_embedding_ann"
+CHUNK_CONTENT_TSV_INDEX_NAME = "ix_chunks_content_tsv"
+
+
+def _text_search_config() -> str:
+    """Text search configuration of ``chunks.content_tsv``; read like the 20251103_chunk_fulltext migration."""
+
+    config = (os.getenv("VECTORSTORE__TEXT_SEARCH_CONFIG") or "simple").strip().lower()
+    if not re.fullmatch(r"[a-z_]+", config):
+        raise ValueError(f"Invalid text search configuration '{config}'.")
+    return config
+
+
+@compiles(CreateColumn)
+def _create_column(element: CreateColumn, compiler: Any, **kw: Any) -> str | None:
+    """Leave Postgres-only columns (``info={"postgresql_only": True}``) out of CREATE TABLE elsewhere."""
+
+    column = element.element
+    if column.info.get("postgresql_only") and compiler.dialect.name != "postgresql":
+        return None
+    return compiler.visit_create_column(element, **kw)
+
 
 class Base(DeclarativeBase):
     metadata = metadata
@@ -74,11 +106,12 @@ class Role(TimestampMixin, Base):
         nullable=False,
     )
 
+    # Reverse sides are never loaded implicitly: a role can have many users and collections.
     users: Mapped[list["User"]] = relationship(
-        secondary=lambda: UserRole.__table__, back_populates="roles", lazy="selectin"
+        secondary=lambda: UserRole.__table__, back_populates="roles", lazy="raise", passive_deletes=True
     )
     collections: Mapped[list["Collection"]] = relationship(
-        secondary=lambda: RoleCollection.__table__, back_populates="roles", lazy="selectin"
+        secondary=lambda: RoleCollection.__table__, back_populates="roles", lazy="raise", passive_deletes=True
     )
 
 
@@ -98,8 +131,9 @@ class User(TimestampMixin, Base):
     roles: Mapped[list[Role]] = relationship(
         secondary=lambda: UserRole.__table__, back_populates="users", lazy="selectin"
     )
+    # Loaded on every authenticated request, so chat history must be queried explicitly.
     conversations: Mapped[list["Conversation"]] = relationship(
-        back_populates="user", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="user", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
     )
 
 
@@ -128,7 +162,8 @@ class Collection(TimestampMixin, Base):
     )
     ingestion_jobs: Mapped[list["IngestionJob"]] = relationship(
         back_populates="collection",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
     )
 
 
@@ -147,14 +182,16 @@ class Conversation(TimestampMixin, Base):
     """Represents a user conversation/session."""
 
     __tablename__ = "conversations"
+    # Keyset pagination of a user's sessions, most recently active first.
+    __table_args__ = (Index("ix_conversations_user_id_updated_at", "user_id", "updated_at"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
     user_id: Mapped[str] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     title: Mapped[Optional[str]] = mapped_column(String(255))
 
-    user: Mapped[User] = relationship(back_populates="conversations", lazy="selectin")
+    user: Mapped[User] = relationship(back_populates="conversations", lazy="raise")
     messages: Mapped[list["Message"]] = relationship(
-        back_populates="conversation", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="conversation", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
     )
 
 
@@ -162,6 +199,7 @@ class Message(TimestampMixin, Base):
     """Messages exchanged in a conversation."""
 
     __tablename__ = "messages"
+    __table_args__ = (Index("ix_messages_conversation_id_created_at", "conversation_id", "created_at"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
     conversation_id: Mapped[str] = mapped_column(
@@ -171,17 +209,25 @@ class Message(TimestampMixin, Base):
     content: Mapped[str] = mapped_column(Text, nullable=False)
     context_json: Mapped[list[dict[str, Any]] | None] = mapped_column(JSON, nullable=True)
 
-    conversation: Mapped[Conversation] = relationship(back_populates="messages")
+    conversation: Mapped[Conversation] = relationship(back_populates="messages", lazy="raise")
 
 
 class Document(TimestampMixin, Base):
     """Stored document metadata."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        Index("ix_documents_source_key", "source_key"),
+        Index("ix_documents_docling_hash", "docling_hash"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     source_path: Mapped[str] = mapped_column(String(1024), nullable=False)
+    # Stable identity of the source across uploads (original filename, else path); used to replace versions.
+    source_key: Mapped[Optional[str]] = mapped_column(String(1024))
+    # SHA-256 of the source file; identical uploads can reuse an earlier document's chunks and vectors.
+    docling_hash: Mapped[Optional[str]] = mapped_column(String(64))
     ingestion_job_id: Mapped[Optional[str]] = mapped_column(
         ForeignKey("ingestion_jobs.id", ondelete="SET NULL"), nullable=True
     )
@@ -192,22 +238,123 @@ class Document(TimestampMixin, Base):
     )
 
 
+class DocumentPage(Base):
+    """Where the rendered image of one document page lives; lets previews skip loading chunks."""
+
+    __tablename__ = "document_pages"
+
+    document_id: Mapped[str] = mapped_column(ForeignKey("documents.id", ondelete="CASCADE"), primary_key=True)
+    page_number: Mapped[int] = mapped_column(Integer, primary_key=True)
+    image_path: Mapped[Optional[str]] = mapped_column(String(1024))
+    mimetype: Mapped[Optional[str]] = mapped_column(String(64))
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
+def _chunk_embedding_indexes() -> tuple[Index, ...]:
+    """Return the cosine ANN index for chunk embeddings when pgvector can build one.
+
+    Type and build parameters are read like the 20251030_chunk_embedding_index migration, so ``create_all``
+    and the migration declare the same index.
+    """
+
+    if EMBEDDING_DIMENSION > ANN_INDEX_MAX_DIMENSION:
+        return ()
+    index_type = (os.getenv("VECTORSTORE__INDEX_TYPE") or "hnsw").strip().lower()
+    if index_type == "hnsw":
+        options = {
+            "m": _env_int("VECTORSTORE__HNSW_M", 16),
+            "ef_construction": _env_int("VECTORSTORE__HNSW_EF_CONSTRUCTION", 64),
+        }
+    elif index_type == "ivfflat":
+        options = {"lists": _env_int("VECTORSTORE__IVFFLAT_LISTS", 100)}
+    else:
+        raise ValueError(f"Unsupported vector index type '{index_type}'. Expected 'hnsw' or 'ivfflat'.")
+    return (
+        Index(
+            CHUNK_EMBEDDING_INDEX_NAME,
+            "embedding",
+            postgresql_using=index_type,
+            postgresql_with=options,
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+    )
+
+
+def _chunk_fulltext_indexes() -> tuple[Index, ...]:
+    """Return the GIN index over ``content_tsv``, created only where the column exists."""
+
+    return (
+        Index(CHUNK_CONTENT_TSV_INDEX_NAME, "content_tsv", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+
+
 class Chunk(TimestampMixin, Base):
     """Document chunk metadata."""
 
     __tablename__ = "chunks"
+    __table_args__ = (
+        Index("ix_chunks_document_id_content_hash", "document_id", "content_hash"),
+        *_chunk_embedding_indexes(),
+        *_chunk_fulltext_indexes(),
+    )
+    # The ORM never reads or writes content_tsv; otherwise inserts would RETURN it on every dialect.
+    __mapper_args__ = {"exclude_properties": ["content_tsv"]}
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
     document_id: Mapped[str] = mapped_column(ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
+    # Denormalised from the owning ingestion job so collection-scoped searches filter without joins.
+    collection_id: Mapped[Optional[str]] = mapped_column(
+        ForeignKey("collections.id", ondelete="CASCADE"), nullable=True, index=True
+    )
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # SHA-256 of ``content``; lets re-ingestion of a revised document keep unchanged chunks and their vectors.
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64))
     vector_id: Mapped[Optional[str]] = mapped_column(String(255))
     embedding_model: Mapped[Optional[str]] = mapped_column(String(128))
     metadata_json: Mapped[dict[str, object] | None] = mapped_column(JSON)
     embedding: Mapped[Optional[list[float]]] = mapped_column(Vector(EMBEDDING_DIMENSION))
+    # Generated full-text vector for hybrid retrieval; a table column only, queried as ``CHUNK_CONTENT_TSV``.
+    content_tsv = Column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{_text_search_config()}'::regconfig, coalesce(content, ''))", persisted=True),
+        info={"postgresql_only": True},
+    )
 
     document: Mapped[Document] = relationship(back_populates="chunks")
 
 
+CHUNK_CONTENT_TSV = Chunk.__table__.c.content_tsv
+
+
+class AnswerCacheEntry(Base):
+    """Cached chat answer replayed for semantically equivalent questions."""
+
+    __tablename__ = "answer_cache"
+    __table_args__ = (Index("ix_answer_cache_scope_model_expires", "scope_key", "model_key", "expires_at"),)
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
+    # Hash of the sorted collection ids the answer was retrieved from ("*" when unscoped).
+    scope_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    model_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    query: Mapped[str] = mapped_column(Text, nullable=False)
+    query_embedding: Mapped[list[float]] = mapped_column(Vector(EMBEDDING_DIMENSION), nullable=False)
+    answer: Mapped[str] = mapped_column(Text, nullable=False)
+    context_json: Mapped[list[dict[str, Any]] | None] = mapped_column(JSON)
+    citations_json: Mapped[list[dict[str, Any]] | None] = mapped_column(JSON)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
 class IngestionStatus(str, PyEnum):
     pending = "pending"
     running = "running"
@@ -231,6 +378,8 @@ class IngestionJob(TimestampMixin, Base):
     chunk_size: Mapped[int] = mapped_column(Integer, default=1200, nullable=False)
     chunk_overlap: Mapped[int] = mapped_column(Integer, default=150, nullable=False)
     parameters: Mapped[dict[str, object] | None] = mapped_column(JSON)
+    # Computed by the server while an upload is written; never taken from client-supplied parameters.
+    source_sha256: Mapped[Optional[str]] = mapped_column(String(64))
 
     documents: Mapped[list[Document]] = relationship(backref="ingestion_job", lazy="selectin")
     collection: Mapped[Collection] = relationship(back_populates="ingestion_jobs", lazy="joined")
@@ -310,7 +459,9 @@ __all__ = [
     "Conversation",
     "Message",
     "Document",
+    "DocumentPage",
     "Chunk",
+    "AnswerCacheEntry",
     "IngestionJob",
     "IngestionStatus",
     "configure_engine",
@@ -1,14 +1,18 @@
 """Embedding client exports."""
 
 from .base import EMBEDDING_DIMENSION, EmbeddingClient
+from .cache import CachedEmbeddingClient
 from .factory import create_embedding_client
 from .local import LocalEmbeddingClient
 from .ollama import OllamaEmbeddingClient
+from .query_cache import QueryEmbeddingCache
 
 __all__ = [
     "EMBEDDING_DIMENSION",
     "EmbeddingClient",
+    "CachedEmbeddingClient",
     "create_embedding_client",
     "LocalEmbeddingClient",
     "OllamaEmbeddingClient",
+    "QueryEmbeddingCache",
 ]
@@ -0,0 +1,187 @@
+"""Content-addressed embedding cache backed by a local SQLite store."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from .base import EmbeddingClient
+
+LOGGER = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+# SQLite caps the number of bound parameters per statement; stay well below the default limit.
+_LOOKUP_BATCH = 500
+
+
+def normalise_text(text: str) -> str:
+    """Canonicalise text so trivially different chunk renderings share a cache entry."""
+
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def text_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of the normalised text."""
+
+    return hashlib.sha256(normalise_text(text).encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
+class EmbeddingCacheStats:
+    """Running hit/miss counters for a cached embedding client."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+class EmbeddingCacheStore:
+    """Thread-safe SQLite table of ``(model, text_hash) -> vector`` with LRU eviction."""
+
+    def __init__(self, path: Path, *, max_entries: int) -> None:
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS ix_embeddings_last_access ON embeddings (last_access)")
+        self._entries = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def get_many(self, model: str, hashes: Sequence[str]) -> dict[str, list[float]]:
+        """Return cached vectors for the given hashes and refresh their recency."""
+
+        found: dict[str, list[float]] = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._lock:
+            for offset in range(0, len(unique), _LOOKUP_BATCH):
+                batch = unique[offset : offset + _LOOKUP_BATCH]
+                placeholders = ",".join("?" for _ in batch)
+                rows = self._connection.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                    (model, *batch),
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+            if found:
+                now = time.time()
+                self._connection.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE model = ? AND text_hash = ?",
+                    [(now, model, key) for key in found],
+                )
+        return found
+
+    def put_many(self, model: str, items: Sequence[tuple[str, Sequence[float]]]) -> None:
+        """Store vectors and evict the least recently used entries beyond ``max_entries``."""
+
+        if not items:
+            return
+        now = time.time()
+        rows = [(model, key, array("f", vector).tobytes(), now) for key, vector in items]
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                before = self._connection.total_changes
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO embeddings (model, text_hash, vector, last_access) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._entries += self._connection.total_changes - before
+                overflow = self._entries - self.max_entries
+                if overflow > 0:
+                    self._connection.execute(
+                        "DELETE FROM embeddings WHERE rowid IN "
+                        "(SELECT rowid FROM embeddings ORDER BY last_access LIMIT ?)",
+                        (overflow,),
+                    )
+                    self._entries -= overflow
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+
+
+@lru_cache(maxsize=None)
+def get_embedding_cache_store(path: Path, max_entries: int) -> EmbeddingCacheStore:
+    """Return the process-wide store for ``path`` so connections are shared between clients."""
+
+    return EmbeddingCacheStore(path, max_entries=max_entries)
+
+
+class CachedEmbeddingClient(EmbeddingClient):
+    """Wrap an embedding client and serve repeated texts from the on-disk cache."""
+
+    def __init__(self, inner: EmbeddingClient, store: EmbeddingCacheStore) -> None:
+        self.inner = inner
+        self.store = store
+        self.model_name = inner.model_name
+        self.stats = EmbeddingCacheStats()
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        hashes = [text_hash(text) for text in texts]
+        try:
+            cached = await loop.run_in_executor(None, self.store.get_many, self.model_name, hashes)
+        except sqlite3.Error as exc:
+            LOGGER.warning("Embedding cache lookup failed; embedding without cache: %s", exc)
+            cached = {}
+
+        missing: dict[str, str] = {}
+        miss_count = 0
+        for key, text in zip(hashes, texts, strict=True):
+            if key in cached:
+                continue
+            miss_count += 1
+            missing.setdefault(key, text)
+        self.stats.hits += len(texts) - miss_count
+        self.stats.misses += miss_count
+
+        if missing:
+            vectors = await self.inner.embed(list(missing.values()))
+            fresh = dict(zip(missing.keys(), vectors, strict=True))
+            cached.update(fresh)
+            try:
+                await loop.run_in_executor(None, self.store.put_many, self.model_name, list(fresh.items()))
+            except sqlite3.Error as exc:
+                LOGGER.warning("Embedding cache write failed: %s", exc)
+        LOGGER.debug(
+            "Embedding cache | model=%s texts=%d hits=%d misses=%d",
+            self.model_name,
+            len(texts),
+            len(texts) - miss_count,
+            miss_count,
+        )
+        return [list(cached[key]) for key in hashes]
+
+
+__all__ = [
+    "CachedEmbeddingClient",
+    "EmbeddingCacheStats",
+    "EmbeddingCacheStore",
+    "get_embedding_cache_store",
+    "normalise_text",
+    "text_hash",
+]
@@ -5,6 +5,7 @@ import logging
 
 from ...config import Settings
 from .base import EmbeddingClient
+from .cache import CachedEmbeddingClient, get_embedding_cache_store
 from .constants import (
     DEFAULT_OLLAMA_EMBEDDING_MODEL,
     SUPPORTED_OLLAMA_EMBEDDING_MODELS,
@@ -30,13 +31,20 @@ def create_embedding_client(settings: Settings) -> EmbeddingClient:
             )
             model_name = DEFAULT_OLLAMA_EMBEDDING_MODEL
             normalised_model = model_name
-        return OllamaEmbeddingClient(
+        client: EmbeddingClient = OllamaEmbeddingClient(
             host=settings.llm.ollama_host,
             model_name=model_name,
             request_timeout=settings.llm.request_timeout,
             binary_path=settings.llm.ollama_binary,
             dimension=embedding_dimension_for_model(normalised_model),
+            batch_size=settings.llm.embedding_batch_size,
+            max_concurrency=settings.llm.embedding_concurrency,
         )
+        cache_settings = settings.embedding_cache
+        if cache_settings.enabled:
+            store = get_embedding_cache_store(cache_settings.path, cache_settings.max_entries)
+            client = CachedEmbeddingClient(client, store)
+        return client
     return LocalEmbeddingClient(dimension=embedding_dimension_for_model(model_name))
 
 
@@ -36,6 +36,10 @@ def _normalise_dimension(vector: Sequence[float], dimension: int) -> list[float]
     return values + [0.0] * (dimension - current)
 
 
+def _is_context_length_error(exc: Exception) -> bool:
+    return "context length" in str(exc).lower()
+
+
 class OllamaEmbeddingClient(EmbeddingClient):
     """Generate embeddings via an Ollama server."""
 
@@ -50,11 +54,15 @@ class OllamaEmbeddingClient(EmbeddingClient):
         request_timeout: int,
         binary_path: str,
         dimension: int = EMBEDDING_DIMENSION,
+        batch_size: int = 32,
+        max_concurrency: int = 4,
     ) -> None:
         self._host = host.rstrip("/")
         self.model_name = model_name
         self._timeout = request_timeout
         self._dimension = dimension
+        self._batch_size = max(1, batch_size)
+        self._max_concurrency = max(1, max_concurrency)
         self._binary_path = binary_path
         self._client: AsyncClient | None = None
         self._server_lock: asyncio.Lock | None = None
@@ -122,26 +130,74 @@ class OllamaEmbeddingClient(EmbeddingClient):
             raise RuntimeError("Failed to launch the Ollama server process.") from exc
 
     async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        if not texts:
+            return []
         client = await self._ensure_client()
-        embeddings: list[list[float]] = []
-        for text in texts:
-            try:
-                response = await client.embeddings(model=self.model_name, prompt=text)
-            except Exception as exc:  # noqa: BLE001
-                message = str(exc)
-                if "context length" in message.lower():
-                    approx_words = len(text.split())
-                    raise RuntimeError(
-                        "Ollama embeddings rejected a chunk because it exceeds the model context window. "
-                        f"Approximate word count: {approx_words}. Consider reducing the ingestion chunk size "
-                        "or splitting large documents before ingestion."
-                    ) from exc
+        batches = [
+            list(texts[offset : offset + self._batch_size]) for offset in range(0, len(texts), self._batch_size)
+        ]
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _run(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self._embed_batch(client, batch)
+
+        results = await asyncio.gather(*(_run(batch) for batch in batches))
+        LOGGER.debug(
+            "Embedded %d texts in %d batches | model=%s batch_size=%d concurrency=%d",
+            len(texts),
+            len(batches),
+            self.model_name,
+            self._batch_size,
+            self._max_concurrency,
+        )
+        return [vector for batch in results for vector in batch]
+
+    async def _embed_batch(self, client: AsyncClient, batch: list[str]) -> list[list[float]]:
+        """Embed one batch via ``/api/embed``, retrying item by item on context-length errors."""
+
+        try:
+            response = await client.embed(model=self.model_name, input=batch)
+        except Exception as exc:  # noqa: BLE001
+            if not _is_context_length_error(exc) or len(batch) == 1:
+                if _is_context_length_error(exc):
+                    raise self._context_length_error(batch[0]) from exc
                 raise
-            vector = response.get("embedding")
+            LOGGER.info(
+                "Ollama rejected a batch of %d texts for context length; retrying individually",
+                len(batch),
+            )
+            return [await self._embed_single(client, text) for text in batch]
+        return self._parse_embeddings(response, expected=len(batch))
+
+    async def _embed_single(self, client: AsyncClient, text: str) -> list[float]:
+        try:
+            response = await client.embed(model=self.model_name, input=[text])
+        except Exception as exc:  # noqa: BLE001
+            if _is_context_length_error(exc):
+                raise self._context_length_error(text) from exc
+            raise
+        return self._parse_embeddings(response, expected=1)[0]
+
+    def _parse_embeddings(self, response: Any, *, expected: int) -> list[list[float]]:
+        vectors = response.get("embeddings")
+        if not isinstance(vectors, Sequence) or len(vectors) != expected:
+            raise RuntimeError("Unexpected response format from Ollama embeddings endpoint")
+        parsed: list[list[float]] = []
+        for vector in vectors:
             if not isinstance(vector, Sequence):
                 raise RuntimeError("Unexpected response format from Ollama embeddings endpoint")
-            embeddings.append(_normalise_dimension(vector, self._dimension))
-        return embeddings
+            parsed.append(_normalise_dimension(vector, self._dimension))
+        return parsed
+
+    @staticmethod
+    def _context_length_error(text: str) -> RuntimeError:
+        approx_words = len(text.split())
+        return RuntimeError(
+            "Ollama embeddings rejected a chunk because it exceeds the model context window. "
+            f"Approximate word count: {approx_words}. Consider reducing the ingestion chunk size "
+            "or splitting large documents before ingestion."
+        )
 
 
 __all__ = ["OllamaEmbeddingClient"]
@@ -0,0 +1,69 @@
+"""In-process LRU/TTL cache for query embeddings shared across requests."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from .base import EmbeddingClient
+from .cache import EmbeddingCacheStats, normalise_text
+
+
+class QueryEmbeddingCache:
+    """Bounded map of ``(model, normalised query) -> vector`` with per-entry expiry."""
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.stats = EmbeddingCacheStats()
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.stats.hits + self.stats.misses
+        return self.stats.hits / total if total else 0.0
+
+    def get(self, model: str, query: str) -> list[float] | None:
+        key = (model, normalise_text(query))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return list(entry[1])
+
+    def put(self, model: str, query: str, vector: list[float]) -> None:
+        key = (model, normalise_text(query))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, list(vector))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def embed(self, embedder: EmbeddingClient, query: str) -> tuple[list[float], bool]:
+        """Return the query vector and whether it came from the cache."""
+
+        model = getattr(embedder, "model_name", "")
+        cached = self.get(model, query)
+        if cached is not None:
+            return cached, True
+        vector = list((await embedder.embed([query]))[0])
+        self.put(model, query, vector)
+        return vector, False
+
+
+@lru_cache(maxsize=None)
+def get_query_embedding_cache(max_entries: int, ttl_seconds: float) -> QueryEmbeddingCache:
+    """Return the process-wide cache so per-request vector stores share entries."""
+
+    return QueryEmbeddingCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+
+__all__ = ["QueryEmbeddingCache", "get_query_embedding_cache"]
@@ -0,0 +1,64 @@
+"""Process-wide pooled HTTP client shared by the LLM backends."""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+
+import httpx
+
+from ...config import LLMSettings
+
+LOGGER = logging.getLogger(__name__)
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(settings: LLMSettings) -> httpx.AsyncClient:
+    """Build a keep-alive client configured from ``LLMSettings``."""
+
+    http2 = settings.http2 and _http2_available()
+    if settings.http2 and not http2:
+        LOGGER.debug("HTTP/2 requested for LLM client but the 'h2' package is not installed; using HTTP/1.1")
+    limits = httpx.Limits(
+        max_connections=settings.max_connections,
+        max_keepalive_connections=settings.max_keepalive_connections,
+        keepalive_expiry=settings.keepalive_expiry,
+    )
+    timeout = httpx.Timeout(settings.request_timeout, read=None)
+    return httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout)
+
+
+def get_http_client(settings: LLMSettings) -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use in the running event loop."""
+
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        # Connections are bound to the loop that opened them, so a new loop needs a new pool.
+        _client = create_http_client(settings)
+        _client_loop = loop
+        LOGGER.info(
+            "Created shared LLM HTTP client | http2=%s max_connections=%d keepalive=%d",
+            settings.http2 and _http2_available(),
+            settings.max_connections,
+            settings.max_keepalive_connections,
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client; called from the application shutdown hook."""
+
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+__all__ = ["close_http_client", "create_http_client", "get_http_client"]
@@ -11,6 +11,7 @@ import httpx
 
 from ...config import Settings
 from .base import LLMClient
+from .http import get_http_client
 
 _SYSTEM_PROMPT = (
     "You are a retrieval-augmented assistant. When context is provided, ground every factual statement in the "
@@ -24,8 +25,9 @@ LOGGER = logging.getLogger(__name__)
 class OllamaClient(LLMClient):
     """Stream completions from an Ollama server."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, *, http_client: httpx.AsyncClient | None = None) -> None:
         self._settings = settings
+        self._http_client = http_client
         self._host = settings.llm.ollama_host.rstrip("/")
         self._model = settings.llm.ollama_model
         self._timeout = settings.llm.request_timeout
@@ -33,9 +35,10 @@ class OllamaClient(LLMClient):
     async def generate(self, prompt: str, *, context: Sequence[str] | None = None) -> AsyncGenerator[str, None]:
         """Generate a completion using the configured Ollama model."""
 
+        full_prompt = self._build_prompt(prompt, context)
         payload = {
             "model": self._model,
-            "prompt": self._build_prompt(prompt, context),
+            "prompt": full_prompt,
             "stream": True,
             "options": {
                 "temperature": 0.1,
@@ -48,26 +51,26 @@ class OllamaClient(LLMClient):
             "Ollama request started | model=%s context_chunks=%d prompt_chars=%d",
             self._model,
             len(context or []),
-            len(prompt),
+            len(full_prompt),
         )
         start_time = perf_counter()
         chunk_count = 0
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                async with client.stream("POST", url, json=payload) as response:
-                    response.raise_for_status()
-                    async for line in response.aiter_lines():
-                        if not line:
-                            continue
-                        chunk = self._parse_chunk(line)
-                        if chunk:
-                            chunk_count += 1
-                            LOGGER.debug(
-                                "Ollama streamed chunk | model=%s length=%d",
-                                self._model,
-                                len(chunk),
-                            )
-                            yield chunk
+            client = self._http_client or get_http_client(self._settings.llm)
+            async with client.stream("POST", url, json=payload, timeout=timeout) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = self._parse_chunk(line)
+                    if chunk:
+                        chunk_count += 1
+                        LOGGER.debug(
+                            "Ollama streamed chunk | model=%s length=%d",
+                            self._model,
+                            len(chunk),
+                        )
+                        yield chunk
         except httpx.HTTPStatusError as exc:
             raise RuntimeError(
                 f"Ollama generation failed with status {exc.response.status_code}: {exc.response.text}"
@@ -10,6 +10,7 @@ import httpx
 
 from ...config import Settings
 from .base import LLMClient
+from .http import get_http_client
 
 _SYSTEM_PROMPT = (
     "You are a retrieval-augmented assistant. Use the provided context snippets to answer questions and include "
@@ -23,8 +24,9 @@ LOGGER = logging.getLogger(__name__)
 class VLLMClient(LLMClient):
     """Interact with a vLLM server that exposes the OpenAI-compatible API."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, *, http_client: httpx.AsyncClient | None = None) -> None:
         self._settings = settings
+        self._http_client = http_client
         self._host = settings.llm.vllm_host.rstrip("/")
         self._model = settings.llm.vllm_model
         self._timeout = settings.llm.request_timeout
@@ -49,26 +51,26 @@ class VLLMClient(LLMClient):
             "vLLM request started | model=%s context_chunks=%d prompt_chars=%d",
             self._model,
             len(context or []),
-            len(prompt),
+            sum(len(message["content"]) for message in messages),
         )
         start_time = perf_counter()
         chunk_count = 0
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                async with client.stream("POST", url, json=payload) as response:
-                    response.raise_for_status()
-                    async for line in response.aiter_lines():
-                        if not line:
-                            continue
-                        chunk = self._parse_line(line)
-                        if chunk:
-                            chunk_count += 1
-                            LOGGER.debug(
-                                "vLLM streamed chunk | model=%s length=%d",
-                                self._model,
-                                len(chunk),
-                            )
-                            yield chunk
+            client = self._http_client or get_http_client(self._settings.llm)
+            async with client.stream("POST", url, json=payload, timeout=timeout) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = self._parse_line(line)
+                    if chunk:
+                        chunk_count += 1
+                        LOGGER.debug(
+                            "vLLM streamed chunk | model=%s length=%d",
+                            self._model,
+                            len(chunk),
+                        )
+                        yield chunk
         except httpx.HTTPStatusError as exc:
             raise RuntimeError(
                 f"vLLM generation failed with status {exc.response.status_code}: {exc.response.text}"
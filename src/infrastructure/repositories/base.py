@@ -41,6 +41,9 @@ class AsyncRepository(Generic[ModelT]):
     async def commit(self) -> None:
         await self.session.commit()
 
+    async def rollback(self) -> None:
+        await self.session.rollback()
+
     async def filter_by(self, **filters: object) -> Sequence[ModelT]:
         stmt = select(self.model)
         for key, value in filters.items():
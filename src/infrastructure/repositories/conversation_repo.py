@@ -1,10 +1,12 @@
 """Conversation repository implementation."""
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from ..database import Conversation, Message
 from .base import AsyncRepository
@@ -33,19 +35,66 @@ class ConversationRepository(AsyncRepository[Conversation]):
         *,
         context: list[dict[str, object]] | None = None,
     ) -> Message:
+        # Stamp client-side with microseconds so messages of one conversation have a strict order
+        # for keyset pagination, and mark the conversation as recently active.
+        now = datetime.now(timezone.utc)
         message = Message(
             conversation_id=conversation_id,
             role=role,
             content=content,
             context_json=context,
+            created_at=now,
+            updated_at=now,
         )
         self.session.add(message)
+        await self.session.execute(
+            update(Conversation).where(Conversation.id == conversation_id).values(updated_at=now)
+        )
         await self.session.flush()
         await self.session.refresh(message)
         return message
 
-    async def list_messages(self, conversation_id: str) -> list[Message]:
-        stmt = select(Message).where(Message.conversation_id == conversation_id).order_by(Message.created_at)
+    async def list_conversations(
+        self,
+        user_id: str,
+        *,
+        limit: int,
+        before: tuple[datetime, str] | None = None,
+    ) -> list[Conversation]:
+        """Return up to ``limit`` conversations, most recently active first, older than ``before``."""
+
+        stmt = (
+            select(Conversation)
+            .where(Conversation.user_id == user_id)
+            .order_by(Conversation.updated_at.desc(), Conversation.id.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            stmt = stmt.where(tuple_(Conversation.updated_at, Conversation.id) < before)
+        result = await self.session.execute(stmt)
+        return list(result.scalars())
+
+    async def list_messages(
+        self,
+        conversation_id: str,
+        *,
+        limit: int | None = None,
+        before: tuple[datetime, str] | None = None,
+        include_context: bool = True,
+    ) -> list[Message]:
+        """Return the newest ``limit`` messages older than ``before``, newest first."""
+
+        stmt = (
+            select(Message)
+            .where(Message.conversation_id == conversation_id)
+            .order_by(Message.created_at.desc(), Message.id.desc())
+        )
+        if before is not None:
+            stmt = stmt.where(tuple_(Message.created_at, Message.id) < before)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if not include_context:
+            stmt = stmt.options(defer(Message.context_json, raiseload=True))
         result = await self.session.execute(stmt)
         return list(result.scalars())
 
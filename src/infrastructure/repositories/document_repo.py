@@ -2,16 +2,21 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from uuid import uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import String, cast, delete, exists, func, insert, literal, select, type_coerce, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from ..database import (
     Chunk,
     Collection,
     Document,
+    DocumentPage,
     IngestionEvent,
     IngestionEventStatus,
     IngestionJob,
@@ -19,9 +24,43 @@ from ..database import (
     IngestionStep,
     Role,
     RoleCategory,
+    RoleCollection,
 )
 from .base import AsyncRepository
 
+# Postgres NOTIFY channel that wakes ingestion workers when a job becomes pending.
+INGESTION_JOB_CHANNEL = "ingestion_jobs"
+
+
+def _retarget_chunk_metadata(
+    metadata: dict[str, object] | None,
+    *,
+    source_id: str,
+    target_id: str,
+    job_id: str,
+    overrides: dict[str, object],
+) -> dict[str, object]:
+    """Point copied chunk metadata at its new document and job; other values are left as they are."""
+
+    source_prefix = f"/ingestion/documents/{source_id}/"
+    target_prefix = f"/ingestion/documents/{target_id}/"
+
+    def preview_url(entry: dict[str, object]) -> dict[str, object]:
+        url = entry.get("image_url")
+        if isinstance(url, str) and url.startswith(source_prefix):
+            return {**entry, "image_url": target_prefix + url[len(source_prefix) :]}
+        return dict(entry)
+
+    result: dict[str, object] = {**(metadata or {}), "document_id": target_id, "ingestion_job_id": job_id}
+    citation = result.get("citation")
+    if isinstance(citation, dict):
+        citation = preview_url(citation)
+        pages = citation.get("pages")
+        if isinstance(pages, list):
+            citation["pages"] = [preview_url(page) if isinstance(page, dict) else page for page in pages]
+        result["citation"] = citation
+    return {**result, **overrides}
+
 
 class DocumentRepository(AsyncRepository[Document]):
     """CRUD operations for documents and chunks."""
@@ -39,10 +78,13 @@ class DocumentRepository(AsyncRepository[Document]):
         collection_name: str,
         metadata: dict[str, object] | None = None,
         job: IngestionJob | None = None,
+        source_key: str | None = None,
     ) -> Document:
         document = Document(
             title=title,
             source_path=source_path,
+            source_key=source_key or source_path,
+            docling_hash=self._docling_hash(metadata),
             ingestion_job_id=job.id if job else None,
             metadata_json=self._build_document_metadata(metadata, collection_name, job),
         )
@@ -51,6 +93,223 @@ class DocumentRepository(AsyncRepository[Document]):
         await self.session.refresh(document)
         return document
 
+    async def find_document_by_source_key(self, collection_id: str, source_key: str) -> Document | None:
+        """Return the newest document ingested into ``collection_id`` from ``source_key``, without its chunks."""
+
+        stmt = (
+            select(Document)
+            .options(noload(Document.chunks))
+            .join(IngestionJob, IngestionJob.id == Document.ingestion_job_id)
+            .where(IngestionJob.collection_id == collection_id, Document.source_key == source_key)
+            .order_by(Document.updated_at.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
+    async def replace_document(
+        self,
+        document: Document,
+        *,
+        title: str,
+        source_path: str,
+        collection_name: str,
+        metadata: dict[str, object] | None = None,
+        job: IngestionJob | None = None,
+    ) -> None:
+        """Point an existing document at a new version of its source; chunks are handled separately."""
+
+        document.title = title
+        document.source_path = source_path
+        document.docling_hash = self._docling_hash(metadata)
+        document.ingestion_job_id = job.id if job else None
+        document.metadata_json = self._build_document_metadata(metadata, collection_name, job)
+        await self.session.flush()
+
+    async def find_clone_source(
+        self, *, docling_hash: str, chunk_size: int, chunk_overlap: int, embedding_model: str | None
+    ) -> Document | None:
+        """Return a completed document of the same file, chunked the same way and embedded by the same model."""
+
+        has_chunks = exists().where(Chunk.document_id == Document.id)
+        has_foreign_chunks = exists().where(
+            Chunk.document_id == Document.id,
+            (Chunk.embedding_model.is_distinct_from(embedding_model)) | Chunk.embedding.is_(None),
+        )
+        stmt = (
+            select(Document)
+            .options(noload(Document.chunks))
+            .join(IngestionJob, IngestionJob.id == Document.ingestion_job_id)
+            .where(
+                Document.docling_hash == docling_hash,
+                IngestionJob.status == IngestionStatus.success,
+                IngestionJob.chunk_size == chunk_size,
+                IngestionJob.chunk_overlap == chunk_overlap,
+                has_chunks,
+                ~has_foreign_chunks,
+            )
+            .order_by(Document.created_at.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
+    async def clone_chunks(
+        self,
+        source: Document,
+        target: Document,
+        *,
+        collection_id: str | None,
+        job: IngestionJob,
+        metadata_overrides: dict[str, object],
+    ) -> int:
+        """Copy ``source``'s chunks, vectors included, onto ``target`` and return how many were copied.
+
+        The document and job ids and the preview URLs in the metadata are pointed at ``target`` and
+        ``metadata_overrides`` replaces top-level keys such as the source path. On Postgres the rows are
+        copied with one INSERT .. SELECT; elsewhere they are copied through Python.
+        """
+
+        def retarget(metadata: dict[str, object] | None) -> dict[str, object]:
+            return _retarget_chunk_metadata(
+                metadata, source_id=source.id, target_id=target.id, job_id=job.id, overrides=metadata_overrides
+            )
+
+        if self.session.get_bind().dialect.name != "postgresql":
+            rows = (
+                await self.session.execute(
+                    select(
+                        Chunk.content, Chunk.content_hash, Chunk.embedding_model, Chunk.embedding, Chunk.metadata_json
+                    ).where(Chunk.document_id == source.id)
+                )
+            ).all()
+            await self.add_chunks_bulk(
+                document_id=target.id,
+                collection_id=collection_id,
+                contents=[row.content for row in rows],
+                embeddings=[row.embedding for row in rows],
+                metadata=[retarget(row.metadata_json) for row in rows],
+                embedding_model=rows[0].embedding_model if rows else None,
+                content_hashes=[row.content_hash for row in rows],
+            )
+            return len(rows)
+
+        columns = [
+            "id",
+            "document_id",
+            "collection_id",
+            "content",
+            "content_hash",
+            "vector_id",
+            "embedding_model",
+            "metadata_json",
+            "embedding",
+        ]
+        source_rows = select(
+            cast(func.gen_random_uuid(), String),
+            literal(target.id),
+            type_coerce(literal(collection_id), String),
+            Chunk.content,
+            Chunk.content_hash,
+            Chunk.vector_id,
+            Chunk.embedding_model,
+            Chunk.metadata_json,
+            Chunk.embedding,
+        ).where(Chunk.document_id == source.id)
+        copied = (
+            await self.session.execute(
+                insert(Chunk).from_select(columns, source_rows).returning(Chunk.id, Chunk.metadata_json)
+            )
+        ).all()
+        # Vectors are copied in SQL; only the small metadata documents are rewritten here.
+        await self.update_chunk_metadata([(row.id, retarget(row.metadata_json)) for row in copied])
+        return len(copied)
+
+    async def list_chunk_fingerprints(self, document_id: str) -> list[tuple[str, str | None, str | None]]:
+        """Return ``(id, content_hash, embedding_model)`` for every embedded chunk of a document."""
+
+        stmt = select(Chunk.id, Chunk.content_hash, Chunk.embedding_model).where(
+            Chunk.document_id == document_id, Chunk.embedding.isnot(None)
+        )
+        result = await self.session.execute(stmt)
+        return [(row[0], row[1], row[2]) for row in result]
+
+    async def list_chunk_metadata(self, document_id: str) -> list[dict[str, object]]:
+        """Return the metadata of every chunk of a document, in chunk order."""
+
+        stmt = select(Chunk.metadata_json).where(Chunk.document_id == document_id)
+        result = await self.session.execute(stmt)
+        metadata = [dict(row[0] or {}) for row in result]
+        metadata.sort(key=lambda item: item.get("chunk_index") if isinstance(item.get("chunk_index"), int) else 0)
+        return metadata
+
+    async def update_chunk_metadata(
+        self, updates: Sequence[tuple[str, dict[str, object]]], *, collection_id: str | None = None
+    ) -> None:
+        """Rewrite metadata of kept chunks with one executemany UPDATE; content and vectors stay untouched."""
+
+        if not updates:
+            return
+        rows: list[dict[str, object]] = []
+        for chunk_id, metadata in updates:
+            row: dict[str, object] = {"id": chunk_id, "metadata_json": metadata}
+            if collection_id is not None:
+                row["collection_id"] = collection_id
+            rows.append(row)
+        await self.session.execute(update(Chunk), rows)
+
+    async def delete_chunks(self, chunk_ids: Sequence[str]) -> None:
+        if not chunk_ids:
+            return
+        await self.session.execute(delete(Chunk).where(Chunk.id.in_(list(chunk_ids))))
+
+    async def set_document_pages(
+        self, document_id: str, pages: Sequence[tuple[int, str | None, str | None]]
+    ) -> None:
+        """Replace the ``(page_number, image_path, mimetype)`` rows of a document with one multi-row INSERT."""
+
+        await self.session.execute(delete(DocumentPage).where(DocumentPage.document_id == document_id))
+        if not pages:
+            return
+        await self.session.execute(
+            insert(DocumentPage),
+            [
+                {"document_id": document_id, "page_number": number, "image_path": image_path, "mimetype": mimetype}
+                for number, image_path, mimetype in pages
+            ],
+        )
+
+    async def get_page_preview(self, document_id: str, page_number: int) -> Row[Any] | None:
+        """Return what a page preview needs in one indexed lookup, without loading the document's chunks.
+
+        The row has ``metadata``, ``docling_hash``, ``collection_id``, ``image_path`` and ``mimetype``;
+        the page columns are ``None`` when the page was not recorded at ingestion.
+        """
+
+        stmt = (
+            select(
+                Document.metadata_json.label("metadata"),
+                Document.docling_hash,
+                IngestionJob.collection_id,
+                DocumentPage.image_path,
+                DocumentPage.mimetype,
+            )
+            .select_from(Document)
+            .outerjoin(IngestionJob, IngestionJob.id == Document.ingestion_job_id)
+            .outerjoin(
+                DocumentPage,
+                (DocumentPage.document_id == Document.id) & (DocumentPage.page_number == page_number),
+            )
+            .where(Document.id == document_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.one_or_none()
+
+    @staticmethod
+    def _docling_hash(metadata: dict[str, object] | None) -> str | None:
+        value = (metadata or {}).get("docling_hash")
+        return value if isinstance(value, str) and value else None
+
     @staticmethod
     def _build_document_metadata(
         metadata: dict[str, object] | None,
@@ -71,6 +330,7 @@ class DocumentRepository(AsyncRepository[Document]):
         *,
         document_id: str,
         content: str,
+        collection_id: str | None = None,
         vector_id: str | None = None,
         embedding_model: str | None = None,
         embedding: Sequence[float] | None = None,
@@ -78,6 +338,7 @@ class DocumentRepository(AsyncRepository[Document]):
     ) -> Chunk:
         chunk = Chunk(
             document_id=document_id,
+            collection_id=collection_id,
             content=content,
             vector_id=vector_id,
             embedding_model=embedding_model,
@@ -89,6 +350,49 @@ class DocumentRepository(AsyncRepository[Document]):
         await self.session.refresh(chunk)
         return chunk
 
+    async def add_chunks_bulk(
+        self,
+        *,
+        document_id: str,
+        contents: Sequence[str],
+        embeddings: Sequence[Sequence[float] | None],
+        metadata: Sequence[dict[str, object] | None],
+        collection_id: str | None = None,
+        embedding_model: str | None = None,
+        content_hashes: Sequence[str] | None = None,
+    ) -> list[str]:
+        """Insert all chunks of a document in one batched INSERT and return their ids.
+
+        Unlike :meth:`add_chunk` no ORM objects are created, flushed or refreshed; ids are
+        generated client side so nothing has to be read back from the database.
+        """
+
+        if not (len(contents) == len(embeddings) == len(metadata)):
+            raise ValueError("contents, embeddings and metadata must have the same length")
+        if content_hashes is not None and len(content_hashes) != len(contents):
+            raise ValueError("content_hashes must match contents")
+        if not contents:
+            return []
+        chunk_ids = [str(uuid4()) for _ in contents]
+        hashes = content_hashes if content_hashes is not None else [None] * len(contents)
+        rows = [
+            {
+                "id": chunk_id,
+                "document_id": document_id,
+                "collection_id": collection_id,
+                "content": content,
+                "content_hash": content_hash,
+                "embedding_model": embedding_model,
+                "embedding": list(embedding) if embedding is not None else None,
+                "metadata_json": chunk_metadata,
+            }
+            for chunk_id, content, content_hash, embedding, chunk_metadata in zip(
+                chunk_ids, contents, hashes, embeddings, metadata, strict=True
+            )
+        ]
+        await self.session.execute(insert(Chunk), rows)
+        return chunk_ids
+
     async def list_documents_by_collection(self, collection_name: str) -> list[Document]:
         stmt = (
             select(Document)
@@ -113,18 +417,13 @@ class DocumentRepository(AsyncRepository[Document]):
         parameters: dict[str, object] | None = None,
         collection: Collection,
     ) -> IngestionJob:
-        normalised_parameters = None
-        if parameters:
-            normalised_parameters = {
-                str(key): value for key, value in parameters.items() if not str(key).startswith("_")
-            }
         job = IngestionJob(
             user_id=user_id,
             source=source,
             collection_id=collection.id,
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
-            parameters=normalised_parameters,
+            parameters=self._normalise_job_parameters(parameters),
         )
         self.session.add(job)
         await self.session.flush()
@@ -148,6 +447,96 @@ class DocumentRepository(AsyncRepository[Document]):
         await self.session.refresh(job)
         return job
 
+    async def create_ingestion_jobs_bulk(
+        self,
+        *,
+        user_id: str | None,
+        collection: Collection,
+        jobs: Sequence[tuple[str, int, int, dict[str, object] | None, str | None]],
+        pending_steps: Sequence[IngestionStep],
+    ) -> list[tuple[IngestionJob, list[IngestionEvent]]]:
+        """Insert ``(source, chunk_size, chunk_overlap, parameters, source_sha256)`` jobs and their pending events.
+
+        Like :meth:`add_chunks_bulk` this issues one batched INSERT per table. Ids and timestamps are
+        generated client side, so the returned (detached) jobs and events are complete without reading
+        anything back.
+        """
+
+        if not jobs:
+            return []
+        now = datetime.now(timezone.utc)
+        job_rows: list[dict[str, object]] = []
+        event_rows: list[dict[str, object]] = []
+        created: list[tuple[IngestionJob, list[IngestionEvent]]] = []
+        for source, chunk_size, chunk_overlap, parameters, source_sha256 in jobs:
+            job_row: dict[str, object] = {
+                "id": str(uuid4()),
+                "user_id": user_id,
+                "collection_id": collection.id,
+                "status": IngestionStatus.pending,
+                "source": source,
+                "chunk_size": chunk_size,
+                "chunk_overlap": chunk_overlap,
+                "parameters": self._normalise_job_parameters(parameters),
+                "source_sha256": source_sha256,
+                "created_at": now,
+                "updated_at": now,
+            }
+            job = IngestionJob(**job_row, error_message=None)
+            # Set without relationship events, so the detached job is not cascaded into the session.
+            set_committed_value(job, "collection", collection)
+            events: list[IngestionEvent] = []
+            for position, step in enumerate(pending_steps):
+                # Events are listed by created_at; distinct timestamps keep the step order.
+                created_at = now + timedelta(microseconds=position)
+                event_row: dict[str, object] = {
+                    "id": str(uuid4()),
+                    "job_id": job_row["id"],
+                    "document_path": source,
+                    "step": step,
+                    "status": IngestionEventStatus.pending,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+                event_rows.append(event_row)
+                events.append(
+                    IngestionEvent(**event_row, document_id=None, document_title=None, detail=None)
+                )
+            job_rows.append(job_row)
+            created.append((job, events))
+        await self.session.execute(insert(IngestionJob), job_rows)
+        if event_rows:
+            await self.session.execute(insert(IngestionEvent), event_rows)
+        return created
+
+    @staticmethod
+    def _normalise_job_parameters(parameters: dict[str, object] | None) -> dict[str, object] | None:
+        if not parameters:
+            return None
+        return {str(key): value for key, value in parameters.items() if not str(key).startswith("_")}
+
+    async def notify_job_pending(self, job_id: str) -> None:
+        """Queue a NOTIFY for workers; Postgres delivers it when the transaction commits."""
+
+        if self.session.get_bind().dialect.name != "postgresql":
+            return
+        await self.session.execute(select(func.pg_notify(INGESTION_JOB_CHANNEL, job_id)))
+
+    async def requeue_job(self, job_id: str) -> None:
+        """Discard partial results of an interrupted job and mark it pending again."""
+
+        document_ids = select(Document.id).where(Document.ingestion_job_id == job_id)
+        await self.session.execute(delete(IngestionEvent).where(IngestionEvent.job_id == job_id))
+        await self.session.execute(delete(Chunk).where(Chunk.document_id.in_(document_ids)))
+        await self.session.execute(delete(DocumentPage).where(DocumentPage.document_id.in_(document_ids)))
+        await self.session.execute(delete(Document).where(Document.ingestion_job_id == job_id))
+        await self.session.execute(
+            update(IngestionJob)
+            .where(IngestionJob.id == job_id)
+            .values(status=IngestionStatus.pending, error_message=None)
+        )
+        await self.notify_job_pending(job_id)
+
     async def get_job(self, job_id: str) -> Optional[IngestionJob]:
         stmt = (
             select(IngestionJob)
@@ -223,6 +612,20 @@ class DocumentRepository(AsyncRepository[Document]):
         result = await self.session.execute(stmt)
         return list(result.scalars())
 
+    async def list_collection_ids_for_roles(self, roles: Sequence[Role]) -> list[str]:
+        """Return ids of collections reachable through the given workspace roles."""
+
+        role_ids = [role.id for role in roles if role.category is RoleCategory.workspace]
+        if not role_ids:
+            return []
+        stmt = (
+            select(RoleCollection.collection_id)
+            .where(RoleCollection.role_id.in_(role_ids))
+            .distinct()
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars())
+
     async def list_job_events(self, job_id: str) -> list[IngestionEvent]:
         stmt = (
             select(IngestionEvent)
@@ -322,9 +725,19 @@ class DocumentRepository(AsyncRepository[Document]):
         result = await self.session.execute(stmt)
         return {row[0]: row[1] for row in result}
 
+    async def touch_collection(self, collection_id: str | None) -> None:
+        """Record that a collection's documents changed, invalidating cached chat answers."""
+
+        if collection_id is None:
+            return
+        await self.session.execute(
+            update(Collection).where(Collection.id == collection_id).values(updated_at=func.now())
+        )
+
     async def delete_job(self, job: IngestionJob) -> None:
         """Remove an ingestion job and any associated documents."""
 
+        await self.touch_collection(job.collection_id)
         for event in list(job.events or []):
             await self.session.delete(event)
         for document in list(job.documents or []):
@@ -332,4 +745,4 @@ class DocumentRepository(AsyncRepository[Document]):
         await self.session.delete(job)
 
 
-__all__ = ["DocumentRepository"]
+__all__ = ["DocumentRepository", "INGESTION_JOB_CHANNEL"]
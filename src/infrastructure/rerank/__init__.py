@@ -0,0 +1,9 @@
+"""Reranker exports."""
+
+from .base import Reranker
+from .factory import create_reranker
+from .local import LocalReranker
+from .ollama import OllamaReranker
+from .vllm import VLLMReranker
+
+__all__ = ["Reranker", "create_reranker", "LocalReranker", "OllamaReranker", "VLLMReranker"]
@@ -0,0 +1,18 @@
+"""Reranker base classes."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+
+class Reranker(ABC):
+    """Score query/passage pairs; higher scores mean more relevant."""
+
+    model_name: str
+
+    @abstractmethod
+    async def score(self, query: str, passages: Sequence[str]) -> list[float]:
+        """Return one relevance score per passage, in input order."""
+
+
+__all__ = ["Reranker"]
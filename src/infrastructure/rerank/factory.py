@@ -0,0 +1,24 @@
+"""Factory helpers for rerankers."""
+from __future__ import annotations
+
+from ...config import Settings
+from .base import Reranker
+from .local import LocalReranker
+from .ollama import OllamaReranker
+from .vllm import VLLMReranker
+
+
+def create_reranker(settings: Settings) -> Reranker | None:
+    """Create the configured reranker, or ``None`` when reranking is disabled."""
+
+    provider = settings.rerank.provider
+    if provider == "local":
+        return LocalReranker()
+    if provider == "vllm":
+        return VLLMReranker(settings)
+    if provider == "ollama":
+        return OllamaReranker(settings)
+    return None
+
+
+__all__ = ["create_reranker"]
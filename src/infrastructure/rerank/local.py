@@ -0,0 +1,29 @@
+"""Deterministic lexical reranker used for development and testing."""
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+
+from .base import Reranker
+
+_TOKEN = re.compile(r"\w+")
+
+
+class LocalReranker(Reranker):
+    """Score passages by the fraction of distinct query terms they contain."""
+
+    def __init__(self) -> None:
+        self.model_name = "local-term-overlap"
+
+    async def score(self, query: str, passages: Sequence[str]) -> list[float]:
+        terms = {token.lower() for token in _TOKEN.findall(query)}
+        if not terms:
+            return [0.0 for _ in passages]
+        scores = []
+        for passage in passages:
+            tokens = {token.lower() for token in _TOKEN.findall(passage)}
+            scores.append(len(terms & tokens) / len(terms))
+        return scores
+
+
+__all__ = ["LocalReranker"]
@@ -0,0 +1,73 @@
+"""Pointwise LLM relevance scoring through Ollama's generate API."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Sequence
+
+import httpx
+
+from ...config import Settings
+from ..llm.http import get_http_client
+from .base import Reranker
+
+LOGGER = logging.getLogger(__name__)
+
+_PROMPT = (
+    "Judge whether the passage answers the query. Reply with JSON {{\"score\": N}} where N is an integer "
+    "from 0 (irrelevant) to 10 (answers it fully).\n\nQuery: {query}\n\nPassage: {passage}"
+)
+
+
+class OllamaReranker(Reranker):
+    """Ask an Ollama model to grade each passage.
+
+    Ollama has no rerank endpoint, so passages are graded one per request; ``batch_size``
+    requests run at a time, bounded by ``max_concurrency`` for the whole reranker.
+    """
+
+    def __init__(self, settings: Settings, *, http_client: httpx.AsyncClient | None = None) -> None:
+        self._settings = settings
+        self._http_client = http_client
+        self._host = (settings.rerank.host or settings.llm.ollama_host).rstrip("/")
+        self.model_name = settings.rerank.model or settings.llm.ollama_model
+        self._batch_size = max(1, settings.rerank.batch_size)
+        self._semaphore = asyncio.Semaphore(max(1, settings.rerank.max_concurrency))
+
+    async def score(self, query: str, passages: Sequence[str]) -> list[float]:
+        scores: list[float] = []
+        for offset in range(0, len(passages), self._batch_size):
+            batch = passages[offset : offset + self._batch_size]
+            scores.extend(await asyncio.gather(*(self._score_one(query, passage) for passage in batch)))
+        return scores
+
+    async def _score_one(self, query: str, passage: str) -> float:
+        url = f"{self._host}/api/generate"
+        payload = {
+            "model": self.model_name,
+            "prompt": _PROMPT.format(query=query, passage=passage),
+            "format": "json",
+            "stream": False,
+            "options": {"temperature": 0.0, "num_predict": 16},
+        }
+        client = self._http_client or get_http_client(self._settings.llm)
+        async with self._semaphore:
+            try:
+                response = await client.post(url, json=payload, timeout=self._settings.llm.request_timeout)
+                response.raise_for_status()
+            except httpx.HTTPStatusError as exc:
+                raise RuntimeError(
+                    f"Ollama rerank failed with status {exc.response.status_code}: {exc.response.text}"
+                ) from exc
+            except httpx.HTTPError as exc:
+                raise RuntimeError(f"Failed to reach Ollama server at {url}: {exc}") from exc
+        try:
+            value = json.loads(response.json().get("response") or "{}").get("score", 0)
+            return max(0.0, min(10.0, float(value))) / 10.0
+        except (AttributeError, TypeError, ValueError):
+            LOGGER.debug("Unparseable rerank judgement from %s", self.model_name)
+            return 0.0
+
+
+__all__ = ["OllamaReranker"]
@@ -0,0 +1,55 @@
+"""Cross-encoder reranking through vLLM's ``/v1/rerank`` endpoint."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Sequence
+
+import httpx
+
+from ...config import Settings
+from ..llm.http import get_http_client
+from .base import Reranker
+
+LOGGER = logging.getLogger(__name__)
+
+
+class VLLMReranker(Reranker):
+    """Score passages with a reranker model served by vLLM (``vllm serve <model> --task score``)."""
+
+    def __init__(self, settings: Settings, *, http_client: httpx.AsyncClient | None = None) -> None:
+        self._settings = settings
+        self._http_client = http_client
+        self._host = (settings.rerank.host or settings.llm.vllm_host).rstrip("/")
+        self.model_name = settings.rerank.model
+        self._batch_size = max(1, settings.rerank.batch_size)
+        self._semaphore = asyncio.Semaphore(max(1, settings.rerank.max_concurrency))
+
+    async def score(self, query: str, passages: Sequence[str]) -> list[float]:
+        batches = [passages[offset : offset + self._batch_size] for offset in range(0, len(passages), self._batch_size)]
+        results = await asyncio.gather(*(self._score_batch(query, batch) for batch in batches))
+        return [score for batch in results for score in batch]
+
+    async def _score_batch(self, query: str, passages: Sequence[str]) -> list[float]:
+        url = f"{self._host}/v1/rerank"
+        payload = {"model": self.model_name, "query": query, "documents": list(passages)}
+        client = self._http_client or get_http_client(self._settings.llm)
+        async with self._semaphore:
+            try:
+                response = await client.post(url, json=payload, timeout=self._settings.llm.request_timeout)
+                response.raise_for_status()
+            except httpx.HTTPStatusError as exc:
+                raise RuntimeError(
+                    f"vLLM rerank failed with status {exc.response.status_code}: {exc.response.text}"
+                ) from exc
+            except httpx.HTTPError as exc:
+                raise RuntimeError(f"Failed to reach vLLM rerank endpoint at {url}: {exc}") from exc
+        scores = [0.0] * len(passages)
+        for item in response.json().get("results", []):
+            index = item.get("index")
+            if isinstance(index, int) and 0 <= index < len(scores):
+                scores[index] = float(item.get("relevance_score", 0.0))
+        return scores
+
+
+__all__ = ["VLLMReranker"]
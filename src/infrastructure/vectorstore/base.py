@@ -10,8 +10,32 @@ class VectorStoreClient(ABC):
     """Simple vector store abstraction."""
 
     @abstractmethod
-    async def similarity_search(self, query: str, *, k: int = 5) -> Sequence[Mapping[str, Any]]:
-        """Return top-k chunks with content and metadata for the query."""
+    async def similarity_search(
+        self,
+        query: str,
+        *,
+        k: int = 5,
+        collection_ids: Sequence[str] | None = None,
+    ) -> Sequence[Mapping[str, Any]]:
+        """Return top-k chunks with content and metadata for the query.
+
+        When ``collection_ids`` is provided only chunks from those collections are ranked;
+        an empty sequence therefore yields no results.
+        """
+
+    async def hybrid_search(
+        self,
+        query: str,
+        *,
+        k: int = 5,
+        collection_ids: Sequence[str] | None = None,
+    ) -> Sequence[Mapping[str, Any]]:
+        """Return top-k chunks ranked by lexical and vector relevance.
+
+        Stores without a lexical index fall back to :meth:`similarity_search`.
+        """
+
+        return await self.similarity_search(query, k=k, collection_ids=collection_ids)
 
 
 __all__ = ["VectorStoreClient"]
@@ -1,91 +1,304 @@
 """Vector store backed by PostgreSQL using pgvector."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Sequence
+import re
+from collections.abc import Callable, Sequence
 from time import perf_counter
 from typing import Any, Mapping
 
-from sqlalchemy import select
+from sqlalchemy import cast, func, literal, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...config import VectorStoreSettings
 from ..embeddings.base import EmbeddingClient
-from ..database import Chunk, Document
+from ..embeddings.query_cache import QueryEmbeddingCache
+from ..database import CHUNK_CONTENT_TSV, Chunk, Document
 from .base import VectorStoreClient
 
 LOGGER = logging.getLogger(__name__)
 
+# Identifiers such as "2016/679", "ISO-27001" or "Art.5" are kept whole as search terms.
+_SEARCH_TERM = re.compile(r"\w[\w./-]*\w|\w")
+# Alphabetic terms shorter than this carry no lexical signal; terms with digits are always kept.
+_MIN_WORD_LENGTH = 3
+# The default "simple" configuration keeps function words, and ORing them would match nearly every chunk.
+_STOPWORDS = frozenset(
+    """
+    about above after again all also and any are because been before being below between both but can could
+    did does doing down during each few for from further had has have having her here hers him his how into
+    its itself just more most not now off once only other our out over own same she should some such than
+    that the their them then there these they this those through too under until very was were what when
+    where which while who whom why will with would you your
+    aber alle als auch auf aus bei bis das dass dem den der des die dies diese dieser durch ein eine einem
+    einen einer eines für gibt hat ich ihr ist kann mit nach nicht noch oder sich sie sind über und unter
+    vom von wann war warum was welche welcher wenn wer wie wird wir zum zur
+    """.split()
+)
+
+
+def lexical_query_text(query: str) -> str:
+    """Turn a natural-language question into an OR query for ``websearch_to_tsquery``.
+
+    Stopwords and short words are dropped so chunks are ranked by the question's distinctive terms.
+    """
+
+    terms = (
+        term
+        for term in _SEARCH_TERM.findall(query)
+        if any(char.isdigit() for char in term)
+        or (len(term) >= _MIN_WORD_LENGTH and term.lower() not in _STOPWORDS)
+    )
+    return " or ".join(dict.fromkeys(terms))
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], *, k: int = 60) -> dict[str, float]:
+    """Fuse ranked id lists: each list contributes ``1 / (k + rank)`` for every id it contains."""
+
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    return scores
+
 
 class PGVectorStore(VectorStoreClient):
     """Execute similarity search queries against pgvector backed embeddings."""
 
-    def __init__(self, session: AsyncSession, embedder: EmbeddingClient) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        embedder: EmbeddingClient,
+        *,
+        settings: VectorStoreSettings | None = None,
+        query_cache: QueryEmbeddingCache | None = None,
+        session_factory: Callable[[], Any] | None = None,
+    ) -> None:
         self.session = session
         self.embedder = embedder
+        self.settings = settings or VectorStoreSettings()
+        self.query_cache = query_cache
+        # Hybrid search runs the lexical query on its own session so it can overlap the ANN query.
+        self.session_factory = session_factory
 
-    async def similarity_search(self, query: str, *, k: int = 5) -> Sequence[Mapping[str, Any]]:
-        overall_start = perf_counter()
-        embed_start = overall_start
-        query_vector = (await self.embedder.embed([query]))[0]
-        embed_time = perf_counter() - embed_start
+    async def _apply_search_parameters(self, *, k: int, filtered: bool = False) -> None:
+        """Set the ANN recall/latency knobs for the current transaction.
+
+        HNSW returns at most ``ef_search`` rows, so it is raised to ``k`` when more rows are requested.
+        """
+
+        if self.session.get_bind().dialect.name != "postgresql":
+            return
+        if self.settings.index_type == "ivfflat":
+            prefix, name, value = "ivfflat", "ivfflat.probes", self.settings.ivfflat_probes
+        else:
+            prefix, name, value = "hnsw", "hnsw.ef_search", max(self.settings.hnsw_ef_search, k)
+        await self.session.execute(select(func.set_config(name, str(value), True)))
+        if filtered and self.settings.iterative_scan != "off":
+            iterative_mode = self.settings.iterative_scan
+            if prefix == "ivfflat" and iterative_mode == "strict_order":
+                # IVFFlat only supports relaxed ordering for iterative scans.
+                iterative_mode = "relaxed_order"
+            await self.session.execute(select(func.set_config(f"{prefix}.iterative_scan", iterative_mode, True)))
+
+    async def _embed_query(self, query: str) -> tuple[list[float], bool]:
+        if self.query_cache is not None:
+            return await self.query_cache.embed(self.embedder, query)
+        return list((await self.embedder.embed([query]))[0]), False
+
+    @staticmethod
+    def _chunk_columns() -> tuple[Any, ...]:
+        return (
+            Chunk.id,
+            Chunk.document_id,
+            Chunk.content,
+            Chunk.metadata_json,
+            Document.title,
+            Document.metadata_json,
+        )
+
+    async def _vector_rows(
+        self, query_vector: Sequence[float], *, k: int, collection_ids: Sequence[str] | None
+    ) -> list[Row[Any]]:
+        await self._apply_search_parameters(k=k, filtered=collection_ids is not None)
+        rows = await self._vector_query(query_vector, k=k, collection_ids=collection_ids, exact=False)
+        if collection_ids is not None and len(rows) < k:
+            # The ANN index yields at most ef_search rows (or the rows of ``probes`` lists) before the
+            # collection filter, so small collections can come back short; rank them exactly instead.
+            LOGGER.info(
+                "PGVectorStore filtered ANN search returned %d of %d rows; using exact search", len(rows), k
+            )
+            rows = await self._vector_query(query_vector, k=k, collection_ids=collection_ids, exact=True)
+        return rows
+
+    async def _vector_query(
+        self, query_vector: Sequence[float], *, k: int, collection_ids: Sequence[str] | None, exact: bool
+    ) -> list[Row[Any]]:
         distance = Chunk.embedding.cosine_distance(query_vector).label("distance")
-        sql_start = perf_counter()
+        # The ANN index only serves ``ORDER BY embedding <=> :query``; ordering by an equivalent
+        # expression makes the planner filter by collection first and sort the matches exactly.
+        ordering = (distance + 0) if exact else distance
         stmt = (
-            select(
-                Chunk.id,
-                Chunk.document_id,
-                Chunk.content,
-                Chunk.metadata_json,
-                Document.title,
-                Document.metadata_json,
-                distance,
-            )
+            select(*self._chunk_columns(), distance)
             .join(Document, Document.id == Chunk.document_id)
             .where(Chunk.embedding.isnot(None))
-            .order_by(distance)
+            .order_by(ordering)
             .limit(k)
         )
+        if collection_ids is not None:
+            stmt = stmt.where(Chunk.collection_id.in_(list(collection_ids)))
         result = await self.session.execute(stmt)
-        rows = result.all()
+        return list(result.all())
+
+    async def _lexical_rows(
+        self, session: AsyncSession, query: str, *, k: int, collection_ids: Sequence[str] | None
+    ) -> list[Row[Any]]:
+        terms = lexical_query_text(query)
+        if not terms:
+            return []
+        tsquery = func.websearch_to_tsquery(cast(literal(self.settings.text_search_config), REGCONFIG), terms)
+        rank = func.ts_rank_cd(CHUNK_CONTENT_TSV, tsquery).label("rank")
+        stmt = (
+            select(*self._chunk_columns(), rank)
+            .join(Document, Document.id == Chunk.document_id)
+            .where(CHUNK_CONTENT_TSV.op("@@")(tsquery))
+            .order_by(rank.desc())
+            .limit(k)
+        )
+        if collection_ids is not None:
+            stmt = stmt.where(Chunk.collection_id.in_(list(collection_ids)))
+        result = await session.execute(stmt)
+        return list(result.all())
+
+    async def _lexical_rows_in_own_session(
+        self, query: str, *, k: int, collection_ids: Sequence[str] | None
+    ) -> list[Row[Any]]:
+        assert self.session_factory is not None
+        async with self.session_factory() as session:
+            return await self._lexical_rows(session, query, k=k, collection_ids=collection_ids)
+
+    @staticmethod
+    def _document_from_row(row: Row[Any], score: float | None) -> dict[str, Any]:
+        chunk_id, document_id, content, chunk_metadata, document_title, document_metadata = row[:6]
+        return {
+            "chunk_id": chunk_id,
+            "document_id": document_id,
+            "content": content,
+            "metadata": chunk_metadata or {},
+            "document_title": document_title,
+            "document_metadata": document_metadata or {},
+            "score": score,
+        }
+
+    @staticmethod
+    def _similarity(distance_value: Any) -> float | None:
+        if distance_value is None:
+            return None
+        try:
+            return max(0.0, 1.0 - float(distance_value))
+        except (TypeError, ValueError):
+            return None
+
+    async def similarity_search(
+        self,
+        query: str,
+        *,
+        k: int = 5,
+        collection_ids: Sequence[str] | None = None,
+    ) -> Sequence[Mapping[str, Any]]:
+        if collection_ids is not None and not collection_ids:
+            LOGGER.info("PGVectorStore search skipped | no accessible collections")
+            return []
+        overall_start = perf_counter()
+        query_vector, cache_hit = await self._embed_query(query)
+        embed_time = perf_counter() - overall_start
+        sql_start = perf_counter()
+        rows = await self._vector_rows(query_vector, k=k, collection_ids=collection_ids)
         sql_time = perf_counter() - sql_start
-        documents: list[Mapping[str, Any]] = []
-        for (
-            chunk_id,
-            document_id,
-            content,
-            chunk_metadata,
-            document_title,
-            document_metadata,
-            distance_value,
-        ) in rows:
-            score: float | None = None
-            if distance_value is not None:
-                try:
-                    score = max(0.0, 1.0 - float(distance_value))
-                except (TypeError, ValueError):
-                    score = None
-            documents.append(
-                {
-                    "chunk_id": chunk_id,
-                    "document_id": document_id,
-                    "content": content,
-                    "metadata": chunk_metadata or {},
-                    "document_title": document_title,
-                    "document_metadata": document_metadata or {},
-                    "score": score,
-                }
-            )
+        documents = [self._document_from_row(row, self._similarity(row[6])) for row in rows]
         total_time = perf_counter() - overall_start
         LOGGER.info(
-            "PGVectorStore search | embed_model=%s k=%s results=%d embed_time=%.3fs sql_time=%.3fs total_time=%.3fs",
+            "PGVectorStore search | embed_model=%s index=%s k=%s collections=%s results=%d embed_time=%.3fs "
+            "query_cache_hit=%s query_cache_hit_ratio=%.2f sql_time=%.3fs total_time=%.3fs",
             getattr(self.embedder, "model_name", None),
+            self.settings.index_type,
             k,
+            "all" if collection_ids is None else len(collection_ids),
             len(documents),
             embed_time,
+            cache_hit,
+            self.query_cache.hit_ratio if self.query_cache is not None else 0.0,
             sql_time,
             total_time,
         )
         return documents
 
+    async def hybrid_search(
+        self,
+        query: str,
+        *,
+        k: int = 5,
+        collection_ids: Sequence[str] | None = None,
+    ) -> Sequence[Mapping[str, Any]]:
+        """Fuse full-text and ANN rankings with reciprocal rank fusion."""
+
+        if self.session.get_bind().dialect.name != "postgresql":
+            return await self.similarity_search(query, k=k, collection_ids=collection_ids)
+        if collection_ids is not None and not collection_ids:
+            LOGGER.info("PGVectorStore hybrid search skipped | no accessible collections")
+            return []
+        overall_start = perf_counter()
+        depth = max(k, self.settings.hybrid_candidates)
+
+        async def _vector() -> list[Row[Any]]:
+            query_vector, _hit = await self._embed_query(query)
+            return await self._vector_rows(query_vector, k=depth, collection_ids=collection_ids)
+
+        if self.session_factory is not None:
+            vector_rows, lexical_rows = await asyncio.gather(
+                _vector(),
+                self._lexical_rows_in_own_session(query, k=depth, collection_ids=collection_ids),
+            )
+        else:
+            vector_rows = await _vector()
+            lexical_rows = await self._lexical_rows(self.session, query, k=depth, collection_ids=collection_ids)
+
+        rows_by_id: dict[str, Row[Any]] = {row[0]: row for row in lexical_rows}
+        similarity_by_id: dict[str, float | None] = {}
+        for row in vector_rows:
+            rows_by_id[row[0]] = row
+            similarity_by_id[row[0]] = self._similarity(row[6])
+        fused = reciprocal_rank_fusion(
+            [[row[0] for row in vector_rows], [row[0] for row in lexical_rows]],
+            k=self.settings.rrf_k,
+        )
+        lexical_ids = {row[0] for row in lexical_rows}
+        documents: list[dict[str, Any]] = []
+        for chunk_id in sorted(fused, key=fused.__getitem__, reverse=True)[:k]:
+            document = self._document_from_row(rows_by_id[chunk_id], similarity_by_id.get(chunk_id))
+            document["rrf_score"] = fused[chunk_id]
+            document["matched"] = [
+                name
+                for name, hit in (("vector", chunk_id in similarity_by_id), ("lexical", chunk_id in lexical_ids))
+                if hit
+            ]
+            documents.append(document)
+        LOGGER.info(
+            "PGVectorStore hybrid search | k=%s depth=%s collections=%s vector_hits=%d lexical_hits=%d results=%d "
+            "concurrent=%s total_time=%.3fs",
+            k,
+            depth,
+            "all" if collection_ids is None else len(collection_ids),
+            len(vector_rows),
+            len(lexical_rows),
+            len(documents),
+            self.session_factory is not None,
+            perf_counter() - overall_start,
+        )
+        return documents
+
 
-__all__ = ["PGVectorStore"]
+__all__ = ["PGVectorStore", "lexical_query_text", "reciprocal_rank_fusion"]
@@ -0,0 +1,219 @@
+"""Split on-disk cache of Docling conversions.
+
+A conversion is stored under ``docling_output_dir/<hash>/`` as::
+
+    manifest.json                 title, metadata and the page index (small, uncompressed)
+    pages/page-0001.json.<ext>    text, metadata and image reference of one page
+    document.json.<ext>           the DoclingDocument, without page images
+
+so a cache hit reads the manifest and page texts, the DoclingDocument is only validated when
+hybrid chunking needs it, and a preview lookup reads a single page file. Files are compressed with
+zstd when the optional ``zstandard`` package is installed and with gzip otherwise.
+"""
+from __future__ import annotations
+
+import gzip
+import importlib
+import importlib.util
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+CACHE_FORMAT_VERSION = 2
+
+_SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+
+
+@dataclass(slots=True)
+class CachedPage:
+    """One page as stored in the cache."""
+
+    number: int
+    content: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+    # Docling ``ImageRef`` payload (``uri``/``mimetype``) of the rendered page, if any.
+    image: dict[str, Any] | None = None
+
+
+def default_codec() -> str:
+    return "zstd" if importlib.util.find_spec("zstandard") is not None else "gzip"
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        zstandard = importlib.import_module("zstandard")
+        return zstandard.ZstdCompressor(level=6).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(data: bytes, path: Path) -> bytes:
+    if path.suffix == ".zst":
+        try:
+            zstandard = importlib.import_module("zstandard")
+        except ModuleNotFoundError as exc:
+            raise ValueError(f"{path} is zstd-compressed but the 'zstandard' package is not installed") from exc
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    if path.suffix == ".gz":
+        return gzip.decompress(data)
+    return data
+
+
+def _write_json(path: Path, payload: Any, codec: str) -> None:
+    data = _compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"), codec)
+    temporary = path.with_name(f".{path.name}.tmp")
+    temporary.write_bytes(data)
+    os.replace(temporary, path)
+
+
+def _read_json(path: Path) -> Any:
+    return json.loads(_decompress(path.read_bytes(), path))
+
+
+def manifest_path(cache_dir: Path) -> Path:
+    return cache_dir / MANIFEST_NAME
+
+
+def write_cache(
+    cache_dir: Path,
+    *,
+    title: str,
+    metadata: dict[str, Any],
+    pages: list[CachedPage],
+    docling_payload: dict[str, Any] | None,
+    codec: str | None = None,
+) -> Path:
+    """Write a conversion to ``cache_dir`` and return the manifest path.
+
+    The manifest is written last, so a crash mid-write leaves no manifest and the entry is rebuilt.
+    """
+
+    codec = codec or default_codec()
+    suffix = _SUFFIXES[codec]
+    (cache_dir / "pages").mkdir(parents=True, exist_ok=True)
+
+    page_index: list[dict[str, Any]] = []
+    for page in pages:
+        relative = f"pages/page-{page.number:04d}.json{suffix}"
+        _write_json(
+            cache_dir / relative,
+            {"number": page.number, "content": page.content, "metadata": page.metadata, "image": page.image},
+            codec,
+        )
+        page_index.append({"number": page.number, "file": relative})
+
+    document_file = None
+    if docling_payload is not None:
+        document_file = f"document.json{suffix}"
+        _write_json(cache_dir / document_file, docling_payload, codec)
+
+    manifest = {
+        "version": CACHE_FORMAT_VERSION,
+        "codec": codec,
+        "title": title,
+        "metadata": metadata,
+        "document": document_file,
+        "pages": page_index,
+    }
+    target = manifest_path(cache_dir)
+    temporary = target.with_name(f".{target.name}.tmp")
+    temporary.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+    os.replace(temporary, target)
+    return target
+
+
+def read_manifest(path: Path) -> dict[str, Any] | None:
+    """Return the manifest at ``path``, or ``None`` if it is missing, corrupt or of another version."""
+
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != CACHE_FORMAT_VERSION:
+        return None
+    return manifest
+
+
+def read_pages(path: Path, manifest: dict[str, Any]) -> list[CachedPage]:
+    """Load every page listed in ``manifest`` (without their images)."""
+
+    pages: list[CachedPage] = []
+    for entry in manifest.get("pages") or []:
+        payload = _read_json(path.parent / entry["file"])
+        pages.append(
+            CachedPage(
+                number=int(payload.get("number", entry["number"])),
+                content=str(payload.get("content", "")),
+                metadata=dict(payload.get("metadata") or {}),
+            )
+        )
+    return pages
+
+
+def read_page(path: Path, page_number: int) -> CachedPage | None:
+    """Load one page, image reference included, reading only the manifest and that page's file."""
+
+    manifest = read_manifest(path)
+    if manifest is None:
+        return None
+    for entry in manifest.get("pages") or []:
+        if int(entry.get("number", -1)) == page_number:
+            payload = _read_json(path.parent / entry["file"])
+            return CachedPage(
+                number=page_number,
+                content=str(payload.get("content", "")),
+                metadata=dict(payload.get("metadata") or {}),
+                image=payload.get("image") if isinstance(payload.get("image"), dict) else None,
+            )
+    return None
+
+
+def read_docling_payload(path: Path, manifest: dict[str, Any]) -> dict[str, Any] | None:
+    """Load the serialised DoclingDocument referenced by ``manifest``."""
+
+    document_file = manifest.get("document")
+    if not document_file:
+        return None
+    return _read_json(path.parent / document_file)
+
+
+def split_page_images(docling_payload: dict[str, Any]) -> dict[int, dict[str, Any]]:
+    """Remove page images from a serialised DoclingDocument and return them by page number.
+
+    Rendered pages are by far the largest part of the payload and are only needed for previews,
+    which read them from the page files instead.
+    """
+
+    images: dict[int, dict[str, Any]] = {}
+    pages = docling_payload.get("pages")
+    entries = pages.values() if isinstance(pages, dict) else pages if isinstance(pages, list) else []
+    for entry in entries:
+        if not isinstance(entry, dict) or not isinstance(entry.get("image"), dict):
+            continue
+        try:
+            number = int(entry.get("page_no"))
+        except (TypeError, ValueError):
+            continue
+        images[number] = entry["image"]
+        entry["image"] = None
+    return images
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "CachedPage",
+    "MANIFEST_NAME",
+    "default_codec",
+    "manifest_path",
+    "read_docling_payload",
+    "read_manifest",
+    "read_page",
+    "read_pages",
+    "split_page_images",
+    "write_cache",
+]
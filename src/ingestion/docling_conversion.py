@@ -0,0 +1,256 @@
+"""Docling conversion in long-lived worker processes that keep a warmed converter."""
+from __future__ import annotations
+
+import base64
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..config import DoclingSettings
+from .exceptions import IngestionError
+
+LOGGER = logging.getLogger(__name__)
+
+# DoclingSettings fields that change the converter's pipeline options (and hence the loaded models).
+_CONVERTER_FIELDS = (
+    "do_ocr",
+    "do_table_structure",
+    "table_mode",
+    "table_cell_matching",
+    "generate_page_images",
+    "image_scale",
+    "accelerator_device",
+    "accelerator_num_threads",
+)
+
+ConverterKey = tuple[tuple[str, Any], ...]
+
+# Per-process converter cache; in pool workers this is populated by the initializer.
+_CONVERTERS: dict[ConverterKey, Any] = {}
+_CONVERTERS_LOCK = threading.Lock()
+# Docling pipelines are not known to be thread-safe. Without a process pool every ingestion slot converts
+# in a thread against the one cached converter, so conversions in a process run one at a time; pool
+# workers convert a single document at a time anyway, so there the lock is never contended.
+_CONVERT_LOCK = threading.Lock()
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_KEY: tuple[int, ConverterKey] | None = None
+_POOL_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
+class ConvertedPage:
+    """Raw page output of a conversion, before sanitising."""
+
+    number: int
+    text: str
+    image_path: str | None = None
+
+
+@dataclass(slots=True)
+class ConversionOutput:
+    """Picklable result of converting one file."""
+
+    docling_document: Any
+    document_name: str | None
+    pages: list[ConvertedPage] = field(default_factory=list)
+
+
+def converter_key(settings: DoclingSettings) -> ConverterKey:
+    """Return the hashable subset of settings a converter instance depends on."""
+
+    return tuple((name, getattr(settings, name)) for name in _CONVERTER_FIELDS)
+
+
+def _build_converter(key: ConverterKey) -> Any:
+    try:
+        from docling.document_converter import DocumentConverter, PdfFormatOption
+        from docling.datamodel.base_models import InputFormat
+        from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
+        from docling.datamodel.accelerator_options import AcceleratorOptions
+    except ModuleNotFoundError as exc:  # pragma: no cover - guarded import
+        raise IngestionError("Docling package is not installed. Install 'docling' to enable parsing.") from exc
+
+    options = dict(key)
+    pipeline_options = PdfPipelineOptions(
+        do_ocr=options["do_ocr"],
+        do_table_structure=options["do_table_structure"],
+        generate_page_images=options["generate_page_images"],
+        images_scale=options["image_scale"],
+    )
+    pipeline_options.table_structure_options.mode = TableFormerMode(options["table_mode"])
+    pipeline_options.table_structure_options.do_cell_matching = options["table_cell_matching"]
+
+    accel_kwargs: dict[str, object] = {"device": options["accelerator_device"]}
+    if options["accelerator_num_threads"] > 0:
+        accel_kwargs["num_threads"] = options["accelerator_num_threads"]
+    pipeline_options.accelerator_options = AcceleratorOptions(**accel_kwargs)
+
+    pdf_option = PdfFormatOption(pipeline_options=pipeline_options)
+    converter = DocumentConverter(format_options={InputFormat.PDF: pdf_option})
+    # Load layout/TableFormer models now instead of on the first document.
+    initialize = getattr(converter, "initialize_pipeline", None)
+    if callable(initialize):
+        initialize(InputFormat.PDF)
+    return converter
+
+
+def get_converter(key: ConverterKey) -> Any:
+    """Return this process's converter for ``key``, building it on first use."""
+
+    with _CONVERTERS_LOCK:
+        converter = _CONVERTERS.get(key)
+        if converter is None:
+            LOGGER.info("Initialising Docling converter | options=%s", dict(key))
+            converter = _build_converter(key)
+            _CONVERTERS[key] = converter
+        return converter
+
+
+def _warm_worker(key: ConverterKey) -> None:
+    try:
+        get_converter(key)
+    except Exception:  # noqa: BLE001 - surface the error on the first real conversion instead
+        LOGGER.exception("Failed to warm Docling converter in worker process")
+
+
+def convert_document(path: str, cache_dir: str, key: ConverterKey) -> ConversionOutput:
+    """Convert ``path`` and materialise page images into ``cache_dir``.
+
+    Runs inside a pool worker (or a thread when no pool is configured), so everything
+    returned must be picklable; the raw conversion result never leaves this function.
+    """
+
+    converter = get_converter(key)
+    with _CONVERT_LOCK:
+        conversion_result = converter.convert(Path(path))
+    docling_document = getattr(conversion_result, "document", None)
+    if docling_document is None:
+        raise IngestionError("Docling conversion did not produce a document.")
+    name = getattr(docling_document, "name", None)
+    return ConversionOutput(
+        docling_document=docling_document,
+        document_name=name if isinstance(name, str) else None,
+        pages=_extract_pages(conversion_result, Path(cache_dir)),
+    )
+
+
+def _extract_pages(conversion_result: Any, cache_dir: Path) -> list[ConvertedPage]:
+    try:
+        from docling.utils.export import generate_multimodal_pages
+    except ModuleNotFoundError:
+        LOGGER.warning("Docling utilities not available; falling back to empty page content.")
+        return []
+
+    pages: list[ConvertedPage] = []
+    for entry in generate_multimodal_pages(conversion_result):
+        content_text, content_md, _tokens, _cells, _segments, page = entry
+        page_no = getattr(page, "page_no", len(pages) + 1)
+        image_path = _materialise_page_image(page, cache_dir, page_no)
+        pages.append(
+            ConvertedPage(
+                number=page_no,
+                text=content_md or content_text or "",
+                image_path=image_path.as_posix() if image_path is not None else None,
+            )
+        )
+    return pages
+
+
+def _materialise_page_image(page: Any, cache_dir: Path, page_no: int) -> Path | None:
+    image_ref = getattr(page, "image", None)
+    if image_ref is None:
+        return None
+    uri = getattr(image_ref, "uri", None)
+    mimetype = getattr(image_ref, "mimetype", "image/png")
+    if uri is None:
+        return None
+
+    ext = "png"
+    if isinstance(mimetype, str) and "/" in mimetype:
+        ext = mimetype.split("/", 1)[1]
+    target = cache_dir / f"page-{page_no:04d}.{ext}"
+
+    if isinstance(uri, Path):
+        try:
+            data = uri.read_bytes()
+        except FileNotFoundError:
+            return None
+        target.write_bytes(data)
+        return target
+
+    uri_text = str(uri)
+    if uri_text.startswith("data:"):
+        try:
+            _, payload = uri_text.split(",", 1)
+            target.write_bytes(base64.b64decode(payload))
+            return target
+        except (ValueError, base64.binascii.Error):
+            LOGGER.debug("Failed to decode inline image for page %s", page_no)
+    elif uri_text.startswith("file:"):
+        try:
+            file_path = Path(uri_text[5:])
+            target.write_bytes(file_path.read_bytes())
+            return target
+        except FileNotFoundError:
+            LOGGER.debug("Referenced page image not found: %s", uri_text)
+    return None
+
+
+def get_conversion_pool(workers: int, key: ConverterKey) -> ProcessPoolExecutor:
+    """Return the shared conversion pool, recreating it when size or options change."""
+
+    global _POOL, _POOL_KEY
+    with _POOL_LOCK:
+        if _POOL is not None and _POOL_KEY == (workers, key):
+            return _POOL
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+        LOGGER.info("Starting Docling conversion pool | workers=%d", workers)
+        # Spawn rather than fork: Docling loads torch, which is not fork-safe once threads exist.
+        _POOL = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+            initargs=(key,),
+        )
+        _POOL_KEY = (workers, key)
+        return _POOL
+
+
+def discard_conversion_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop ``pool`` if it is still the shared one (e.g. after a worker crashed)."""
+
+    global _POOL, _POOL_KEY
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+            _POOL_KEY = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_conversion_pool() -> None:
+    """Terminate the shared conversion pool, if one was started."""
+
+    global _POOL, _POOL_KEY
+    with _POOL_LOCK:
+        pool, _POOL, _POOL_KEY = _POOL, None, None
+    if pool is not None:
+        LOGGER.info("Shutting down Docling conversion pool")
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+__all__ = [
+    "ConversionOutput",
+    "ConvertedPage",
+    "convert_document",
+    "converter_key",
+    "get_conversion_pool",
+    "get_converter",
+    "discard_conversion_pool",
+    "shutdown_conversion_pool",
+]
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, Mapping
 
 from ..config import StorageSettings
+from .docling_cache import MANIFEST_NAME, read_page
 
 LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +50,14 @@ class DoclingImageLocator:
             LOGGER.debug("Unable to materialise Docling preview", exc_info=True)
             return None
 
+    def resolve_page_image(self, image_path: str) -> Path | None:
+        """Return a page image recorded at ingestion, if it still exists inside the Docling root."""
+
+        resolved = self._within_docling_root(Path(image_path))
+        if resolved is None or not resolved.is_file():
+            return None
+        return resolved
+
     def _resolve_image_dir(self, metadata: Mapping[str, Any]) -> Path | None:
         image_dir_value = metadata.get("image_dir")
         docling_hash = metadata.get("docling_hash")
@@ -97,24 +106,33 @@ class DoclingImageLocator:
             return None
         return resolved
 
-    def _materialise_from_json(self, *, json_path: Path, page_number: int, fallback_dir: Path | None) -> Path | None:
+    @staticmethod
+    def _legacy_page_entry(json_path: Path, page_number: int) -> dict[str, Any] | None:
         payload = json.loads(json_path.read_text(encoding="utf-8"))
         doc_payload = payload.get("docling_document", payload)
         pages = doc_payload.get("pages")
-        page_entry: dict[str, Any] | None = None
 
         if isinstance(pages, dict):
             candidate = pages.get(str(page_number)) or pages.get(page_number)
             if isinstance(candidate, dict):
-                page_entry = candidate
+                return candidate
         elif isinstance(pages, list):
             for entry in pages:
                 if not isinstance(entry, dict):
                     continue
                 entry_page = entry.get("page_no")
                 if entry_page == page_number or str(entry_page) == str(page_number):
-                    page_entry = entry
-                    break
+                    return entry
+        return None
+
+    def _materialise_from_json(self, *, json_path: Path, page_number: int, fallback_dir: Path | None) -> Path | None:
+        if json_path.name == MANIFEST_NAME:
+            cached_page = read_page(json_path, page_number)
+            page_entry: dict[str, Any] | None = (
+                {"image": cached_page.image} if cached_page is not None and cached_page.image else None
+            )
+        else:
+            page_entry = self._legacy_page_entry(json_path, page_number)
 
         if page_entry is None:
             return None
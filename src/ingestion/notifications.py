@@ -0,0 +1,96 @@
+"""Postgres LISTEN/NOTIFY wake-ups for ingestion workers."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy.engine import make_url
+
+from ..config import Settings
+from ..infrastructure.repositories.document_repo import INGESTION_JOB_CHANNEL
+
+LOGGER = logging.getLogger(__name__)
+
+_MAX_RECONNECT_DELAY = 30.0
+
+
+class JobNotificationListener:
+    """Hold a dedicated asyncpg connection LISTENing for new jobs and set ``wake_event`` on each one."""
+
+    def __init__(self, settings: Settings, wake_event: asyncio.Event, *, channel: str = INGESTION_JOB_CHANNEL) -> None:
+        self.wake_event = wake_event
+        self.channel = channel
+        self.connected = False
+        url = make_url(settings.sqlalchemy_database_uri())
+        self._dsn: str | None = None
+        if url.get_backend_name() == "postgresql":
+            self._dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+    @property
+    def enabled(self) -> bool:
+        return self._dsn is not None
+
+    def _on_notification(self, _connection: Any, _pid: int, _channel: str, payload: str) -> None:
+        LOGGER.debug("Ingestion job notification received | job=%s", payload)
+        self.wake_event.set()
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """Listen until ``stop_event`` is set, reconnecting with exponential backoff."""
+
+        if self._dsn is None:
+            LOGGER.info("Job notifications unavailable for this database; relying on polling")
+            return
+        try:
+            import asyncpg
+        except ModuleNotFoundError:  # pragma: no cover - asyncpg ships with the Postgres driver extra
+            LOGGER.warning("asyncpg is not installed; relying on polling for ingestion jobs")
+            return
+
+        delay = 1.0
+        while not stop_event.is_set():
+            try:
+                connection = await asyncpg.connect(self._dsn)
+            except (OSError, asyncpg.PostgresError) as exc:
+                LOGGER.warning("Job notification listener could not connect (%s); retrying in %.0fs", exc, delay)
+                await _wait(stop_event, delay)
+                delay = min(delay * 2, _MAX_RECONNECT_DELAY)
+                continue
+
+            delay = 1.0
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _connection: closed.set())
+            try:
+                await connection.add_listener(self.channel, self._on_notification)
+                self.connected = True
+                LOGGER.info("Listening for ingestion jobs on channel '%s'", self.channel)
+                # Jobs may have been created while we were disconnected.
+                self.wake_event.set()
+                waiters = [asyncio.create_task(stop_event.wait()), asyncio.create_task(closed.wait())]
+                try:
+                    await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    for waiter in waiters:
+                        waiter.cancel()
+                if not stop_event.is_set():
+                    LOGGER.warning("Job notification connection closed; reconnecting")
+            except (OSError, asyncpg.PostgresError) as exc:
+                LOGGER.warning("Job notification listener failed: %s", exc)
+                await _wait(stop_event, delay)
+            finally:
+                self.connected = False
+                if not connection.is_closed():
+                    try:
+                        await asyncio.wait_for(connection.close(), timeout=5)
+                    except (OSError, asyncio.TimeoutError, asyncpg.PostgresError):
+                        connection.terminate()
+
+
+async def _wait(stop_event: asyncio.Event, timeout: float) -> None:
+    try:
+        await asyncio.wait_for(stop_event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+__all__ = ["JobNotificationListener"]
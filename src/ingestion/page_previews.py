@@ -0,0 +1,121 @@
+"""Size-bounded derivatives of Docling page images for citation previews.
+
+Pages are rendered at ``DOCLING__IMAGE_SCALE`` (2x by default), which is far larger than a hover
+preview needs. Derivatives are generated on first request next to the original image, under
+``previews/``, and reused afterwards. The cache entry directory is named after the file's SHA-256, so a
+derivative never changes once written.
+"""
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Literal
+
+from ..config import PreviewSettings
+
+LOGGER = logging.getLogger(__name__)
+
+PreviewSize = Literal["full", "medium", "thumb"]
+
+_MIMETYPES = {"webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+_EXTENSIONS = {"webp": "webp", "jpeg": "jpg", "png": "png"}
+
+
+def pillow_available() -> bool:
+    return importlib.util.find_spec("PIL") is not None
+
+
+def _variant(size: PreviewSize, settings: PreviewSettings) -> str:
+    """Name a derivative by every setting that shapes it, so changing one renders a new file."""
+
+    if size == "full":
+        return size
+    variant = f"{size}-{_max_edge(size, settings)}"
+    if settings.format != "png":
+        variant += f"-q{settings.quality}"
+    return variant
+
+
+def derivative_path(image_path: Path, size: PreviewSize, settings: PreviewSettings) -> Path:
+    name = f"{image_path.stem}-{_variant(size, settings)}.{_EXTENSIONS[settings.format]}"
+    return image_path.parent / "previews" / name
+
+
+def derivative_mimetype(settings: PreviewSettings) -> str:
+    return _MIMETYPES[settings.format]
+
+
+def _max_edge(size: PreviewSize, settings: PreviewSettings) -> int:
+    return settings.thumb_max_edge if size == "thumb" else settings.medium_max_edge
+
+
+def _render(image_path: Path, target: Path, *, max_edge: int, settings: PreviewSettings) -> None:
+    from PIL import Image
+
+    with Image.open(image_path) as image:
+        image.thumbnail((max_edge, max_edge))
+        if settings.format == "jpeg" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        options: dict[str, object] = {"format": settings.format.upper()}
+        if settings.format != "png":
+            options["quality"] = settings.quality
+        else:
+            options["optimize"] = True
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent requests for the same derivative each render into their own file.
+        with tempfile.NamedTemporaryFile(
+            dir=target.parent, prefix=f".{target.name}.", suffix=".tmp", delete=False
+        ) as temporary:
+            temporary_path = Path(temporary.name)
+        try:
+            image.save(temporary_path, **options)
+            os.replace(temporary_path, target)
+        except BaseException:
+            temporary_path.unlink(missing_ok=True)
+            raise
+
+
+def resolve_preview(image_path: Path, size: PreviewSize, settings: PreviewSettings) -> Path:
+    """Return the image to serve for ``size``, rendering the derivative on first use.
+
+    Falls back to ``image_path`` for ``full``, when Pillow is not installed or when rendering fails.
+    Blocking; call it from a worker thread.
+    """
+
+    if size == "full" or not pillow_available():
+        return image_path
+    target = derivative_path(image_path, size, settings)
+    if target.exists():
+        return target
+    try:
+        _render(image_path, target, max_edge=_max_edge(size, settings), settings=settings)
+    except Exception:  # noqa: BLE001 - a broken derivative must not break the preview
+        LOGGER.warning("Failed to render %s preview of %s", size, image_path, exc_info=True)
+        return image_path
+    return target
+
+
+def preview_etag(
+    docling_hash: str | None, page_number: int, size: PreviewSize, served_path: Path, settings: PreviewSettings
+) -> str:
+    """Strong validator for a preview; content-addressed by the Docling hash when it is known."""
+
+    # The served file's suffix distinguishes a derivative from the fallback original.
+    variant = _variant(size, settings)
+    if docling_hash:
+        return f'"{docling_hash}-{page_number}-{variant}{served_path.suffix}"'
+    stat = served_path.stat()
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}-{page_number}-{variant}{served_path.suffix}"'
+
+
+__all__ = [
+    "PreviewSize",
+    "derivative_mimetype",
+    "derivative_path",
+    "pillow_available",
+    "preview_etag",
+    "resolve_preview",
+]
@@ -2,15 +2,17 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import hashlib
 import json
 import logging
+import mimetypes
 import re
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterable, Sequence
+from typing import Any, Callable, Iterable, Mapping, Sequence
 
 from ..config import DoclingSettings, StorageSettings
 from ..infrastructure.database import (
@@ -20,7 +22,24 @@ from ..infrastructure.database import (
     IngestionStep,
 )
 from ..infrastructure.embeddings.base import EmbeddingClient
+from ..infrastructure.embeddings.cache import CachedEmbeddingClient
 from ..infrastructure.repositories.document_repo import DocumentRepository
+from .docling_cache import (
+    CachedPage,
+    manifest_path,
+    read_docling_payload,
+    read_manifest,
+    read_pages,
+    split_page_images,
+    write_cache,
+)
+from .docling_conversion import (
+    ConversionOutput,
+    convert_document,
+    converter_key,
+    discard_conversion_pool,
+    get_conversion_pool,
+)
 from .exceptions import IngestionError
 
 LOGGER = logging.getLogger(__name__)
@@ -50,6 +69,14 @@ class ParsedDocument:
     pages: list[ParsedPage]
     metadata: dict[str, object]
     docling_document: Any | None = None
+    # Loads ``docling_document`` from the cache on first use; only hybrid chunking needs it.
+    docling_loader: Callable[[], Any] | None = None
+
+    def resolve_docling_document(self) -> Any | None:
+        if self.docling_document is None and self.docling_loader is not None:
+            loader, self.docling_loader = self.docling_loader, None
+            self.docling_document = loader()
+        return self.docling_document
 
 
 @dataclass(slots=True)
@@ -60,6 +87,12 @@ class ChunkPayload:
     metadata: dict[str, object]
 
 
+def chunk_content_hash(content: str) -> str:
+    """Fingerprint of chunk text used to recognise unchanged chunks across document versions."""
+
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 def _sanitize_page_text(text: str) -> str:
     """Remove inline base64 image payloads and tidy whitespace."""
 
@@ -101,7 +134,9 @@ class DoclingParser:
         self.docling_settings = docling_settings
         self._hash_index_lock = asyncio.Lock()
 
-    async def parse(self, source: str | Path) -> ParsedDocument:
+    async def parse(self, source: str | Path, *, file_hash: str | None = None) -> ParsedDocument:
+        """Parse ``source``; ``file_hash`` is its SHA-256 when already known (e.g. computed during upload)."""
+
         if not self.docling_settings.enabled:
             raise IngestionError("Docling parsing is disabled by configuration")
 
@@ -109,31 +144,40 @@ class DoclingParser:
         if not path.exists():
             raise FileNotFoundError(path)
 
-        file_hash = self._create_file_hash(path)
+        file_hash = file_hash or self._create_file_hash(path)
         cache_dir = self.storage.docling_output_dir / file_hash
         cache_dir.mkdir(parents=True, exist_ok=True)
-        json_path = cache_dir / f"{file_hash}.json"
+        output_path = manifest_path(cache_dir)
+        legacy_json_path = cache_dir / f"{file_hash}.json"
 
         cached_document = None
-        if json_path.exists():
-            try:
-                cached_document = self._load_cached_document(json_path)
-            except Exception as exc:  # noqa: BLE001 - cache corruption
-                LOGGER.warning("Failed to load cached Docling artefact %s: %s", json_path, exc)
+        try:
+            if output_path.exists():
+                cached_document = self._load_cached_document(output_path)
+            elif legacy_json_path.exists():
+                cached_document = self._load_legacy_cached_document(legacy_json_path)
+                if cached_document is not None:
+                    # Rewrite once in the split format so later hits stop reading the monolithic file.
+                    self._persist_cache(cached_document, cache_dir)
+                    cached_document.metadata["docling_output"] = str(output_path)
+                    for page in cached_document.pages:
+                        page.metadata["docling_output"] = str(output_path)
+        except Exception as exc:  # noqa: BLE001 - cache corruption
+            LOGGER.warning("Failed to load cached Docling artefact in %s: %s", cache_dir, exc)
+            cached_document = None
 
         if cached_document is not None:
+            self._adopt_source(cached_document, path)
+            await self._update_hash_index(path, file_hash)
             return cached_document
 
-        conversion_result = await self._run_conversion(path, cache_dir)
-        docling_document = getattr(conversion_result, "document", None)
-        if docling_document is None:
-            raise IngestionError("Docling conversion did not produce a document.")
-
-        pages = self._build_pages(conversion_result, cache_dir, file_hash, json_path)
-        document_title = self._resolve_title(conversion_result, path)
+        conversion = await self._run_conversion(path, cache_dir)
+        docling_document = conversion.docling_document
+        pages = self._build_pages(conversion, cache_dir, file_hash, output_path)
+        document_title = self._resolve_title(conversion, path)
         metadata: dict[str, object] = {
             "docling_hash": file_hash,
-            "docling_output": str(json_path),
+            "docling_output": str(output_path),
             "image_dir": str(cache_dir),
             "source_path": str(path),
             "page_count": len(pages),
@@ -144,43 +188,70 @@ class DoclingParser:
             metadata=metadata,
             docling_document=docling_document,
         )
-        self._persist_cache(parsed, json_path)
+        self._persist_cache(parsed, cache_dir)
         await self._update_hash_index(path, file_hash)
         return parsed
 
-    async def _run_conversion(self, path: Path, cache_dir: Path) -> Any:
-        """Execute Docling conversion in a worker thread."""
+    async def _run_conversion(self, path: Path, cache_dir: Path) -> ConversionOutput:
+        """Convert ``path`` in the shared process pool, or in a thread when no pool is configured."""
+
+        key = converter_key(self.docling_settings)
+        loop = asyncio.get_running_loop()
+        workers = self.docling_settings.worker_processes
+        if workers <= 0:
+            return await loop.run_in_executor(None, convert_document, str(path), str(cache_dir), key)
 
+        pool = get_conversion_pool(workers, key)
         try:
-            from docling.document_converter import DocumentConverter, PdfFormatOption
-            from docling.datamodel.base_models import InputFormat
-            from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
-            from docling.datamodel.accelerator_options import AcceleratorOptions
-        except ModuleNotFoundError as exc:  # pragma: no cover - guarded import
-            raise IngestionError("Docling package is not installed. Install 'docling' to enable parsing.") from exc
+            return await loop.run_in_executor(pool, convert_document, str(path), str(cache_dir), key)
+        except BrokenProcessPool as exc:
+            discard_conversion_pool(pool)
+            raise IngestionError(f"Docling worker process crashed while converting {path.name}.") from exc
+
+    def _load_cached_document(self, output_path: Path) -> ParsedDocument | None:
+        manifest = read_manifest(output_path)
+        if manifest is None:
+            return None
+        pages = [
+            ParsedPage(number=page.number, content=page.content, metadata=page.metadata)
+            for page in read_pages(output_path, manifest)
+        ]
+        metadata = dict(manifest.get("metadata") or {})
+        metadata["docling_output"] = str(output_path)
+        for page in pages:
+            page.metadata["docling_output"] = str(output_path)
 
-        pipeline_options = PdfPipelineOptions(
-            do_ocr=self.docling_settings.do_ocr,
-            do_table_structure=self.docling_settings.do_table_structure,
-            generate_page_images=self.docling_settings.generate_page_images,
-            images_scale=self.docling_settings.image_scale,
+        def _load_docling_document() -> Any | None:
+            payload = read_docling_payload(output_path, manifest)
+            if payload is None:
+                return None
+            try:
+                from docling_core.types.doc.document import DoclingDocument
+            except ModuleNotFoundError as exc:  # pragma: no cover - guarded import
+                raise IngestionError("Docling package is required to load cached artefacts.") from exc
+            return DoclingDocument.model_validate(payload)
+
+        title = str(manifest.get("title") or output_path.parent.name)
+        return ParsedDocument(
+            title=title,
+            pages=pages,
+            metadata=metadata,
+            docling_loader=_load_docling_document if manifest.get("document") else None,
         )
-        pipeline_options.table_structure_options.mode = TableFormerMode(self.docling_settings.table_mode)
-        pipeline_options.table_structure_options.do_cell_matching = self.docling_settings.table_cell_matching
 
-        accel_kwargs: dict[str, object] = {"device": self.docling_settings.accelerator_device}
-        if self.docling_settings.accelerator_num_threads > 0:
-            accel_kwargs["num_threads"] = self.docling_settings.accelerator_num_threads
-        pipeline_options.accelerator_options = AcceleratorOptions(**accel_kwargs)
+    @staticmethod
+    def _adopt_source(document: ParsedDocument, path: Path) -> None:
+        """Point a cache hit at ``path``; the entry was written for whichever upload was converted first."""
 
-        pdf_option = PdfFormatOption(pipeline_options=pipeline_options)
-        converter = DocumentConverter(format_options={InputFormat.PDF: pdf_option})
+        cached_source = document.metadata.get("source_path")
+        if isinstance(cached_source, str) and document.title == Path(cached_source).stem:
+            # Docling names documents after the file, so the cached title is the other upload's name.
+            document.title = path.stem
+        document.metadata["source_path"] = str(path)
 
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, converter.convert, path)
+    def _load_legacy_cached_document(self, json_path: Path) -> ParsedDocument | None:
+        """Read a cache entry written before the split format (one JSON file per document)."""
 
-    @staticmethod
-    def _load_cached_document(self, json_path: Path) -> ParsedDocument | None:
         try:
             payload = json.loads(json_path.read_text(encoding="utf-8"))
         except json.JSONDecodeError:
@@ -213,108 +284,59 @@ class DoclingParser:
         title = str(parsed_payload.get("title") or Path(json_path).stem)
         return ParsedDocument(title=title, pages=pages, metadata=metadata, docling_document=docling_document)
 
-    def _persist_cache(self, document: ParsedDocument, json_path: Path) -> None:
-        docling_document = getattr(document, "docling_document", None)
+    def _persist_cache(self, document: ParsedDocument, cache_dir: Path) -> None:
+        docling_document = document.resolve_docling_document()
         if docling_document is None:
             return
         doc_payload = docling_document.model_dump(mode="json")
-        cache_payload = {
-            "docling_document": doc_payload,
-            "parsed_document": {
-                "title": document.title,
-                "metadata": document.metadata,
-                "pages": [
-                    {
-                        "number": page.number,
-                        "content": page.content,
-                        "metadata": page.metadata,
-                    }
-                    for page in document.pages
-                ],
-            },
-        }
-        json_path.write_text(json.dumps(cache_payload, ensure_ascii=False), encoding="utf-8")
+        images = split_page_images(doc_payload)
+        output_path = manifest_path(cache_dir)
+        pages = [
+            CachedPage(
+                number=page.number,
+                content=page.content,
+                metadata={**page.metadata, "docling_output": str(output_path)},
+                image=images.get(page.number),
+            )
+            for page in document.pages
+        ]
+        write_cache(
+            cache_dir,
+            title=document.title,
+            metadata={**document.metadata, "docling_output": str(output_path)},
+            pages=pages,
+            docling_payload=doc_payload,
+        )
 
     @staticmethod
-    def _resolve_title(conversion_result: Any, path: Path) -> str:
-        document = getattr(conversion_result, "document", None)
-        if document is not None:
-            name = getattr(document, "name", None)
-            if isinstance(name, str) and name.strip():
-                return name.strip()
+    def _resolve_title(conversion: ConversionOutput, path: Path) -> str:
+        name = conversion.document_name
+        if isinstance(name, str) and name.strip():
+            return name.strip()
         return path.stem
 
+    @staticmethod
     def _build_pages(
-        self,
-        conversion_result: Any,
+        conversion: ConversionOutput,
         cache_dir: Path,
         file_hash: str,
-        json_path: Path,
+        output_path: Path,
     ) -> list[ParsedPage]:
-        try:
-            from docling.utils.export import generate_multimodal_pages
-        except ModuleNotFoundError:
-            LOGGER.warning("Docling utilities not available; falling back to empty page content.")
-            return []
-
         pages: list[ParsedPage] = []
-        for entry in generate_multimodal_pages(conversion_result):
-            content_text, content_md, _tokens, _cells, _segments, page = entry
-            page_no = getattr(page, "page_no", len(pages) + 1)
-            raw_text = content_md or content_text or ""
-            sanitised = _sanitize_page_text(raw_text)
+        for converted in conversion.pages:
             metadata: dict[str, object] = {
-                "page_number": page_no,
+                "page_number": converted.number,
                 "docling_hash": file_hash,
-                "docling_output": str(json_path),
+                "docling_output": str(output_path),
                 "image_dir": str(cache_dir),
             }
-            image_path = self._materialise_page_image(page, cache_dir, page_no)
-            if image_path is not None:
-                metadata["image_path"] = image_path.as_posix()
-            pages.append(ParsedPage(number=page_no, content=sanitised, metadata=metadata))
+            if converted.image_path is not None:
+                metadata["image_path"] = converted.image_path
+            pages.append(
+                ParsedPage(number=converted.number, content=_sanitize_page_text(converted.text), metadata=metadata)
+            )
         return pages
 
-    @staticmethod
-    def _materialise_page_image(page: Any, cache_dir: Path, page_no: int) -> Path | None:
-        image_ref = getattr(page, "image", None)
-        if image_ref is None:
-            return None
-        uri = getattr(image_ref, "uri", None)
-        mimetype = getattr(image_ref, "mimetype", "image/png")
-        if uri is None:
-            return None
-
-        ext = "png"
-        if isinstance(mimetype, str) and "/" in mimetype:
-            ext = mimetype.split("/", 1)[1]
-        target = cache_dir / f"page-{page_no:04d}.{ext}"
-
-        if isinstance(uri, Path):
-            try:
-                data = uri.read_bytes()
-            except FileNotFoundError:
-                return None
-            target.write_bytes(data)
-            return target
-
-        uri_text = str(uri)
-        if uri_text.startswith("data:"):
-            try:
-                _, payload = uri_text.split(",", 1)
-                target.write_bytes(base64.b64decode(payload))
-                return target
-            except (ValueError, base64.binascii.Error):
-                LOGGER.debug("Failed to decode inline image for page %s", page_no)
-        elif uri_text.startswith("file:"):
-            try:
-                file_path = Path(uri_text[5:])
-                target.write_bytes(file_path.read_bytes())
-                return target
-            except FileNotFoundError:
-                LOGGER.debug("Referenced page image not found: %s", uri_text)
-        return None
-
     async def _update_hash_index(self, path: Path, file_hash: str) -> None:
         index_path = self.storage.docling_hash_index
         async with self._hash_index_lock:
@@ -340,6 +362,50 @@ class DoclingParser:
         return digest.hexdigest()
 
 
+@dataclass(slots=True)
+class _ParsedItem:
+    """Parsed document handed from the parse stage to the chunk stage."""
+
+    path: Path
+    parsed: ParsedDocument
+    document: Any
+    # True when ``document`` is an earlier version being updated in place.
+    replaces: bool = False
+    # Earlier document of the same file whose chunks and vectors can be copied instead of recomputed.
+    clone_source: Any | None = None
+
+
+@dataclass(slots=True)
+class _ChunkedItem:
+    """Chunked document handed from the chunk stage to the embed stage."""
+
+    path: Path
+    document: Any
+    chunks: list[ChunkPayload]
+    # Chunks that need embedding and inserting; all of ``chunks`` unless an earlier version is replaced.
+    pending: list[ChunkPayload] = field(default_factory=list)
+    parsed: ParsedDocument | None = None
+    replaces: bool = False
+    reused: list[tuple[str, ChunkPayload]] = field(default_factory=list)
+    stale_chunk_ids: list[str] = field(default_factory=list)
+    # Embedded batches, written together (with a replacement's reuse/delete) in one transaction.
+    embedded: list[tuple[list[ChunkPayload], list[list[float]]]] = field(default_factory=list)
+    cloned_from: str | None = None
+    cloned_chunks: int = 0
+
+
+@dataclass(slots=True)
+class _EmbeddedBatch:
+    """Slice of a document's chunks with their vectors, ready for persistence."""
+
+    item: _ChunkedItem
+    event: IngestionEvent
+    chunks: list[ChunkPayload]
+    embeddings: list[list[float]]
+    is_last: bool
+    cache_detail: dict[str, Any]
+
+
 class DocumentIngestionPipeline:
     """End-to-end ingestion pipeline orchestrating parsing, chunking, and embedding."""
 
@@ -351,91 +417,426 @@ class DocumentIngestionPipeline:
         *,
         chunk_size: int = 1200,
         chunk_overlap: int = 150,
+        queue_size: int = 4,
+        embed_batch_size: int = 128,
+        parse_concurrency: int = 1,
     ) -> None:
         self.repository = repository
         self.parser = parser
         self.embedder = embedder
         self.default_chunk_size = chunk_size
         self.default_chunk_overlap = chunk_overlap
+        self.queue_size = max(1, queue_size)
+        self.embed_batch_size = max(1, embed_batch_size)
+        self.parse_concurrency = max(1, parse_concurrency)
+        self._db_lock = asyncio.Lock()
 
     async def run(self, job: IngestionJob) -> None:
+        """Ingest every discovered document through overlapping parse/chunk/embed/persist stages.
+
+        Stages are connected by bounded queues, so Docling can parse the next file while the
+        previous one is embedded and persisted. All database work goes through ``_db_lock``
+        because the stages share a single session.
+        """
+
         source_paths = self._discover_sources(job.source)
         if not source_paths:
             raise IngestionError(f"No documents discovered at {job.source}")
 
-        produced_any_chunks = False
-        for path in source_paths:
-            LOGGER.info("Ingesting document %s for job %s", path, job.id)
-            parse_event = await self._ensure_event(job, IngestionStep.docling_parse, document_path=str(path))
-            await self._mark_event_running(parse_event)
-
-            parsed = await self.parser.parse(path)
-            document = await self.repository.create_document(
-                title=parsed.title or path.stem,
-                source_path=str(path),
-                collection_name=job.collection.name if job.collection else "default",
-                metadata=parsed.metadata,
-                job=job,
-            )
-
-            await self._mark_event_success(
-                parse_event,
-                document=document,
-                detail={"pages": len(parsed.pages), "docling_hash": parsed.metadata.get("docling_hash")},
-            )
+        self._db_lock = asyncio.Lock()
+        parsed_queue: asyncio.Queue[_ParsedItem | None] = asyncio.Queue(maxsize=self.queue_size)
+        chunk_queue: asyncio.Queue[_ChunkedItem | None] = asyncio.Queue(maxsize=self.queue_size)
+        embedded_queue: asyncio.Queue[_EmbeddedBatch | None] = asyncio.Queue(maxsize=self.queue_size)
+        persisted_documents: list[str] = []
+
+        stages = [
+            asyncio.create_task(self._parse_stage(job, source_paths, parsed_queue), name="ingestion-parse"),
+            asyncio.create_task(self._chunk_stage(job, parsed_queue, chunk_queue), name="ingestion-chunk"),
+            asyncio.create_task(self._embed_stage(job, chunk_queue, embedded_queue), name="ingestion-embed"),
+            asyncio.create_task(
+                self._persist_stage(job, embedded_queue, persisted_documents), name="ingestion-persist"
+            ),
+        ]
+        try:
+            await asyncio.wait(stages, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in stages:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+        for task in stages:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()  # type: ignore[misc]
+
+        if not persisted_documents:
+            raise IngestionError("Ingestion completed without producing any chunks.")
 
-            chunk_event = await self._ensure_event(job, IngestionStep.chunk_assembly, document=document, document_path=str(path))
-            await self._mark_event_running(chunk_event, document=document)
+    async def _parse_stage(
+        self,
+        job: IngestionJob,
+        source_paths: Sequence[Path],
+        output: asyncio.Queue[_ParsedItem | None],
+    ) -> None:
+        # Keep up to ``parse_concurrency`` conversions in flight so a conversion pool stays busy,
+        # while still handing documents downstream in source order.
+        remaining = deque(source_paths)
+        window: deque[tuple[Path, asyncio.Task[ParsedDocument]]] = deque()
+        try:
+            while remaining or window:
+                while remaining and len(window) < self.parse_concurrency:
+                    next_path = remaining.popleft()
+                    window.append((next_path, asyncio.create_task(self._parse(job, next_path))))
+                path, parse_task = window.popleft()
+                LOGGER.info("Ingesting document %s for job %s", path, job.id)
+                async with self._db_lock:
+                    parse_event = await self._ensure_event(job, IngestionStep.docling_parse, document_path=str(path))
+                    await self._mark_event_running(parse_event)
+
+                parsed = await parse_task
+                source_key = self._source_key(job, path)
+                async with self._db_lock:
+                    document = None
+                    if self._replace_existing(job):
+                        # The previous version is updated only once its new chunks are in place.
+                        document = await self.repository.find_document_by_source_key(job.collection_id, source_key)
+                    replaces = document is not None
+                    clone_source = None
+                    docling_hash = parsed.metadata.get("docling_hash")
+                    if not replaces and isinstance(docling_hash, str):
+                        clone_source = await self.repository.find_clone_source(
+                            docling_hash=docling_hash,
+                            chunk_size=job.chunk_size or self.default_chunk_size,
+                            chunk_overlap=job.chunk_overlap or self.default_chunk_overlap,
+                            embedding_model=getattr(self.embedder, "model_name", None),
+                        )
+                    if document is None:
+                        document = await self.repository.create_document(
+                            title=parsed.title or path.stem,
+                            source_path=str(path),
+                            collection_name=job.collection.name if job.collection else "default",
+                            metadata=parsed.metadata,
+                            job=job,
+                            source_key=source_key,
+                        )
+                        await self.repository.set_document_pages(document.id, self._page_rows(parsed))
+                    detail: dict[str, object] = {
+                        "pages": len(parsed.pages),
+                        "docling_hash": parsed.metadata.get("docling_hash"),
+                    }
+                    if replaces:
+                        detail["replaces_document"] = document.id
+                    await self._mark_event_success(parse_event, document=document, detail=detail)
+                await output.put(
+                    _ParsedItem(
+                        path=path, parsed=parsed, document=document, replaces=replaces, clone_source=clone_source
+                    )
+                )
+        finally:
+            for _, pending_task in window:
+                pending_task.cancel()
+            if window:
+                await asyncio.gather(*(task for _, task in window), return_exceptions=True)
+        await output.put(None)
+
+    async def _chunk_stage(
+        self,
+        job: IngestionJob,
+        source: asyncio.Queue[_ParsedItem | None],
+        output: asyncio.Queue[_ChunkedItem | None],
+    ) -> None:
+        chunk_size = job.chunk_size or self.default_chunk_size
+        chunk_overlap = job.chunk_overlap or self.default_chunk_overlap
+        while (item := await source.get()) is not None:
+            document = item.document
+            async with self._db_lock:
+                chunk_event = await self._ensure_event(
+                    job, IngestionStep.chunk_assembly, document=document, document_path=str(item.path)
+                )
+                await self._mark_event_running(chunk_event, document=document)
+                cloned = await self._clone_chunks(job, item) if item.clone_source is not None else 0
+                if cloned:
+                    await self._mark_event_success(
+                        chunk_event,
+                        document=document,
+                        detail={
+                            "chunks": cloned,
+                            "chunk_size": chunk_size,
+                            "chunk_overlap": chunk_overlap,
+                            "cloned_from": item.clone_source.id,
+                        },
+                    )
+            if cloned:
+                await output.put(
+                    _ChunkedItem(
+                        path=item.path,
+                        document=document,
+                        chunks=[],
+                        parsed=item.parsed,
+                        cloned_from=item.clone_source.id,
+                        cloned_chunks=cloned,
+                    )
+                )
+                continue
 
-            chunk_size = job.chunk_size or self.default_chunk_size
-            chunk_overlap = job.chunk_overlap or self.default_chunk_overlap
-            chunks = self._prepare_chunks(
-                parsed,
+            chunks = await asyncio.to_thread(
+                self._prepare_chunks,
+                item.parsed,
                 document_id=document.id,
-                path=Path(path),
+                path=Path(item.path),
                 job=job,
                 chunk_size=chunk_size,
                 chunk_overlap=chunk_overlap,
             )
 
-            if not chunks:
-                detail = {
-                    "chunks": 0,
-                    "chunk_size": chunk_size,
-                    "chunk_overlap": chunk_overlap,
-                    "reason": "Document did not contain chunkable content.",
+            async with self._db_lock:
+                if not chunks:
+                    detail = {
+                        "chunks": 0,
+                        "chunk_size": chunk_size,
+                        "chunk_overlap": chunk_overlap,
+                        "reason": "Document did not contain chunkable content.",
+                    }
+                    await self._mark_event_failure(chunk_event, document=document, detail=detail)
+                    raise IngestionError("No chunks produced for document")
+                chunked = _ChunkedItem(
+                    path=item.path,
+                    document=document,
+                    chunks=chunks,
+                    pending=chunks,
+                    parsed=item.parsed,
+                    replaces=item.replaces,
+                )
+                detail = {"chunks": len(chunks), "chunk_size": chunk_size, "chunk_overlap": chunk_overlap}
+                if item.replaces:
+                    self._diff_against_existing(
+                        chunked, await self.repository.list_chunk_fingerprints(document.id)
+                    )
+                    detail.update(
+                        changed_chunks=len(chunked.pending),
+                        reused_chunks=len(chunked.reused),
+                        stale_chunks=len(chunked.stale_chunk_ids),
+                    )
+                await self._mark_event_success(chunk_event, document=document, detail=detail)
+            await output.put(chunked)
+        await output.put(None)
+
+    async def _embed_stage(
+        self,
+        job: IngestionJob,
+        source: asyncio.Queue[_ChunkedItem | None],
+        output: asyncio.Queue[_EmbeddedBatch | None],
+    ) -> None:
+        while (item := await source.get()) is not None:
+            document = item.document
+            async with self._db_lock:
+                embed_event = await self._ensure_event(
+                    job, IngestionStep.embedding_indexing, document=document, document_path=str(item.path)
+                )
+                await self._mark_event_running(embed_event, document=document)
+
+            cache_before = self._embedding_cache_counts()
+            total = len(item.pending)
+            if total == 0:
+                # Nothing changed since the previous version; persistence still swaps the metadata in.
+                await output.put(
+                    _EmbeddedBatch(item=item, event=embed_event, chunks=[], embeddings=[], is_last=True, cache_detail={})
+                )
+            for offset in range(0, total, self.embed_batch_size):
+                batch = item.pending[offset : offset + self.embed_batch_size]
+                embeddings = await self._embed_chunks(batch)
+                is_last = offset + self.embed_batch_size >= total
+                cache_detail: dict[str, Any] = {}
+                if is_last:
+                    cache_after = self._embedding_cache_counts()
+                    if cache_before is not None and cache_after is not None:
+                        cache_detail["cache_hits"] = cache_after[0] - cache_before[0]
+                        cache_detail["cache_misses"] = cache_after[1] - cache_before[1]
+                await output.put(
+                    _EmbeddedBatch(
+                        item=item,
+                        event=embed_event,
+                        chunks=batch,
+                        embeddings=embeddings,
+                        is_last=is_last,
+                        cache_detail=cache_detail,
+                    )
+                )
+        await output.put(None)
+
+    async def _persist_stage(
+        self,
+        job: IngestionJob,
+        source: asyncio.Queue[_EmbeddedBatch | None],
+        persisted_documents: list[str],
+    ) -> None:
+        while (batch := await source.get()) is not None:
+            document = batch.item.document
+            # Other stages commit event updates on the shared session, so a document's chunks are written
+            # only once all of them are embedded; a failed job never leaves part of a document searchable.
+            batch.item.embedded.append((batch.chunks, batch.embeddings))
+            if not batch.is_last:
+                continue
+            async with self._db_lock:
+                if batch.item.replaces:
+                    await self._apply_replacement(job, batch.item)
+                elif batch.item.embedded:
+                    await self._persist_chunks(
+                        document_id=document.id,
+                        collection_id=job.collection_id,
+                        chunks=[chunk for chunks, _ in batch.item.embedded for chunk in chunks],
+                        embeddings=[vector for _, embeddings in batch.item.embedded for vector in embeddings],
+                    )
+                batch.item.embedded.clear()
+                await self.repository.touch_collection(job.collection_id)
+                detail: dict[str, object] = {
+                    "embedded_chunks": len(batch.item.pending),
+                    "embedding_model": getattr(self.embedder, "model_name", "unknown"),
+                    **batch.cache_detail,
                 }
-                await self._mark_event_failure(chunk_event, document=document, detail=detail)
-                raise IngestionError("No chunks produced for document")
+                if batch.item.replaces:
+                    detail.update(
+                        reused_chunks=len(batch.item.reused), deleted_chunks=len(batch.item.stale_chunk_ids)
+                    )
+                if batch.item.cloned_from is not None:
+                    detail.update(cloned_chunks=batch.item.cloned_chunks, cloned_from=batch.item.cloned_from)
+                await self._mark_event_success(batch.event, document=document, detail=detail)
+
+                citation_event = await self._ensure_event(
+                    job, IngestionStep.citation_enrichment, document=document, document_path=str(batch.item.path)
+                )
+                await self._mark_event_running(citation_event, document=document)
+                if batch.item.cloned_from is None:
+                    citation_detail: dict[str, object] = {
+                        "citations": self._build_citation_payload([chunk.metadata for chunk in batch.item.chunks])
+                    }
+                else:
+                    # Cloned chunks never pass through this stage; report the citations they were copied with.
+                    cloned_metadata = await self.repository.list_chunk_metadata(document.id)
+                    citation_detail = {
+                        "citations": self._build_citation_payload(cloned_metadata),
+                        "cloned_from": batch.item.cloned_from,
+                    }
+                await self._mark_event_success(citation_event, document=document, detail=citation_detail)
+            persisted_documents.append(document.id)
 
-            await self._mark_event_success(
-                chunk_event,
-                document=document,
-                detail={"chunks": len(chunks), "chunk_size": chunk_size, "chunk_overlap": chunk_overlap},
-            )
-            produced_any_chunks = True
+    @staticmethod
+    def _page_rows(parsed: ParsedDocument) -> list[tuple[int, str | None, str | None]]:
+        """``(page_number, image_path, mimetype)`` per page, recorded so previews need no chunk lookups."""
+
+        rows: dict[int, tuple[int, str | None, str | None]] = {}
+        for page in parsed.pages:
+            image_path = page.metadata.get("image_path")
+            if not isinstance(image_path, str) or not image_path:
+                rows[page.number] = (page.number, None, None)
+                continue
+            rows[page.number] = (page.number, image_path, mimetypes.guess_type(image_path)[0])
+        return list(rows.values())
 
-            embed_event = await self._ensure_event(job, IngestionStep.embedding_indexing, document=document, document_path=str(path))
-            await self._mark_event_running(embed_event, document=document)
+    async def _parse(self, job: IngestionJob, path: Path) -> ParsedDocument:
+        file_hash = self._known_file_hash(job, path)
+        if file_hash is None:
+            return await self.parser.parse(path)
+        return await self.parser.parse(path, file_hash=file_hash)
 
-            embeddings = await self._embed_chunks(chunks)
-            await self._persist_chunks(document_id=document.id, chunks=chunks, embeddings=embeddings)
-            await self._mark_event_success(
-                embed_event,
-                document=document,
-                detail={"embedded_chunks": len(embeddings), "embedding_model": getattr(self.embedder, "model_name", "unknown")},
-            )
+    @staticmethod
+    def _known_file_hash(job: IngestionJob, path: Path) -> str | None:
+        """SHA-256 of an uploaded source, computed by the server while it was written to disk."""
 
-            citation_event = await self._ensure_event(job, IngestionStep.citation_enrichment, document=document, document_path=str(path))
-            await self._mark_event_running(citation_event, document=document)
-            await self._mark_event_success(
-                citation_event,
-                document=document,
-                detail={"citations": self._build_citation_payload(chunks, document.id)},
-            )
+        value = job.source_sha256
+        if isinstance(value, str) and len(value) == 64 and Path(job.source) == path:
+            return value
+        return None
 
-        if not produced_any_chunks:
-            raise IngestionError("Ingestion completed without producing any chunks.")
+    @staticmethod
+    def _replace_existing(job: IngestionJob) -> bool:
+        parameters = job.parameters if isinstance(job.parameters, dict) else {}
+        return bool(parameters.get("replace_existing"))
+
+    @staticmethod
+    def _source_key(job: IngestionJob, path: Path) -> str:
+        """Identify a source across uploads: uploads are stored under random names, so prefer the original one."""
+
+        parameters = job.parameters if isinstance(job.parameters, dict) else {}
+        original = parameters.get("original_filename")
+        if isinstance(original, str) and original.strip() and Path(job.source) == path:
+            return original.strip()
+        return str(path)
+
+    def _diff_against_existing(
+        self, item: _ChunkedItem, fingerprints: Sequence[tuple[str, str | None, str | None]]
+    ) -> None:
+        """Split ``item.chunks`` into chunks whose text and vector can be kept and chunks to embed."""
+
+        model_name = getattr(self.embedder, "model_name", None)
+        reusable: dict[str, list[str]] = {}
+        stale: list[str] = []
+        for chunk_id, content_hash, embedding_model in fingerprints:
+            if content_hash and embedding_model == model_name:
+                reusable.setdefault(content_hash, []).append(chunk_id)
+            else:
+                stale.append(chunk_id)
+        pending: list[ChunkPayload] = []
+        reused: list[tuple[str, ChunkPayload]] = []
+        for chunk in item.chunks:
+            candidates = reusable.get(chunk_content_hash(chunk.content))
+            if candidates:
+                reused.append((candidates.pop(), chunk))
+            else:
+                pending.append(chunk)
+        stale.extend(chunk_id for chunk_ids in reusable.values() for chunk_id in chunk_ids)
+        item.pending, item.reused, item.stale_chunk_ids = pending, reused, stale
+
+    async def _clone_chunks(self, job: IngestionJob, item: _ParsedItem) -> int:
+        """Copy the chunks of an identical, already ingested file; returns 0 when nothing could be copied."""
+
+        source = item.clone_source
+        cloned = await self.repository.clone_chunks(
+            source,
+            item.document,
+            collection_id=job.collection_id,
+            job=job,
+            metadata_overrides={
+                "source_path": str(item.path),
+                "document_title": item.parsed.title,
+                "collection": job.collection.name if job.collection else None,
+            },
+        )
+        LOGGER.info(
+            "Reused %d chunks of document %s for %s (same file hash) | job=%s", cloned, source.id, item.path, job.id
+        )
+        return cloned
+
+    async def _apply_replacement(self, job: IngestionJob, item: _ChunkedItem) -> None:
+        """Swap in a new version of ``item.document``: keep unchanged chunks, insert changed, drop stale."""
+
+        document = item.document
+        await self.repository.delete_chunks(item.stale_chunk_ids)
+        await self.repository.update_chunk_metadata(
+            [(chunk_id, chunk.metadata) for chunk_id, chunk in item.reused], collection_id=job.collection_id
+        )
+        for chunks, embeddings in item.embedded:
+            await self._persist_chunks(
+                document_id=document.id, collection_id=job.collection_id, chunks=chunks, embeddings=embeddings
+            )
+        parsed = item.parsed
+        assert parsed is not None
+        await self.repository.replace_document(
+            document,
+            title=parsed.title or item.path.stem,
+            source_path=str(item.path),
+            collection_name=job.collection.name if job.collection else "default",
+            metadata=parsed.metadata,
+            job=job,
+        )
+        await self.repository.set_document_pages(document.id, self._page_rows(parsed))
+        LOGGER.info(
+            "Replaced document %s for job %s | reused=%d embedded=%d deleted=%d",
+            document.id,
+            job.id,
+            len(item.reused),
+            len(item.pending),
+            len(item.stale_chunk_ids),
+        )
 
     def _discover_sources(self, source: str) -> list[Path]:
         path = Path(source)
@@ -526,7 +927,7 @@ class DocumentIngestionPipeline:
             "docling_hash": document.metadata.get("docling_hash"),
         }
 
-        if document.docling_document is not None:
+        if document.resolve_docling_document() is not None:
             try:
                 chunks = self._chunk_with_hybrid(
                     document,
@@ -732,11 +1133,13 @@ class DocumentIngestionPipeline:
             if page_number not in ordered_numbers:
                 ordered_numbers.append(page_number)
 
+        # Pinning the URL to the Docling hash lets browsers cache it until the document is replaced.
+        version = f"?v={docling_hash}" if isinstance(docling_hash, str) and docling_hash else ""
         page_entries: list[dict[str, object]] = []
         for number in ordered_numbers:
             entry: dict[str, object] = {
                 "page_number": number,
-                "image_url": f"/ingestion/documents/{document_id}/pages/{number}/preview",
+                "image_url": f"/ingestion/documents/{document_id}/pages/{number}/preview{version}",
             }
             page = page_map.get(number)
             if page is not None:
@@ -748,7 +1151,7 @@ class DocumentIngestionPipeline:
         primary_page_number: int | None = ordered_numbers[0] if ordered_numbers else None
         if primary_page_number is not None:
             citation["page_number"] = primary_page_number
-            citation["image_url"] = f"/ingestion/documents/{document_id}/pages/{primary_page_number}/preview"
+            citation["image_url"] = f"/ingestion/documents/{document_id}/pages/{primary_page_number}/preview{version}"
 
         if docling_hash is not None:
             citation["docling_hash"] = docling_hash
@@ -769,14 +1172,14 @@ class DocumentIngestionPipeline:
         return citation
 
     @staticmethod
-    def _build_citation_payload(chunks: Sequence[ChunkPayload], document_id: str) -> list[dict[str, object]]:
+    def _build_citation_payload(chunk_metadata: Sequence[Mapping[str, object]]) -> list[dict[str, object]]:
         payload: list[dict[str, object]] = []
-        for chunk in chunks:
-            citation = chunk.metadata.get("citation")
+        for metadata in chunk_metadata:
+            citation = metadata.get("citation")
             if isinstance(citation, dict):
                 payload.append(
                     {
-                        "chunk_index": chunk.metadata.get("chunk_index"),
+                        "chunk_index": metadata.get("chunk_index"),
                         "page_number": citation.get("page_number"),
                         "image_url": citation.get("image_url"),
                         "image_path": citation.get("image_path"),
@@ -786,6 +1189,11 @@ class DocumentIngestionPipeline:
                 )
         return payload
 
+    def _embedding_cache_counts(self) -> tuple[int, int] | None:
+        if not isinstance(self.embedder, CachedEmbeddingClient):
+            return None
+        return self.embedder.stats.hits, self.embedder.stats.misses
+
     async def _embed_chunks(self, chunks: Sequence[ChunkPayload]) -> list[list[float]]:
         texts = [chunk.content for chunk in chunks]
         return await self.embedder.embed(texts)
@@ -794,21 +1202,21 @@ class DocumentIngestionPipeline:
         self,
         *,
         document_id: str,
+        collection_id: str | None,
         chunks: Sequence[ChunkPayload],
         embeddings: Sequence[Sequence[float]],
     ) -> None:
         if len(chunks) != len(embeddings):
             raise IngestionError("Embedding result length does not match chunk count")
-        model_name = getattr(self.embedder, "model_name", None)
-        for payload, vector in zip(chunks, embeddings, strict=True):
-            await self.repository.add_chunk(
-                document_id=document_id,
-                content=payload.content,
-                embedding=vector,
-                embedding_model=model_name,
-                metadata=payload.metadata,
-            )
-        await self.repository.commit()
+        await self.repository.add_chunks_bulk(
+            document_id=document_id,
+            collection_id=collection_id,
+            contents=[payload.content for payload in chunks],
+            embeddings=embeddings,
+            metadata=[payload.metadata for payload in chunks],
+            embedding_model=getattr(self.embedder, "model_name", None),
+            content_hashes=[chunk_content_hash(payload.content) for payload in chunks],
+        )
 
 
 __all__ = [
@@ -817,6 +1225,7 @@ __all__ = [
     "ParsedDocument",
     "ParsedPage",
     "ChunkPayload",
+    "chunk_content_hash",
     "_sanitize_page_text",
     "_split_long_tokens",
 ]
@@ -1,24 +1,25 @@
 """Ingestion endpoints."""
 from __future__ import annotations
 
+import hashlib
 import json
 import uuid
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Query, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 
 from ..auth.dependencies import get_current_user
 from ..infrastructure.database import (
     IngestionEvent,
-    IngestionEventStatus,
     IngestionJob,
-    IngestionStep,
     User,
 )
 from .dependencies import get_ingestion_service
 from .docling_images import get_locator
+from .page_previews import PreviewSize, derivative_mimetype, preview_etag, resolve_preview
 from .schemas import (
     CollectionResponse,
     IngestionEventResponse,
@@ -70,14 +71,33 @@ def _job_to_response(job: IngestionJob, events: list[IngestionEvent]) -> Ingesti
     )
 
 
-async def _store_upload(file: UploadFile, base_dir: Path) -> Path:
+# Uploads are copied to disk in slices of this size, so memory use per upload stays bounded.
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+def _write_slice(stream: BinaryIO, digest: Any, data: bytes) -> None:
+    stream.write(data)
+    digest.update(data)
+
+
+async def _store_upload(file: UploadFile, base_dir: Path) -> tuple[Path, str]:
+    """Stream ``file`` into ``base_dir`` off the event loop; returns the stored path and its SHA-256."""
+
     base_dir.mkdir(parents=True, exist_ok=True)
     suffix = Path(file.filename or "document").suffix or ".pdf"
     safe_name = f"{uuid.uuid4()}{suffix}"
     target = base_dir / safe_name
-    content = await file.read()
-    target.write_bytes(content)
-    return target
+    digest = hashlib.sha256()
+    stream = await run_in_threadpool(target.open, "wb")
+    try:
+        while data := await file.read(UPLOAD_CHUNK_BYTES):
+            await run_in_threadpool(_write_slice, stream, digest, data)
+    except BaseException:
+        await run_in_threadpool(stream.close)
+        target.unlink(missing_ok=True)
+        raise
+    await run_in_threadpool(stream.close)
+    return target, digest.hexdigest()
 
 
 @router.post("/jobs", response_model=IngestionJobResponse, status_code=201)
@@ -98,6 +118,7 @@ async def upload_jobs(
     chunk_size: int | None = Form(default=None),
     chunk_overlap: int | None = Form(default=None),
     metadata: str | None = Form(default=None),
+    replace_existing: bool = Form(default=False),
     user: User = Depends(get_current_user),
     service: IngestionService = Depends(get_ingestion_service),
 ) -> list[IngestionJobResponse]:
@@ -109,32 +130,35 @@ async def upload_jobs(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid metadata JSON") from exc
 
     settings = service.settings
-    responses: list[IngestionJobResponse] = []
-    for upload in files:
-        stored_path = await _store_upload(upload, settings.storage.upload_dir)
-        payload = IngestionJobCreate(
-            source=str(stored_path),
-            collection_name=collection,
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            metadata={**(metadata_payload or {}), "original_filename": upload.filename},
-        )
-        job = await service.create_job(user.id, payload, user.roles)
-        for step in (
-            IngestionStep.docling_parse,
-            IngestionStep.chunk_assembly,
-            IngestionStep.embedding_indexing,
-            IngestionStep.citation_enrichment,
-        ):
-            await service.create_event(
-                job=job,
-                step=step,
-                status_value=IngestionEventStatus.pending,
-                document_path=str(stored_path),
+    stored_paths: list[Path] = []
+    payloads: list[IngestionJobCreate] = []
+    source_hashes: list[str] = []
+    try:
+        for upload in files:
+            stored_path, source_sha256 = await _store_upload(upload, settings.storage.upload_dir)
+            stored_paths.append(stored_path)
+            # Lets the parser skip re-reading the file to find its Docling cache entry.
+            source_hashes.append(source_sha256)
+            payloads.append(
+                IngestionJobCreate(
+                    source=str(stored_path),
+                    collection_name=collection,
+                    chunk_size=chunk_size,
+                    chunk_overlap=chunk_overlap,
+                    metadata={
+                        **(metadata_payload or {}),
+                        "original_filename": upload.filename,
+                    },
+                    replace_existing=replace_existing,
+                )
             )
-        events = await service.list_job_events(job.id)
-        responses.append(_job_to_response(job, events))
-    return responses
+        created = await service.create_jobs(user.id, payloads, user.roles, source_hashes=source_hashes)
+    except BaseException:
+        # No job references the stored files unless every one of them was created.
+        for stored_path in stored_paths:
+            stored_path.unlink(missing_ok=True)
+        raise
+    return [_job_to_response(job, events) for job, events in created]
 
 
 @router.get("/jobs/{job_id}", response_model=IngestionJobResponse)
@@ -200,48 +224,54 @@ async def list_collections(
     "/documents/{document_id}/pages/{page_number}/preview",
     response_class=FileResponse,
     responses={
-        200: {"content": {"image/png": {}, "image/jpeg": {}}, "description": "Docling page preview"},
+        200: {
+            "content": {"image/png": {}, "image/jpeg": {}, "image/webp": {}},
+            "description": "Docling page preview",
+        },
+        304: {"description": "Preview unchanged"},
         404: {"description": "Page preview not available"},
     },
 )
 async def document_page_preview(
     document_id: str,
     page_number: int,
+    size: PreviewSize = Query("full", description="'thumb' and 'medium' serve downscaled derivatives"),
+    version: str | None = Query(None, alias="v", description="Docling hash the URL was issued for"),
+    if_none_match: str | None = Header(default=None),
     user: User = Depends(get_current_user),
     service: IngestionService = Depends(get_ingestion_service),
 ):
     if page_number <= 0:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid page number")
 
-    document = await service.get_document(document_id, user.roles)
-    metadata: dict[str, Any] = {}
-    if isinstance(document.metadata_json, dict):
-        metadata.update(document.metadata_json)
-
-    if metadata.get("docling_hash") is None or metadata.get("image_dir") is None:
-        for chunk in document.chunks:
-            chunk_meta = chunk.metadata_json or {}
-            if not isinstance(chunk_meta, dict):
-                continue
-            citation_meta = chunk_meta.get("citation")
-            if (
-                isinstance(citation_meta, dict)
-                and "docling_hash" in citation_meta
-                and "docling_hash" not in metadata
-            ):
-                metadata["docling_hash"] = citation_meta["docling_hash"]
-            page_meta = chunk_meta.get("page_metadata")
-            if isinstance(page_meta, dict):
-                for key in ("docling_hash", "image_dir"):
-                    if key in page_meta and key not in metadata:
-                        metadata[key] = page_meta[key]
-
+    preview = await service.get_page_preview(document_id, page_number, user.roles)
     locator = get_locator(service.settings.storage)
-    image_path = locator.locate_from_metadata(metadata, page_number)
+    image_path = locator.resolve_page_image(preview.image_path) if preview.image_path else None
+    if image_path is None:
+        # Pages without a recorded image are located (or materialised) from the Docling cache entry.
+        metadata: dict[str, Any] = dict(preview.metadata) if isinstance(preview.metadata, dict) else {}
+        image_path = locator.locate_from_metadata(metadata, page_number)
     if image_path is None or not image_path.exists():
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Page preview not available")
 
-    return FileResponse(image_path, media_type=locator.mimetype_for(image_path), filename=image_path.name)
+    preview_settings = service.settings.preview
+    served_path = await run_in_threadpool(resolve_preview, image_path, size, preview_settings)
+    etag = preview_etag(preview.docling_hash, page_number, size, served_path, preview_settings)
+    # Documents are replaced in place under the same id, so only a URL pinned to the current Docling
+    # hash is immutable; any other request is revalidated against the content-addressed ETag.
+    if version is not None and version == preview.docling_hash:
+        cache_control = "private, max-age=31536000, immutable"
+    else:
+        cache_control = "private, no-cache"
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if if_none_match is not None and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if served_path != image_path:
+        media_type = derivative_mimetype(preview_settings)
+    else:
+        media_type = preview.mimetype or locator.mimetype_for(served_path)
+    return FileResponse(served_path, media_type=media_type, filename=served_path.name, headers=headers)
 
 
 __all__ = ["router"]
@@ -28,6 +28,13 @@ class IngestionJobCreate(BaseModel):
         default=None,
         description="Arbitrary metadata to persist alongside ingested documents.",
     )
+    replace_existing: bool = Field(
+        False,
+        description=(
+            "Update the collection's existing document from the same source (original filename or path) in place, "
+            "re-embedding only chunks whose content changed."
+        ),
+    )
 
 
 class IngestionEventResponse(BaseModel):
@@ -5,8 +5,10 @@ import json
 import logging
 import shutil
 from pathlib import Path
+from typing import Any
 
 from fastapi import HTTPException, status
+from sqlalchemy.engine import Row
 
 from ..config import Settings, load_settings
 from ..infrastructure.database import (
@@ -45,10 +47,7 @@ class IngestionService:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Collection not accessible")
         return collection
 
-    async def create_job(self, user_id: str | None, payload: IngestionJobCreate, roles: list[Role]) -> IngestionJob:
-        if not payload.source:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Source is required")
-        collection = await self._resolve_collection(payload.collection_name, roles)
+    def _chunk_config(self, payload: IngestionJobCreate) -> tuple[int, int]:
         chunk_size = payload.chunk_size or self.settings.chunking.default_size
         chunk_overlap = payload.chunk_overlap or self.settings.chunking.default_overlap
         if chunk_size <= 0:
@@ -60,17 +59,74 @@ class IngestionService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Chunk overlap must be smaller than chunk size",
             )
+        return chunk_size, chunk_overlap
+
+    @staticmethod
+    def _job_parameters(payload: IngestionJobCreate) -> dict[str, object] | None:
+        if payload.replace_existing:
+            return {**(payload.metadata or {}), "replace_existing": True}
+        return payload.metadata
+
+    async def create_job(self, user_id: str | None, payload: IngestionJobCreate, roles: list[Role]) -> IngestionJob:
+        if not payload.source:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Source is required")
+        collection = await self._resolve_collection(payload.collection_name, roles)
+        chunk_size, chunk_overlap = self._chunk_config(payload)
         job = await self.document_repo.create_ingestion_job(
             user_id=user_id,
             source=payload.source,
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
-            parameters=payload.metadata,
+            parameters=self._job_parameters(payload),
             collection=collection,
         )
+        await self.document_repo.notify_job_pending(job.id)
         await self.document_repo.commit()
         return job
 
+    async def create_jobs(
+        self,
+        user_id: str | None,
+        payloads: list[IngestionJobCreate],
+        roles: list[Role],
+        *,
+        source_hashes: list[str] | None = None,
+    ) -> list[tuple[IngestionJob, list[IngestionEvent]]]:
+        """Create jobs for one collection, with a pending event per step, in a single transaction.
+
+        The collection and the caller's access to it are resolved once, and workers get one wake-up
+        after the commit, so every job's events exist before any of them is claimed. ``source_hashes``
+        are the SHA-256 digests the server computed for each payload's stored source.
+        """
+
+        if not payloads:
+            return []
+        if source_hashes is not None and len(source_hashes) != len(payloads):
+            raise ValueError("source_hashes must match payloads")
+        collection_names = {payload.collection_name for payload in payloads}
+        if len(collection_names) != 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Jobs must target a single collection"
+            )
+        if not all(payload.source for payload in payloads):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Source is required")
+        collection = await self._resolve_collection(collection_names.pop(), roles)
+        hashes: list[str | None] = list(source_hashes) if source_hashes is not None else [None] * len(payloads)
+        jobs = [
+            (payload.source, *self._chunk_config(payload), self._job_parameters(payload), source_hash)
+            for payload, source_hash in zip(payloads, hashes)
+        ]
+        created = await self.document_repo.create_ingestion_jobs_bulk(
+            user_id=user_id,
+            collection=collection,
+            jobs=jobs,
+            pending_steps=list(IngestionStep),
+        )
+        # One notification wakes every idle worker slot; each keeps claiming until no job is pending.
+        await self.document_repo.notify_job_pending(created[0][0].id)
+        await self.document_repo.commit()
+        return created
+
     async def get_job(self, job_id: str) -> IngestionJob:
         job = await self.document_repo.get_job(job_id)
         if job is None:
@@ -90,6 +146,18 @@ class IngestionService:
                 raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Collection not accessible")
         return document
 
+    async def get_page_preview(self, document_id: str, page_number: int, roles: list[Role]) -> Row[Any]:
+        """Resolve a page preview's location with the same access rules as ``get_document``."""
+
+        preview = await self.document_repo.get_page_preview(document_id, page_number)
+        if preview is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+        if preview.collection_id is not None:
+            allowed_collections = await self.document_repo.list_collections_for_roles(roles)
+            if preview.collection_id not in {collection.id for collection in allowed_collections}:
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Collection not accessible")
+        return preview
+
     async def list_collections(self, roles: list[Role]) -> list[Collection]:
         return await self.document_repo.list_collections_for_roles(roles)
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from dataclasses import dataclass
+from time import perf_counter
 
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -10,10 +12,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import Settings
 from ..dependencies import get_session_factory
-from ..infrastructure.database import IngestionJob, IngestionStatus
+from ..infrastructure.database import AsyncSessionFactory, IngestionJob, IngestionStatus
 from ..infrastructure.embeddings.factory import create_embedding_client
 from ..infrastructure.repositories.document_repo import DocumentRepository
 from .exceptions import IngestionError
+from .notifications import JobNotificationListener
 from .pipeline import DoclingParser, DocumentIngestionPipeline
 
 LOGGER = logging.getLogger(__name__)
@@ -31,12 +34,114 @@ async def _acquire_job(session: AsyncSession) -> IngestionJob | None:
     return result.scalars().first()
 
 
-async def process_job(session: AsyncSession, job: IngestionJob, settings: Settings) -> None:
+@dataclass(slots=True)
+class SlotStats:
+    """Throughput counters for one worker slot."""
+
+    slot: int
+    succeeded: int = 0
+    failed: int = 0
+    requeued: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    def jobs_per_hour(self, elapsed: float) -> float:
+        return self.completed * 3600.0 / elapsed if elapsed > 0 else 0.0
+
+
+async def _claim_job(session_factory: AsyncSessionFactory) -> str | None:
+    """Lock the next pending job and mark it running within the same transaction."""
+
+    async with session_factory() as session:  # type: ignore[call-arg]
+        async with session.begin():
+            job = await _acquire_job(session)
+            if job is None:
+                return None
+            job.status = IngestionStatus.running
+            job.error_message = None
+            return job.id
+
+
+async def _requeue_job(session_factory: AsyncSessionFactory, job_id: str) -> None:
+    async with session_factory() as session:  # type: ignore[call-arg]
+        repo = DocumentRepository(session)
+        await repo.requeue_job(job_id)
+        await repo.commit()
+    LOGGER.info("Requeued interrupted ingestion job %s", job_id)
+
+
+async def _wait_for_work(stop_event: asyncio.Event, wake_event: asyncio.Event, timeout: float) -> None:
+    """Sleep until a job notification arrives, the worker stops, or ``timeout`` elapses."""
+
+    waiters = [asyncio.create_task(stop_event.wait()), asyncio.create_task(wake_event.wait())]
+    try:
+        await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+    wake_event.clear()
+
+
+async def _run_slot(
+    stats: SlotStats,
+    session_factory: AsyncSessionFactory,
+    settings: Settings,
+    stop_event: asyncio.Event,
+    listener: JobNotificationListener,
+    poll_interval: float,
+) -> None:
+    while not stop_event.is_set():
+        # While LISTEN is active polling is only a safety net for missed notifications.
+        idle_timeout = settings.ingestion.fallback_poll_seconds if listener.connected else poll_interval
+        try:
+            job_id = await _claim_job(session_factory)
+        except Exception:  # noqa: BLE001 - keep the slot alive across transient database errors
+            LOGGER.exception("Ingestion slot %d failed to claim a job", stats.slot)
+            await _wait_for_work(stop_event, listener.wake_event, poll_interval)
+            continue
+        if job_id is None:
+            await _wait_for_work(stop_event, listener.wake_event, idle_timeout)
+            continue
+
+        started = perf_counter()
+        try:
+            async with session_factory() as session:  # type: ignore[call-arg]
+                job = await session.get(IngestionJob, job_id)
+                if job is None:
+                    continue
+                status = await process_job(session, job, settings)
+        except asyncio.CancelledError:
+            stats.requeued += 1
+            await asyncio.shield(_requeue_job(session_factory, job_id))
+            raise
+        duration = perf_counter() - started
+        stats.busy_seconds += duration
+        if status is IngestionStatus.success:
+            stats.succeeded += 1
+        else:
+            stats.failed += 1
+        LOGGER.info(
+            "Ingestion slot %d finished job %s | status=%s duration=%.1fs succeeded=%d failed=%d busy=%.1fs",
+            stats.slot,
+            job_id,
+            status.value,
+            duration,
+            stats.succeeded,
+            stats.failed,
+            stats.busy_seconds,
+        )
+
+
+async def process_job(session: AsyncSession, job: IngestionJob, settings: Settings) -> IngestionStatus:
     repo = DocumentRepository(session)
+    job_id = job.id
     await repo.update_job_status(job, status=IngestionStatus.running)
     await repo.commit()
     try:
-        LOGGER.info("Processing ingestion job %s from %s", job.id, job.source)
+        LOGGER.info("Processing ingestion job %s from %s", job_id, job.source)
         await session.refresh(job, attribute_names=["collection", "events"])
         parser = DoclingParser(
             storage_settings=settings.storage,
@@ -49,31 +154,90 @@ async def process_job(session: AsyncSession, job: IngestionJob, settings: Settin
             embedder,
             chunk_size=settings.chunking.default_size,
             chunk_overlap=settings.chunking.default_overlap,
+            queue_size=settings.ingestion.queue_size,
+            embed_batch_size=settings.ingestion.embed_batch_size,
+            parse_concurrency=max(1, settings.docling.worker_processes),
         )
         await pipeline.run(job)
         await repo.update_job_status(job, status=IngestionStatus.success)
         await repo.commit()
     except (IngestionError, FileNotFoundError) as exc:
-        LOGGER.warning("Ingestion job %s failed: %s", job.id, exc)
-        await repo.update_job_status(job, status=IngestionStatus.failed, error_message=str(exc))
-        await repo.commit()
+        LOGGER.warning("Ingestion job %s failed: %s", job_id, exc)
+        await _mark_failed(repo, job, exc)
     except Exception as exc:  # noqa: BLE001
-        LOGGER.exception("Ingestion job %s failed", job.id)
-        await repo.update_job_status(job, status=IngestionStatus.failed, error_message=str(exc))
-        await repo.commit()
+        LOGGER.exception("Ingestion job %s failed", job_id)
+        await _mark_failed(repo, job, exc)
+    return job.status
+
 
+async def _mark_failed(repo: DocumentRepository, job: IngestionJob, exc: BaseException) -> None:
+    # Discard uncommitted work first: it must not be committed with the status, and an aborted
+    # transaction would make that commit raise and leave the job stuck in ``running``.
+    await repo.rollback()
+    await repo.update_job_status(job, status=IngestionStatus.failed, error_message=str(exc))
+    await repo.commit()
+
+
+async def worker_loop(
+    settings: Settings,
+    poll_interval: float = 2.0,
+    *,
+    stop_event: asyncio.Event | None = None,
+) -> None:
+    """Process pending jobs in ``settings.ingestion.worker_concurrency`` parallel slots until stopped.
+
+    Once ``stop_event`` is set, slots stop claiming work and in-flight jobs get
+    ``settings.ingestion.shutdown_grace_seconds`` to finish; jobs still running after that are
+    cancelled and put back to ``pending`` so another worker can pick them up.
+    """
 
-async def worker_loop(settings: Settings, poll_interval: float = 2.0) -> None:
     session_factory = get_session_factory()
-    while True:
-        async with session_factory() as session:  # type: ignore[call-arg]
-            async with session.begin():
-                job = await _acquire_job(session)
-                if job is None:
-                    await asyncio.sleep(poll_interval)
-                    continue
-            await process_job(session, job, settings)
-        await asyncio.sleep(0)
+    stop_event = stop_event or asyncio.Event()
+    listener = JobNotificationListener(settings, asyncio.Event())
+    listener_task = asyncio.create_task(listener.run(stop_event), name="ingestion-job-listener")
+    concurrency = max(1, settings.ingestion.worker_concurrency)
+    stats = [SlotStats(slot=index) for index in range(concurrency)]
+    slots = [
+        asyncio.create_task(
+            _run_slot(slot_stats, session_factory, settings, stop_event, listener, poll_interval),
+            name=f"ingestion-slot-{slot_stats.slot}",
+        )
+        for slot_stats in stats
+    ]
+    started = perf_counter()
+    LOGGER.info("Ingestion worker started | slots=%d notifications=%s", concurrency, listener.enabled)
+    try:
+        stop_waiter = asyncio.create_task(stop_event.wait())
+        await asyncio.wait([stop_waiter, *slots], return_when=asyncio.FIRST_COMPLETED)
+        stop_waiter.cancel()
+        stop_event.set()
+        grace = settings.ingestion.shutdown_grace_seconds
+        LOGGER.info("Ingestion worker stopping | waiting up to %.0fs for in-flight jobs", grace)
+        _, pending = await asyncio.wait(slots, timeout=grace)
+        for task in pending:
+            task.cancel()
+    finally:
+        listener_task.cancel()
+        for task in slots:
+            task.cancel()
+        await asyncio.gather(listener_task, return_exceptions=True)
+        results = await asyncio.gather(*slots, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                LOGGER.error("Ingestion slot crashed", exc_info=result)
+        elapsed = perf_counter() - started
+        for slot_stats in stats:
+            LOGGER.info(
+                "Ingestion slot %d summary | succeeded=%d failed=%d requeued=%d busy=%.1fs "
+                "utilisation=%.0f%% throughput=%.1f jobs/h",
+                slot_stats.slot,
+                slot_stats.succeeded,
+                slot_stats.failed,
+                slot_stats.requeued,
+                slot_stats.busy_seconds,
+                100.0 * slot_stats.busy_seconds / elapsed if elapsed > 0 else 0.0,
+                slot_stats.jobs_per_hour(elapsed),
+            )
 
 
-__all__ = ["worker_loop", "process_job"]
+__all__ = ["worker_loop", "process_job", "SlotStats"]
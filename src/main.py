@@ -30,6 +30,7 @@ from .ingestion.router import router as ingestion_router
 from .logging import setup_logging
 from .retrieval.router import router as retrieval_router
 from .infrastructure.database import RoleCategory
+from .infrastructure.llm.http import close_http_client
 from .infrastructure.repositories.document_repo import DocumentRepository
 from .infrastructure.repositories.user_repo import UserRepository
 
@@ -174,6 +175,10 @@ def create_app() -> FastAPI:
     async def _bootstrap_admin_user() -> None:
         await _ensure_bootstrap_admin()
 
+    @app.on_event("shutdown")
+    async def _close_llm_http_client() -> None:
+        await close_http_client()
+
     return app
 
 
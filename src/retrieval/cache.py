@@ -0,0 +1,165 @@
+"""Semantic cache that replays answers to questions similar to ones already answered."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import AnswerCacheSettings
+from ..infrastructure.database import AnswerCacheEntry, Collection
+from ..infrastructure.embeddings.base import EmbeddingClient
+from ..infrastructure.embeddings.query_cache import QueryEmbeddingCache
+
+LOGGER = logging.getLogger(__name__)
+
+UNSCOPED_KEY = "*"
+
+
+def scope_key(collection_ids: Sequence[str] | None) -> str:
+    """Return a stable key for the set of collections an answer was retrieved from."""
+
+    if collection_ids is None:
+        return UNSCOPED_KEY
+    joined = ",".join(sorted(set(collection_ids)))
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+def _cosine_similarity(left: Sequence[float], right: Sequence[float]) -> float:
+    dot = sum(a * b for a, b in zip(left, right))
+    norm = math.sqrt(sum(a * a for a in left)) * math.sqrt(sum(b * b for b in right))
+    return dot / norm if norm else 0.0
+
+
+@dataclass(slots=True)
+class CachedAnswer:
+    """An answer previously generated for a similar question."""
+
+    query: str
+    answer: str
+    similarity: float
+    context: list[dict[str, Any]] = field(default_factory=list)
+    citations: list[dict[str, Any]] = field(default_factory=list)
+
+
+class SemanticAnswerCache:
+    """Look up and store chat answers keyed by query embedding, collection scope and model.
+
+    Entries expire after ``ttl_seconds`` and are ignored once any collection in their scope
+    has changed (``Collection.updated_at`` is bumped whenever ingestion adds or removes
+    documents). The scope must match exactly, so an answer is only replayed to users who
+    can see precisely the collections it was built from.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        embedder: EmbeddingClient,
+        *,
+        model_key: str,
+        settings: AnswerCacheSettings | None = None,
+        query_cache: QueryEmbeddingCache | None = None,
+    ) -> None:
+        self.session = session
+        self.embedder = embedder
+        self.model_key = model_key
+        self.settings = settings or AnswerCacheSettings()
+        # Shared with the vector store so a cache miss does not embed the question twice.
+        self.query_cache = query_cache
+
+    async def embed_query(self, query: str) -> list[float]:
+        if self.query_cache is not None:
+            vector, _hit = await self.query_cache.embed(self.embedder, query)
+            return vector
+        return list((await self.embedder.embed([query]))[0])
+
+    def _entry_model_key(self, mode: str) -> str:
+        return f"{self.model_key}|mode={mode}"
+
+    async def lookup(
+        self, query_vector: Sequence[float], collection_ids: Sequence[str] | None, *, mode: str
+    ) -> CachedAnswer | None:
+        """Return the closest fresh entry above the similarity threshold, if any.
+
+        ``mode`` is the normalised search mode; answers are only replayed for the mode that produced them.
+        """
+
+        if collection_ids is not None and not collection_ids:
+            return None
+        now = datetime.now(timezone.utc)
+        last_change = select(func.max(Collection.updated_at))
+        if collection_ids is not None:
+            last_change = last_change.where(Collection.id.in_(list(collection_ids)))
+        last_change_subquery = last_change.scalar_subquery()
+        stmt = select(AnswerCacheEntry).where(
+            AnswerCacheEntry.scope_key == scope_key(collection_ids),
+            AnswerCacheEntry.model_key == self._entry_model_key(mode),
+            AnswerCacheEntry.expires_at > now,
+            or_(last_change_subquery.is_(None), AnswerCacheEntry.created_at > last_change_subquery),
+        )
+
+        best: AnswerCacheEntry | None = None
+        similarity = 0.0
+        if self.session.get_bind().dialect.name == "postgresql":
+            distance = AnswerCacheEntry.query_embedding.cosine_distance(list(query_vector)).label("distance")
+            row = (await self.session.execute(stmt.add_columns(distance).order_by(distance).limit(1))).first()
+            if row is not None:
+                best, similarity = row[0], 1.0 - float(row[1])
+        else:
+            candidates = await self.session.execute(
+                stmt.order_by(AnswerCacheEntry.created_at.desc()).limit(self.settings.max_candidates)
+            )
+            for entry in candidates.scalars():
+                score = _cosine_similarity(query_vector, [float(value) for value in entry.query_embedding])
+                if score > similarity:
+                    best, similarity = entry, score
+
+        if best is None or similarity < self.settings.similarity_threshold:
+            LOGGER.debug("Answer cache miss | model=%s best_similarity=%.3f", self.model_key, similarity)
+            return None
+        LOGGER.info("Answer cache hit | model=%s similarity=%.3f cached_query=%r", self.model_key, similarity, best.query)
+        return CachedAnswer(
+            query=best.query,
+            answer=best.answer,
+            similarity=similarity,
+            context=list(best.context_json or []),
+            citations=list(best.citations_json or []),
+        )
+
+    async def store(
+        self,
+        *,
+        query: str,
+        query_vector: Sequence[float],
+        collection_ids: Sequence[str] | None,
+        mode: str,
+        answer: str,
+        context: list[dict[str, Any]],
+        citations: list[dict[str, Any]],
+    ) -> None:
+        """Add an entry and drop expired ones; committed with the caller's transaction."""
+
+        now = datetime.now(timezone.utc)
+        await self.session.execute(delete(AnswerCacheEntry).where(AnswerCacheEntry.expires_at <= now))
+        self.session.add(
+            AnswerCacheEntry(
+                scope_key=scope_key(collection_ids),
+                model_key=self._entry_model_key(mode),
+                query=query,
+                query_embedding=list(query_vector),
+                answer=answer,
+                context_json=context or None,
+                citations_json=citations or None,
+                expires_at=now + timedelta(seconds=self.settings.ttl_seconds),
+            )
+        )
+        await self.session.flush()
+
+
+__all__ = ["CachedAnswer", "SemanticAnswerCache", "scope_key"]
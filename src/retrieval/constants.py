@@ -2,6 +2,16 @@
 
 DEFAULT_RETRIEVAL_MODE = "rag"
 GRAPH_RAG_MODE_ALIAS = "graphrag"
+HYBRID_MODE = "hybrid"
 DEFAULT_CHAT_TITLE = "New session"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
 
-__all__ = ["DEFAULT_RETRIEVAL_MODE", "GRAPH_RAG_MODE_ALIAS", "DEFAULT_CHAT_TITLE"]
+__all__ = [
+    "DEFAULT_RETRIEVAL_MODE",
+    "GRAPH_RAG_MODE_ALIAS",
+    "HYBRID_MODE",
+    "DEFAULT_CHAT_TITLE",
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+]
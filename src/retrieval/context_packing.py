@@ -0,0 +1,178 @@
+"""Fit retrieved chunks into a token budget before they are sent to the LLM."""
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+from ..config import RetrievalSettings
+
+if TYPE_CHECKING:  # pragma: no cover - imported for typing only
+    from .strategies.rag import RetrievedChunk
+
+# Truncating a chunk to fewer tokens than this is not worth the header it carries.
+_MIN_TRUNCATED_TOKENS = 32
+
+
+def estimate_tokens(text: str, *, chars_per_token: float = 4.0) -> int:
+    """Approximate the token count of ``text``; good enough for budgeting, not for billing."""
+
+    if not text:
+        return 0
+    return math.ceil(len(text) / chars_per_token)
+
+
+def _overlap_length(left: str, right: str, minimum: int) -> int:
+    """Length of the longest suffix of ``left`` that is also a prefix of ``right``."""
+
+    for length in range(min(len(left), len(right)) - 1, minimum - 1, -1):
+        if right.startswith(left[-length:]):
+            return length
+    return 0
+
+
+def _span(chunk: "RetrievedChunk") -> tuple[int, int, int] | None:
+    metadata = chunk.chunk_metadata
+    values = (metadata.get("chunk_index"), metadata.get("character_start"), metadata.get("character_end"))
+    if not all(isinstance(value, int) for value in values):
+        return None
+    return values  # type: ignore[return-value]
+
+
+def _continues(previous: "RetrievedChunk", following: "RetrievedChunk") -> bool:
+    """Whether ``following`` is the next window over the same text as ``previous``.
+
+    Chunk offsets are relative to the text that was sliced (a page, or one Docling chunk), so the
+    windows must also share a page and start inside or right at the end of the previous window.
+    """
+
+    left, right = _span(previous), _span(following)
+    if left is None or right is None or previous.document_id != following.document_id:
+        return False
+    if previous.chunk_metadata.get("page_number") != following.chunk_metadata.get("page_number"):
+        return False
+    return right[0] == left[0] + 1 and left[1] < right[1] <= left[2]
+
+
+def _merge_run(run: list["RetrievedChunk"]) -> "RetrievedChunk":
+    first = run[0]
+    content = first.content
+    end = _span(first)[2]  # type: ignore[index]
+    for chunk in run[1:]:
+        _index, start, chunk_end = _span(chunk)  # type: ignore[misc]
+        content += chunk.content[end - start :]
+        end = chunk_end
+    metadata: dict[str, Any] = {
+        **first.chunk_metadata,
+        "character_end": end,
+        "chunk_indices": [chunk.chunk_metadata["chunk_index"] for chunk in run],
+    }
+    scores = [chunk.score for chunk in run if chunk.score is not None]
+    return replace(
+        first,
+        content=content,
+        score=max(scores) if scores else None,
+        chunk_metadata=metadata,
+        merged_chunk_ids=[chunk.chunk_id for chunk in run if chunk.chunk_id],
+    )
+
+
+def merge_adjacent_chunks(chunks: Sequence["RetrievedChunk"]) -> list["RetrievedChunk"]:
+    """Coalesce retrieved chunks that are consecutive, overlapping windows of the same text.
+
+    The merged block takes the rank of its best-ranked member; its content is the union of the
+    windows with the overlap included once.
+    """
+
+    by_document: dict[str, list[tuple[int, "RetrievedChunk"]]] = {}
+    for rank, chunk in enumerate(chunks):
+        if chunk.document_id and _span(chunk) is not None:
+            by_document.setdefault(chunk.document_id, []).append((rank, chunk))
+
+    replacement: dict[int, "RetrievedChunk"] = {}
+    absorbed: set[int] = set()
+    for members in by_document.values():
+        members.sort(key=lambda item: item[1].chunk_metadata["chunk_index"])
+        runs: list[list[tuple[int, "RetrievedChunk"]]] = [[members[0]]]
+        for item in members[1:]:
+            if _continues(runs[-1][-1][1], item[1]):
+                runs[-1].append(item)
+            else:
+                runs.append([item])
+        for run in runs:
+            if len(run) < 2:
+                continue
+            best_rank = min(rank for rank, _chunk in run)
+            replacement[best_rank] = _merge_run([chunk for _rank, chunk in run])
+            absorbed.update(rank for rank, _chunk in run if rank != best_rank)
+
+    return [replacement.get(rank, chunk) for rank, chunk in enumerate(chunks) if rank not in absorbed]
+
+
+@dataclass(slots=True)
+class PackedContext:
+    """Chunks selected for the prompt, relabelled ``[1]..[n]``, with their estimated token cost."""
+
+    chunks: list["RetrievedChunk"] = field(default_factory=list)
+    tokens: int = 0
+    dropped: int = 0
+    deduplicated_chars: int = 0
+
+    def blocks(self) -> list[str]:
+        return [chunk.llm_block() for chunk in self.chunks]
+
+
+def pack_context(chunks: Sequence["RetrievedChunk"], settings: RetrievalSettings) -> PackedContext:
+    """Select chunks in rank order until ``settings.context_token_budget`` is spent.
+
+    Neighbouring windows of one text are first merged into single blocks (when enabled). Remaining
+    text a chunk shares with an already selected chunk of the same document (the overlap between
+    neighbouring chunking windows) is cut, chunks fully contained in one are skipped, and the first
+    chunk that does not fit is truncated when enough budget remains for it to be useful.
+    """
+
+    if settings.merge_adjacent_chunks:
+        chunks = merge_adjacent_chunks(chunks)
+    packed = PackedContext()
+    kept_by_document: dict[str, list[str]] = {}
+    for chunk in chunks:
+        content = chunk.content.strip()
+        siblings = kept_by_document.get(chunk.document_id, []) if chunk.document_id else []
+        original_length = len(content)
+        if any(content in sibling for sibling in siblings):
+            content = ""
+        for sibling in siblings:
+            if not content:
+                break
+            head = _overlap_length(sibling, content, settings.min_overlap_chars)
+            if head:
+                content = content[head:].lstrip()
+            tail = _overlap_length(content, sibling, settings.min_overlap_chars)
+            if tail:
+                content = content[: len(content) - tail].rstrip()
+        packed.deduplicated_chars += original_length - len(content)
+        if not content:
+            continue
+
+        candidate = replace(chunk, label=f"[{len(packed.chunks) + 1}]", content=content)
+        cost = estimate_tokens(candidate.llm_block(), chars_per_token=settings.chars_per_token)
+        remaining = settings.context_token_budget - packed.tokens
+        if cost > remaining:
+            header_cost = estimate_tokens(candidate.citation_header(), chars_per_token=settings.chars_per_token)
+            available = remaining - header_cost - 1
+            if available >= _MIN_TRUNCATED_TOKENS or not packed.chunks:
+                truncated = content[: max(0, int(available * settings.chars_per_token) - 1)].rstrip() + "…"
+                candidate = replace(candidate, content=truncated)
+                packed.chunks.append(candidate)
+                packed.tokens += estimate_tokens(candidate.llm_block(), chars_per_token=settings.chars_per_token)
+            break
+        packed.chunks.append(candidate)
+        packed.tokens += cost
+        if chunk.document_id:
+            kept_by_document.setdefault(chunk.document_id, []).append(content)
+    packed.dropped = len(chunks) - len(packed.chunks)
+    return packed
+
+
+__all__ = ["PackedContext", "estimate_tokens", "merge_adjacent_chunks", "pack_context"]
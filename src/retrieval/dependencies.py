@@ -1,18 +1,26 @@
 """Dependencies for retrieval module."""
 from __future__ import annotations
 
+import hashlib
+import json
 from functools import lru_cache
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .. import dependencies
+from ..config import Settings
 from ..dependencies import get_db_session, get_settings
 from ..infrastructure.embeddings.factory import create_embedding_client
+from ..infrastructure.embeddings.query_cache import get_query_embedding_cache
 from ..infrastructure.llm.ollama import OllamaClient
 from ..infrastructure.llm.vllm import VLLMClient
+from ..infrastructure.rerank.factory import create_reranker
 from ..infrastructure.repositories.conversation_repo import ConversationRepository
+from ..infrastructure.repositories.document_repo import DocumentRepository
 from ..infrastructure.vectorstore.graphrag_engine import GraphRAGQueryEngine
 from ..infrastructure.vectorstore.pgvector import PGVectorStore
+from .cache import SemanticAnswerCache
 from .service import RetrievalService
 from .strategies.graphrag import GraphRAGStrategy
 from .strategies.rag import RAGStrategy
@@ -24,15 +32,65 @@ def _get_graph_rag_engine() -> GraphRAGQueryEngine:
     return GraphRAGQueryEngine(settings.graphrag)
 
 
+def _prompt_settings_key(settings: Settings) -> str:
+    """Short digest of the settings that decide which chunks reach the prompt and how they are packed."""
+
+    shaping = {
+        "retrieval": settings.retrieval.model_dump(mode="json"),
+        "rerank": {"candidates": settings.rerank.candidates, "top_k": settings.rerank.top_k},
+        "hybrid": {
+            "candidates": settings.vectorstore.hybrid_candidates,
+            "rrf_k": settings.vectorstore.rrf_k,
+            "text_search_config": settings.vectorstore.text_search_config,
+        },
+    }
+    return hashlib.sha256(json.dumps(shaping, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
 async def get_retrieval_service(session: AsyncSession = Depends(get_db_session)) -> RetrievalService:
     settings = get_settings()
     embedder = create_embedding_client(settings)
-    vector_store = PGVectorStore(session, embedder)
+    query_cache = None
+    if settings.vectorstore.query_cache_size > 0:
+        query_cache = get_query_embedding_cache(
+            settings.vectorstore.query_cache_size, settings.vectorstore.query_cache_ttl_seconds
+        )
+    vector_store = PGVectorStore(
+        session,
+        embedder,
+        settings=settings.vectorstore,
+        query_cache=query_cache,
+        session_factory=dependencies.get_session_factory(),
+    )
     llm_client = OllamaClient(settings) if settings.llm.provider == "ollama" else VLLMClient(settings)
-    rag_strategy = RAGStrategy(vector_store, llm_client)
+    reranker = create_reranker(settings)
+    answer_cache = None
+    if settings.answer_cache.enabled:
+        llm_model = settings.llm.ollama_model if settings.llm.provider == "ollama" else settings.llm.vllm_model
+        model_key = f"{settings.llm.provider}:{llm_model}|{embedder.model_name}"
+        if reranker is not None:
+            model_key += f"|{reranker.model_name}"
+        # Changing how context is retrieved or packed must not replay answers built from the old prompt.
+        model_key += f"|prompt={_prompt_settings_key(settings)}"
+        answer_cache = SemanticAnswerCache(
+            session,
+            embedder,
+            model_key=model_key,
+            settings=settings.answer_cache,
+            query_cache=query_cache,
+        )
+    rag_strategy = RAGStrategy(
+        vector_store,
+        llm_client,
+        answer_cache=answer_cache,
+        reranker=reranker,
+        rerank_candidates=settings.rerank.candidates,
+        top_k=settings.rerank.top_k,
+        context_settings=settings.retrieval,
+    )
     graphrag_strategy = GraphRAGStrategy(_get_graph_rag_engine())
     repo = ConversationRepository(session)
-    return RetrievalService(repo, rag_strategy, graphrag_strategy)
+    return RetrievalService(repo, rag_strategy, graphrag_strategy, document_repo=DocumentRepository(session))
 
 
 __all__ = ["get_retrieval_service"]
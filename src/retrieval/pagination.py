@@ -0,0 +1,41 @@
+"""Opaque keyset cursors for paginated chat listings."""
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, TypeVar
+
+ItemT = TypeVar("ItemT")
+
+
+@dataclass(slots=True)
+class Page(Generic[ItemT]):
+    """One page of results plus the cursor of the next (older) page, if any."""
+
+    items: list[ItemT] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def encode_cursor(timestamp: datetime, row_id: str) -> str:
+    """Encode the sort key of the last row on a page."""
+
+    raw = f"{timestamp.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by :func:`encode_cursor`; raises ``ValueError`` if malformed."""
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("Malformed cursor") from exc
+    timestamp, separator, row_id = raw.partition("|")
+    if not separator or not row_id:
+        raise ValueError("Malformed cursor")
+    return datetime.fromisoformat(timestamp), row_id
+
+
+__all__ = ["Page", "decode_cursor", "encode_cursor"]
@@ -3,17 +3,20 @@ from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from fastapi.responses import StreamingResponse
 
 from ..auth.dependencies import get_current_user
 from ..infrastructure.database import User
+from .constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from .dependencies import get_retrieval_service
 from .schemas import ChatMessageRequest, ChatMessageResponse, ChatSessionCreate, ChatSessionResponse
 from .service import RetrievalService
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 def _derive_citations(context: list[dict[str, Any]] | None) -> list[dict[str, object]] | None:
     """Extract a concise citation payload from persisted context."""
@@ -84,11 +87,16 @@ async def create_session(
 
 @router.get("/sessions", response_model=list[ChatSessionResponse])
 async def list_sessions(
+    response: Response,
+    before: str | None = Query(default=None, description="Cursor from a previous page's X-Next-Cursor header"),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     user: User = Depends(get_current_user),
     service: RetrievalService = Depends(get_retrieval_service),
 ) -> list[ChatSessionResponse]:
-    sessions = await service.list_sessions(user.id)
-    return [ChatSessionResponse(id=conv.id, title=conv.title, created_at=conv.created_at) for conv in sessions]
+    page = await service.list_sessions(user.id, before=before, limit=limit)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return [ChatSessionResponse(id=conv.id, title=conv.title, created_at=conv.created_at) for conv in page.items]
 
 @router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_session(
@@ -101,19 +109,27 @@ async def delete_session(
 @router.get("/{session_id}/messages", response_model=list[ChatMessageResponse])
 async def list_messages(
     session_id: str,
+    response: Response,
+    before: str | None = Query(default=None, description="Cursor from a previous page's X-Next-Cursor header"),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    include_context: bool = Query(default=True, description="Include retrieved context and citations"),
     user: User = Depends(get_current_user),
     service: RetrievalService = Depends(get_retrieval_service),
 ) -> list[ChatMessageResponse]:
-    messages = await service.get_messages(session_id, user.id)
+    page = await service.get_messages(
+        session_id, user.id, before=before, limit=limit, include_context=include_context
+    )
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
     return [
         ChatMessageResponse(
             role=msg.role,
             content=msg.content,
             created_at=msg.created_at,
-            context=getattr(msg, "context_json", None),
-            citations=_derive_citations(getattr(msg, "context_json", None)),
+            context=msg.context_json if include_context else None,
+            citations=_derive_citations(msg.context_json) if include_context else None,
         )
-        for msg in messages
+        for msg in page.items
     ]
 
 
@@ -130,6 +146,8 @@ async def send_message(
         query=payload.query,
         roles=[role.name for role in user.roles],
         mode=payload.mode,
+        workspace_roles=list(user.roles),
+        is_superuser=bool(user.is_superuser),
     )
     response = StreamingResponse(
         stream,
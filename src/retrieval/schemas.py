@@ -19,7 +19,10 @@ class ChatSessionResponse(BaseModel):
 
 class ChatMessageRequest(BaseModel):
     query: str
-    mode: Optional[str] = None
+    mode: Optional[str] = Field(
+        default=None,
+        description="Retrieval mode: 'rag' (vector search, default), 'hybrid' (full-text + vector) or 'graphrag'",
+    )
 
 
 class ChatMessageResponse(BaseModel):
@@ -4,13 +4,17 @@ from __future__ import annotations
 import json
 import logging
 from collections.abc import AsyncGenerator
+from datetime import datetime
 from time import perf_counter
-from typing import Iterable
+from typing import Iterable, Sequence
 
 from fastapi import HTTPException, status
 
+from ..infrastructure.database import Conversation, Message, Role
 from ..infrastructure.repositories.conversation_repo import ConversationRepository
-from .constants import DEFAULT_CHAT_TITLE, GRAPH_RAG_MODE_ALIAS
+from ..infrastructure.repositories.document_repo import DocumentRepository
+from .constants import DEFAULT_CHAT_TITLE, DEFAULT_PAGE_SIZE, GRAPH_RAG_MODE_ALIAS
+from .pagination import Page, decode_cursor, encode_cursor
 from .stream import StreamEvent
 from .strategies.base import RetrievalContext, RetrievalStrategy
 
@@ -25,23 +29,70 @@ class RetrievalService:
         conversation_repo: ConversationRepository,
         rag_strategy: RetrievalStrategy,
         graphrag_strategy: RetrievalStrategy,
+        *,
+        document_repo: DocumentRepository | None = None,
     ) -> None:
         self.conversation_repo = conversation_repo
         self.rag_strategy = rag_strategy
         self.graphrag_strategy = graphrag_strategy
+        self.document_repo = document_repo
 
     async def create_session(self, user_id: str, title: str | None = None):
         return await self.conversation_repo.create_conversation(user_id=user_id, title=title)
 
-    async def list_sessions(self, user_id: str):
-        sessions = await self.conversation_repo.filter_by(user_id=user_id)
-        return list(sessions)
+    async def list_sessions(
+        self,
+        user_id: str,
+        *,
+        before: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Conversation]:
+        """Return the user's most recently active sessions, paginated by ``before`` cursor."""
+
+        rows = await self.conversation_repo.list_conversations(
+            user_id, limit=limit + 1, before=self._decode_cursor(before)
+        )
+        page = Page(items=rows[:limit])
+        if len(rows) > limit:
+            last = page.items[-1]
+            page.next_cursor = encode_cursor(last.updated_at, last.id)
+        return page
+
+    async def get_messages(
+        self,
+        conversation_id: str,
+        user_id: str,
+        *,
+        before: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        include_context: bool = True,
+    ) -> Page[Message]:
+        """Return the latest messages before ``before`` in chronological order."""
 
-    async def get_messages(self, conversation_id: str, user_id: str):
         conversation = await self.conversation_repo.get_conversation(conversation_id, user_id)
         if conversation is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
-        return await self.conversation_repo.list_messages(conversation_id)
+        rows = await self.conversation_repo.list_messages(
+            conversation_id,
+            limit=limit + 1,
+            before=self._decode_cursor(before),
+            include_context=include_context,
+        )
+        newest_first = rows[:limit]
+        page = Page(items=list(reversed(newest_first)))
+        if len(rows) > limit:
+            oldest = newest_first[-1]
+            page.next_cursor = encode_cursor(oldest.created_at, oldest.id)
+        return page
+
+    @staticmethod
+    def _decode_cursor(cursor: str | None) -> tuple[datetime, str] | None:
+        if not cursor:
+            return None
+        try:
+            return decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor") from exc
 
     async def delete_session(self, conversation_id: str, user_id: str) -> None:
         conversation = await self.conversation_repo.get_conversation(conversation_id, user_id)
@@ -57,6 +108,18 @@ class RetrievalService:
             return self.graphrag_strategy
         return self.rag_strategy
 
+    async def _resolve_collection_scope(
+        self,
+        workspace_roles: Sequence[Role] | None,
+        *,
+        is_superuser: bool,
+    ) -> list[str] | None:
+        """Return the collection ids retrieval is limited to, or ``None`` for unscoped search."""
+
+        if self.document_repo is None or workspace_roles is None or is_superuser:
+            return None
+        return await self.document_repo.list_collection_ids_for_roles(workspace_roles)
+
     async def send_message(
         self,
         *,
@@ -65,6 +128,8 @@ class RetrievalService:
         query: str,
         roles: list[str],
         mode: str | None,
+        workspace_roles: Sequence[Role] | None = None,
+        is_superuser: bool = False,
     ) -> AsyncGenerator[bytes, None]:
         conversation = await self.conversation_repo.get_conversation(conversation_id, user_id)
         if conversation is None:
@@ -77,15 +142,23 @@ class RetrievalService:
         await self.conversation_repo.commit()
 
         strategy = self._resolve_strategy(roles, mode)
-        context = RetrievalContext(conversation_id=conversation_id, query=query, mode=mode, user_roles=roles)
+        collection_ids = await self._resolve_collection_scope(workspace_roles, is_superuser=is_superuser)
+        context = RetrievalContext(
+            conversation_id=conversation_id,
+            query=query,
+            mode=mode,
+            user_roles=roles,
+            collection_ids=collection_ids,
+        )
 
         async def _stream() -> AsyncGenerator[bytes, None]:
             LOGGER.info(
-                "Chat stream started | conversation=%s user=%s mode=%s roles=%s",
+                "Chat stream started | conversation=%s user=%s mode=%s roles=%s collections=%s",
                 conversation_id,
                 user_id,
                 mode or "default",
                 roles,
+                "all" if collection_ids is None else len(collection_ids),
             )
             stream_start = perf_counter()
             tokens: list[str] = []
@@ -16,6 +16,8 @@ class RetrievalContext:
     query: str
     mode: str | None
     user_roles: Iterable[str]
+    # ``None`` leaves retrieval unscoped; an empty list means no collection is accessible.
+    collection_ids: list[str] | None = None
 
 
 class RetrievalStrategy(ABC):
@@ -1,15 +1,19 @@
 """Vector-store backed retrieval strategy."""
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import AsyncGenerator, Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from time import perf_counter
 from typing import Any
 
+from ...config import RetrievalSettings
 from ...infrastructure.llm.base import LLMClient
+from ...infrastructure.rerank.base import Reranker
 from ...infrastructure.vectorstore.base import VectorStoreClient
+from ..cache import CachedAnswer, SemanticAnswerCache
+from ..constants import HYBRID_MODE
+from ..context_packing import estimate_tokens, pack_context
 from ..stream import StreamEvent
 from .base import RetrievalContext, RetrievalStrategy
 
@@ -29,18 +33,23 @@ class RetrievedChunk:
     chunk_metadata: dict[str, Any]
     document_title: str | None
     document_metadata: dict[str, Any]
+    # Set when neighbouring chunks were coalesced into this block; lists every chunk it covers.
+    merged_chunk_ids: list[str] = field(default_factory=list)
+
+    def citation_header(self) -> str:
+        """Label plus just enough provenance for the model to cite: title and page."""
+
+        citation = self.citation_payload()
+        source = self.document_title or citation["source"]
+        parts = [self.label]
+        if source:
+            parts.append(str(source))
+        if citation["page"] is not None:
+            parts.append(f"(p. {citation['page']})")
+        return " ".join(parts)
 
     def llm_block(self) -> str:
-        metadata_blob = {
-            "chunk": self.chunk_metadata,
-            "document": self.document_metadata,
-            "document_id": self.document_id,
-            "chunk_id": self.chunk_id,
-            "title": self.document_title,
-            "score": self.score,
-        }
-        metadata_json = json.dumps(metadata_blob, ensure_ascii=False, sort_keys=True)
-        return f"{self.label} {self.content}\nMetadata: {metadata_json}".strip()
+        return f"{self.citation_header()}\n{self.content}".strip()
 
     def context_payload(self) -> dict[str, Any]:
         return {
@@ -52,6 +61,7 @@ class RetrievedChunk:
             "metadata": self.chunk_metadata,
             "document_title": self.document_title,
             "document_metadata": self.document_metadata,
+            "chunk_ids": self.merged_chunk_ids or ([self.chunk_id] if self.chunk_id else []),
         }
 
     def citation_payload(self) -> dict[str, Any]:
@@ -65,6 +75,7 @@ class RetrievedChunk:
             "score": self.score,
             "source": source,
             "page": page,
+            "chunk_ids": self.merged_chunk_ids or ([self.chunk_id] if self.chunk_id else []),
         }
 
 
@@ -73,28 +84,91 @@ class RAGStrategy(RetrievalStrategy):
 
     _SNIPPET_MAX_LENGTH = 280
 
-    def __init__(self, vector_store: VectorStoreClient, llm: LLMClient) -> None:
+    def __init__(
+        self,
+        vector_store: VectorStoreClient,
+        llm: LLMClient,
+        *,
+        answer_cache: SemanticAnswerCache | None = None,
+        reranker: Reranker | None = None,
+        rerank_candidates: int = 50,
+        top_k: int = 5,
+        context_settings: RetrievalSettings | None = None,
+    ) -> None:
         self.vector_store = vector_store
         self.llm = llm
+        self.answer_cache = answer_cache
+        self.reranker = reranker
+        # Without a reranker the candidate pool is what reaches the prompt, so only ``top_k`` is fetched.
+        self.rerank_candidates = max(rerank_candidates, top_k)
+        self.top_k = top_k
+        self.context_settings = context_settings or RetrievalSettings()
 
     async def run(self, context: RetrievalContext) -> AsyncGenerator[StreamEvent, None]:
         yield StreamEvent.status(stage="retrieving", message="Retrieving relevant information…")
+        search_mode = self._search_mode(context)
+        query_vector: list[float] | None = None
+        if self.answer_cache is not None:
+            lookup_start = perf_counter()
+            query_vector = await self.answer_cache.embed_query(context.query)
+            cached = await self.answer_cache.lookup(query_vector, context.collection_ids, mode=search_mode)
+            if cached is not None:
+                LOGGER.info(
+                    "RAGStrategy: replaying cached answer | conversation=%s similarity=%.3f duration=%.3fs",
+                    context.conversation_id,
+                    cached.similarity,
+                    perf_counter() - lookup_start,
+                )
+                async for event in self._replay(cached):
+                    yield event
+                return
         retrieval_start = perf_counter()
         LOGGER.info(
-            "RAGStrategy: retrieving context | conversation=%s query=%r",
+            "RAGStrategy: retrieving context | conversation=%s mode=%s query=%r",
             context.conversation_id,
+            search_mode,
             context.query,
         )
-        documents = await self.vector_store.similarity_search(context.query)
-        chunks = self._prepare_chunks(documents)
+        k = self.rerank_candidates if self.reranker is not None else self.top_k
+        if search_mode == HYBRID_MODE:
+            documents = await self.vector_store.hybrid_search(
+                context.query, k=k, collection_ids=context.collection_ids
+            )
+        else:
+            documents = await self.vector_store.similarity_search(
+                context.query, k=k, collection_ids=context.collection_ids
+            )
         retrieval_time = perf_counter() - retrieval_start
         LOGGER.info(
-            "RAGStrategy: vector search finished | conversation=%s chunks=%d duration=%.3fs",
+            "RAGStrategy: vector search finished | conversation=%s candidates=%d duration=%.3fs",
             context.conversation_id,
-            len(chunks),
+            len(documents),
             retrieval_time,
         )
 
+        if self.reranker is not None and documents:
+            yield StreamEvent.status(
+                stage="reranking",
+                message=f"Reranking {len(documents)} candidate chunk{'s' if len(documents) != 1 else ''}…",
+            )
+            rerank_start = perf_counter()
+            documents = await self._rerank(context.query, documents)
+            rerank_time = perf_counter() - rerank_start
+            LOGGER.info(
+                "RAGStrategy: rerank finished | conversation=%s model=%s kept=%d duration=%.3fs",
+                context.conversation_id,
+                self.reranker.model_name,
+                len(documents),
+                rerank_time,
+            )
+            yield StreamEvent.status(
+                stage="reranked",
+                message=f"Kept the {len(documents)} most relevant chunk{'s' if len(documents) != 1 else ''}.",
+                duration_ms=rerank_time * 1000,
+            )
+        packed = pack_context(self._prepare_chunks(documents), self.context_settings)
+        chunks = packed.chunks
+
         if chunks:
             LOGGER.info(
                 "RAGStrategy: context prepared | conversation=%s first_chunk_labels=%s",
@@ -117,18 +191,26 @@ class RAGStrategy(RetrievalStrategy):
 
         yield StreamEvent.context(chunks=[chunk.context_payload() for chunk in chunks])
 
-        llm_context = [chunk.llm_block() for chunk in chunks] if chunks else None
+        llm_context = packed.blocks() if chunks else None
         yield StreamEvent.status(stage="generating", message="Generating response…")
         LOGGER.info(
-            "RAGStrategy: starting generation | conversation=%s context_chunks=%d",
+            "RAGStrategy: starting generation | conversation=%s context_chunks=%d dropped_chunks=%d "
+            "deduplicated_chars=%d context_tokens=%d prompt_tokens=%d budget=%d",
             context.conversation_id,
             len(chunks),
+            packed.dropped,
+            packed.deduplicated_chars,
+            packed.tokens,
+            packed.tokens + estimate_tokens(context.query, chars_per_token=self.context_settings.chars_per_token),
+            self.context_settings.context_token_budget,
         )
         generation_start = perf_counter()
         chunk_count = 0
+        pieces: list[str] = []
         async for piece in self.llm.generate(context.query, context=llm_context):
             if piece:
                 chunk_count += 1
+                pieces.append(piece)
                 LOGGER.debug(
                     "RAGStrategy: streamed chunk | conversation=%s length=%d",
                     context.conversation_id,
@@ -143,6 +225,18 @@ class RAGStrategy(RetrievalStrategy):
             chunk_count,
         )
 
+        answer = "".join(pieces).strip()
+        if self.answer_cache is not None and query_vector is not None and answer:
+            await self.answer_cache.store(
+                query=context.query,
+                query_vector=query_vector,
+                collection_ids=context.collection_ids,
+                mode=search_mode,
+                answer=answer,
+                context=[chunk.context_payload() for chunk in chunks],
+                citations=[chunk.citation_payload() for chunk in chunks],
+            )
+
         if chunks:
             yield StreamEvent.status(stage="citations", message="Adding citations…")
             yield StreamEvent.citations(citations=[chunk.citation_payload() for chunk in chunks])
@@ -156,6 +250,39 @@ class RAGStrategy(RetrievalStrategy):
         yield StreamEvent.done()
         LOGGER.info("RAGStrategy: completed | conversation=%s", context.conversation_id)
 
+    async def _replay(self, cached: CachedAnswer) -> AsyncGenerator[StreamEvent, None]:
+        yield StreamEvent.status(
+            stage="retrieved",
+            message="Answered a similar question before; reusing that response.",
+        )
+        yield StreamEvent.context(chunks=cached.context)
+        yield StreamEvent.token(text=cached.answer)
+        if cached.citations:
+            yield StreamEvent.citations(citations=cached.citations)
+        yield StreamEvent.status(stage="complete", message="Response ready.")
+        yield StreamEvent.done()
+
+    @staticmethod
+    def _search_mode(context: RetrievalContext) -> str:
+        """Normalise the requested mode to the search actually run: ``hybrid`` or ``vector``."""
+
+        return HYBRID_MODE if (context.mode or "").lower() == HYBRID_MODE else "vector"
+
+    async def _rerank(self, query: str, documents: Sequence[Any]) -> list[Any]:
+        """Rescore ``documents`` with the reranker and keep the ``top_k`` best, highest first."""
+
+        assert self.reranker is not None
+        passages = [str(doc.get("content", "")) if isinstance(doc, Mapping) else str(doc) for doc in documents]
+        scores = await self.reranker.score(query, passages)
+        ranked = sorted(range(len(documents)), key=lambda index: scores[index], reverse=True)[: self.top_k]
+        reranked: list[Any] = []
+        for index in ranked:
+            doc = documents[index]
+            if isinstance(doc, Mapping):
+                doc = {**doc, "rerank_score": scores[index]}
+            reranked.append(doc)
+        return reranked
+
     def _prepare_chunks(self, docs: Sequence[Any]) -> list[RetrievedChunk]:
         prepared: list[RetrievedChunk] = []
         for index, doc in enumerate(docs, start=1):
@@ -22,8 +22,11 @@ class StreamEvent:
         return payload
 
     @classmethod
-    def status(cls, *, stage: str, message: str) -> "StreamEvent":
-        return cls("status", {"stage": stage, "message": message})
+    def status(cls, *, stage: str, message: str, duration_ms: float | None = None) -> "StreamEvent":
+        data: dict[str, Any] = {"stage": stage, "message": message}
+        if duration_ms is not None:
+            data["duration_ms"] = round(duration_ms, 1)
+        return cls("status", data)
 
     @classmethod
     def token(cls, *, text: str) -> "StreamEvent":
@@ -2,16 +2,37 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import signal
 
-from .config import load_settings
+from .config import Settings, load_settings
+from .ingestion.docling_conversion import shutdown_conversion_pool
 from .ingestion.worker import worker_loop
 from .logging import setup_logging
 
+LOGGER = logging.getLogger(__name__)
+
+
+async def _serve(settings: Settings) -> None:
+    """Run the worker loop until SIGTERM/SIGINT requests a graceful shutdown."""
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:  # pragma: no cover - signal handlers are unavailable on Windows
+            LOGGER.debug("Signal handler for %s not supported on this platform", sig)
+    await worker_loop(settings, stop_event=stop_event)
+
 
 def main() -> None:
     settings = load_settings()
     setup_logging(settings)
-    asyncio.run(worker_loop(settings))
+    try:
+        asyncio.run(_serve(settings))
+    finally:
+        shutdown_conversion_pool()
 
 
 if __name__ == "__main__":
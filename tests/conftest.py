@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from contextlib import asynccontextmanager
 import os
 from pathlib import Path
 import shutil
@@ -42,11 +43,22 @@ class AsyncSessionWrapper:
     async def commit(self) -> None:
         self._sync.commit()
 
+    async def rollback(self) -> None:
+        self._sync.rollback()
+
     async def flush(self) -> None:
         self._sync.flush()
 
-    async def refresh(self, instance: object) -> None:
-        self._sync.refresh(instance)
+    async def refresh(self, instance: object, attribute_names=None) -> None:
+        self._sync.refresh(instance, attribute_names=attribute_names)
+
+    async def get(self, entity, ident, **kwargs):
+        return self._sync.get(entity, ident, **kwargs)
+
+    @asynccontextmanager
+    async def begin(self):
+        with self._sync.begin():
+            yield self
 
     async def delete(self, instance: object) -> None:
         self._sync.delete(instance)
@@ -115,6 +127,10 @@ def app(monkeypatch: pytest.MonkeyPatch) -> Iterator[FastAPI]:
             "docling_hash_index": docling_dir / "index.json",
         },
     )
+    # The ingestion embedder is wrapped in the on-disk embedding cache; keep its SQLite file out of the repo.
+    settings.embedding_cache = settings.embedding_cache.model_copy(
+        update={"path": storage_root / "embedding_cache.sqlite3"},
+    )
 
     async def _get_db_session():
         async with session_factory() as session:
@@ -134,11 +150,13 @@ def app(monkeypatch: pytest.MonkeyPatch) -> Iterator[FastAPI]:
     monkeypatch.setattr(auth_user_manager, "get_settings", _get_settings)
     monkeypatch.setattr(retrieval_dependencies, "get_settings", _get_settings)
     monkeypatch.setattr(ingestion_dependencies, "get_db_session", _get_db_session)
+    monkeypatch.setattr(ingestion_dependencies, "load_settings", _get_settings)
 
     from src.main import create_app
 
     app = create_app()
     app.state._session_factory = session_factory  # type: ignore[attr-defined]
+    app.state._engine = engine  # type: ignore[attr-defined]
 
     try:
         yield app
@@ -0,0 +1,58 @@
+"""Embedding cache behaviour tests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from pathlib import Path
+
+from src.infrastructure.embeddings.base import EmbeddingClient
+from src.infrastructure.embeddings.cache import CachedEmbeddingClient, EmbeddingCacheStore
+
+
+class CountingEmbeddingClient(EmbeddingClient):
+    """Return simple vectors and record every text that reaches the provider."""
+
+    def __init__(self, model_name: str = "counting") -> None:
+        self.model_name = model_name
+        self.requested: list[str] = []
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        self.requested.extend(texts)
+        return [[float(len(text)), 0.5] for text in texts]
+
+
+def test_repeated_texts_are_served_from_cache(tmp_path: Path) -> None:
+    store = EmbeddingCacheStore(tmp_path / "cache.sqlite3", max_entries=100)
+    inner = CountingEmbeddingClient()
+    client = CachedEmbeddingClient(inner, store)
+
+    first = asyncio.run(client.embed(["alpha", "beta", "alpha"]))
+    second = asyncio.run(client.embed(["beta ", "gamma"]))
+
+    assert inner.requested == ["alpha", "beta", "gamma"]
+    assert first == [[5.0, 0.5], [4.0, 0.5], [5.0, 0.5]]
+    assert second == [[4.0, 0.5], [5.0, 0.5]]
+    assert (client.stats.hits, client.stats.misses) == (1, 4)
+
+
+def test_cache_is_keyed_by_model(tmp_path: Path) -> None:
+    store = EmbeddingCacheStore(tmp_path / "cache.sqlite3", max_entries=100)
+    first_model = CountingEmbeddingClient("model-a")
+    second_model = CountingEmbeddingClient("model-b")
+
+    asyncio.run(CachedEmbeddingClient(first_model, store).embed(["shared"]))
+    asyncio.run(CachedEmbeddingClient(second_model, store).embed(["shared"]))
+
+    assert first_model.requested == ["shared"]
+    assert second_model.requested == ["shared"]
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    store = EmbeddingCacheStore(tmp_path / "cache.sqlite3", max_entries=2)
+    store.put_many("m", [("old", [1.0])])
+    store.put_many("m", [("recent", [2.0])])
+    assert store.get_many("m", ["old"]) == {"old": [1.0]}
+
+    store.put_many("m", [("new", [3.0])])
+
+    assert set(store.get_many("m", ["old", "recent", "new"])) == {"old", "new"}
@@ -0,0 +1,59 @@
+"""Shared LLM HTTP client tests."""
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+
+from src.config import Settings
+from src.infrastructure.llm import http as llm_http
+from src.infrastructure.llm.ollama import OllamaClient
+
+
+def test_shared_http_client_is_reused_within_a_loop() -> None:
+    settings = Settings()
+
+    async def _run() -> tuple[httpx.AsyncClient, httpx.AsyncClient]:
+        first = llm_http.get_http_client(settings.llm)
+        second = llm_http.get_http_client(settings.llm)
+        await llm_http.close_http_client()
+        assert first.is_closed
+        return first, second
+
+    first, second = asyncio.run(_run())
+    assert first is second
+
+    async def _fresh_loop() -> httpx.AsyncClient:
+        try:
+            return llm_http.get_http_client(settings.llm)
+        finally:
+            await llm_http.close_http_client()
+
+    assert asyncio.run(_fresh_loop()) is not first
+
+
+def test_ollama_generate_streams_over_injected_client() -> None:
+    settings = Settings()
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        lines = [
+            json.dumps({"response": "Hello"}),
+            json.dumps({"response": " world"}),
+            json.dumps({"response": "", "done": True}),
+        ]
+        return httpx.Response(200, content="\n".join(lines).encode())
+
+    async def _run() -> list[str]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+            client = OllamaClient(settings, http_client=http_client)
+            chunks = [chunk async for chunk in client.generate("hi")]
+            chunks += [chunk async for chunk in client.generate("again")]
+            assert not http_client.is_closed
+            return chunks
+
+    assert asyncio.run(_run()) == ["Hello", " world", "Hello", " world"]
+    assert len(requests) == 2
+    assert requests[0].url.path == "/api/generate"
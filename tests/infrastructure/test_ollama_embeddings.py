@@ -0,0 +1,77 @@
+"""Ollama embedding client batching tests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from src.infrastructure.embeddings.ollama import OllamaEmbeddingClient
+
+
+class FakeOllamaClient:
+    """Record /api/embed calls and reject batches above a size limit."""
+
+    def __init__(self, *, max_batch_for_context: int | None = None) -> None:
+        self.calls: list[list[str]] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.max_batch_for_context = max_batch_for_context
+
+    async def embed(self, model: str, input: Sequence[str]) -> dict[str, object]:
+        batch = list(input)
+        self.calls.append(batch)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            if self.max_batch_for_context is not None and len(batch) > self.max_batch_for_context:
+                raise RuntimeError("input exceeds maximum context length")
+            return {"embeddings": [[float(len(text)), 1.0] for text in batch]}
+        finally:
+            self.in_flight -= 1
+
+
+def _client(fake: FakeOllamaClient, *, batch_size: int, max_concurrency: int) -> OllamaEmbeddingClient:
+    client = OllamaEmbeddingClient(
+        host="http://ollama",
+        model_name="test-embed",
+        request_timeout=5,
+        binary_path="ollama",
+        dimension=3,
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+    )
+    client._client = fake  # type: ignore[assignment]
+    client._server_running = True
+    return client
+
+
+def test_embed_batches_requests_and_preserves_order() -> None:
+    fake = FakeOllamaClient()
+    client = _client(fake, batch_size=4, max_concurrency=2)
+    texts = ["x" * index for index in range(1, 11)]
+
+    vectors = asyncio.run(client.embed(texts))
+
+    assert [len(batch) for batch in fake.calls] == [4, 4, 2]
+    assert fake.peak_in_flight <= 2
+    assert vectors == [[float(index), 1.0, 0.0] for index in range(1, 11)]
+
+
+def test_embed_falls_back_to_single_requests_on_context_length() -> None:
+    fake = FakeOllamaClient(max_batch_for_context=1)
+    client = _client(fake, batch_size=3, max_concurrency=1)
+
+    vectors = asyncio.run(client.embed(["a", "bb", "ccc"]))
+
+    assert fake.calls == [["a", "bb", "ccc"], ["a"], ["bb"], ["ccc"]]
+    assert [vector[0] for vector in vectors] == [1.0, 2.0, 3.0]
+
+
+def test_embed_reports_oversized_single_chunk() -> None:
+    fake = FakeOllamaClient(max_batch_for_context=0)
+    client = _client(fake, batch_size=2, max_concurrency=1)
+
+    with pytest.raises(RuntimeError, match="exceeds the model context window"):
+        asyncio.run(client.embed(["one two three"]))
@@ -0,0 +1,113 @@
+"""pgvector search statement tests against a recording Postgres session."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column, MetaData, Table
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from src.config import VectorStoreSettings
+from src.infrastructure.database import _chunk_embedding_indexes
+from src.infrastructure.embeddings.local import LocalEmbeddingClient
+from src.infrastructure.vectorstore.pgvector import PGVectorStore
+
+
+class RecordingSession:
+    """Compile statements for Postgres and answer vector queries with scripted rows."""
+
+    def __init__(self, *vector_results: Sequence[tuple[Any, ...]]) -> None:
+        self.statements: list[str] = []
+        self.settings_applied: dict[str, str] = {}
+        self._vector_results = list(vector_results)
+
+    def get_bind(self) -> Any:
+        return SimpleNamespace(dialect=postgresql.dialect())
+
+    async def execute(self, statement: Any) -> Any:
+        compiled = statement.compile(dialect=postgresql.dialect())
+        self.statements.append(str(compiled))
+        if "set_config" in str(compiled):
+            name, value = (compiled.params[key] for key in sorted(compiled.params)[:2])
+            self.settings_applied[name] = value
+            return SimpleNamespace(all=lambda: [])
+        rows = self._vector_results.pop(0) if "FROM chunks" in str(compiled) else []
+        return SimpleNamespace(all=lambda: list(rows))
+
+
+def _row(chunk_id: str, distance: float) -> tuple[Any, ...]:
+    return (chunk_id, "doc", f"content {chunk_id}", {}, "Doc", {}, distance)
+
+
+def test_short_filtered_ann_result_falls_back_to_exact_search() -> None:
+    session = RecordingSession([_row("a", 0.1)], [_row("a", 0.1), _row("b", 0.2), _row("c", 0.3)])
+    store = PGVectorStore(session, LocalEmbeddingClient(dimension=4), settings=VectorStoreSettings())
+
+    results = asyncio.run(store.similarity_search("retention", k=3, collection_ids=["small"]))
+
+    assert [result["chunk_id"] for result in results] == ["a", "b", "c"]
+    searches = [statement for statement in session.statements if "FROM chunks" in statement]
+    assert len(searches) == 2
+    assert "ORDER BY distance" in searches[0]
+    assert "ORDER BY (chunks.embedding <=> " in searches[1]
+
+
+def test_full_or_unfiltered_ann_result_is_not_repeated() -> None:
+    rows = [_row("a", 0.1), _row("b", 0.2)]
+    for collection_ids in (["large"], None):
+        session = RecordingSession(rows)
+        store = PGVectorStore(session, LocalEmbeddingClient(dimension=4), settings=VectorStoreSettings())
+        asyncio.run(store.similarity_search("retention", k=2, collection_ids=collection_ids))
+        assert len([statement for statement in session.statements if "FROM chunks" in statement]) == 1
+    session = RecordingSession([_row("a", 0.1)])
+    store = PGVectorStore(session, LocalEmbeddingClient(dimension=4), settings=VectorStoreSettings())
+    asyncio.run(store.similarity_search("retention", k=2))
+    assert len([statement for statement in session.statements if "FROM chunks" in statement]) == 1
+
+
+def test_hnsw_ef_search_is_raised_to_the_requested_depth() -> None:
+    settings = VectorStoreSettings(hnsw_ef_search=40, hybrid_candidates=50)
+
+    session = RecordingSession([])
+    store = PGVectorStore(session, LocalEmbeddingClient(dimension=4), settings=settings)
+    asyncio.run(store.similarity_search("retention period", k=5))
+    assert session.settings_applied["hnsw.ef_search"] == "40"
+
+    session = RecordingSession([], [])
+    store = PGVectorStore(session, LocalEmbeddingClient(dimension=4), settings=settings)
+    asyncio.run(store.hybrid_search("retention period", k=5))
+    assert session.settings_applied["hnsw.ef_search"] == "50"
+
+
+def test_rerank_candidate_pool_is_not_capped_by_hnsw_ef_search() -> None:
+    session = RecordingSession([_row(str(index), 0.1) for index in range(50)])
+    store = PGVectorStore(session, LocalEmbeddingClient(dimension=4), settings=VectorStoreSettings(hnsw_ef_search=40))
+
+    results = asyncio.run(store.similarity_search("retention period", k=50))
+
+    assert session.settings_applied["hnsw.ef_search"] == "50"
+    assert len(results) == 50
+
+
+def test_orm_embedding_index_follows_the_migration_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    def index_ddl() -> str:
+        table = Table("chunks", MetaData(), Column("embedding", Vector(4)), *_chunk_embedding_indexes())
+        (index,) = table.indexes
+        return str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    for name in ("INDEX_TYPE", "HNSW_M", "HNSW_EF_CONSTRUCTION", "IVFFLAT_LISTS"):
+        monkeypatch.delenv(f"VECTORSTORE__{name}", raising=False)
+    assert "USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)" in index_ddl()
+
+    monkeypatch.setenv("VECTORSTORE__HNSW_M", "32")
+    monkeypatch.setenv("VECTORSTORE__HNSW_EF_CONSTRUCTION", "128")
+    assert "WITH (m = 32, ef_construction = 128)" in index_ddl()
+
+    monkeypatch.setenv("VECTORSTORE__INDEX_TYPE", "ivfflat")
+    monkeypatch.setenv("VECTORSTORE__IVFFLAT_LISTS", "200")
+    assert "USING ivfflat (embedding vector_cosine_ops) WITH (lists = 200)" in index_ddl()
@@ -0,0 +1,86 @@
+"""Guard the number of SQL statements issued per authenticated request."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.infrastructure.repositories.conversation_repo import ConversationRepository
+
+# Statements per request: loading the user (plus its roles) and the endpoint's own queries.
+EXPECTED_STATEMENTS = {
+    "/auth/me": 2,
+    "/chat/sessions": 3,
+    "messages": 4,
+}
+
+
+@contextmanager
+def _count_statements(app: FastAPI) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+        statements.append(statement)
+
+    engine = app.state._engine  # type: ignore[attr-defined]
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_authenticated_requests_issue_a_fixed_number_of_queries(
+    app: FastAPI, session_factory: async_sessionmaker
+) -> None:
+    async def _measure(client: AsyncClient, headers: dict[str, str], session_id: str) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for key, path in (
+            ("/auth/me", "/auth/me"),
+            ("/chat/sessions", "/chat/sessions"),
+            ("messages", f"/chat/{session_id}/messages"),
+        ):
+            with _count_statements(app) as statements:
+                response = await client.get(path, headers=headers)
+            assert response.status_code == 200, response.text
+            counts[key] = len(statements)
+        return counts
+
+    async def _run() -> tuple[dict[str, int], dict[str, int]]:
+        async with app.router.lifespan_context(app):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+                payload = {"email": "quinn@example.com", "password": "CountMe123!", "full_name": "Quinn"}
+                register = await client.post("/auth/register", json=payload)
+                assert register.status_code == 201
+                user_id = register.json()["id"]
+                login = await client.post(
+                    "/auth/jwt/login",
+                    data={"username": payload["email"], "password": payload["password"]},
+                )
+                headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+                created = await client.post("/chat/sessions", json={"title": "History"}, headers=headers)
+                session_id = created.json()["id"]
+
+                baseline = await _measure(client, headers, session_id)
+
+                # Grow the chat history; per-request statement counts must not follow it.
+                async with session_factory() as session:
+                    repo = ConversationRepository(session)
+                    for index in range(5):
+                        conversation = await repo.create_conversation(user_id, f"Extra {index}")
+                        for turn in range(10):
+                            await repo.add_message(conversation.id, "user", f"question {turn}")
+                            await repo.add_message(session_id, "assistant", f"answer {index}-{turn}")
+                    await session.commit()
+
+                return baseline, await _measure(client, headers, session_id)
+
+    baseline, grown = asyncio.run(_run())
+    assert grown == baseline
+    assert baseline == EXPECTED_STATEMENTS
@@ -0,0 +1,56 @@
+"""Query embedding LRU/TTL cache tests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from src.infrastructure.embeddings import query_cache as query_cache_module
+from src.infrastructure.embeddings.base import EmbeddingClient
+from src.infrastructure.embeddings.query_cache import QueryEmbeddingCache
+
+
+class CountingEmbeddingClient(EmbeddingClient):
+    def __init__(self, model_name: str = "counting") -> None:
+        self.model_name = model_name
+        self.requested: list[str] = []
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        self.requested.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def test_repeated_queries_reuse_embeddings_until_evicted() -> None:
+    cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=60)
+    embedder = CountingEmbeddingClient()
+
+    async def _run() -> list[bool]:
+        hits = []
+        for query in ("retention policy", "  retention   policy ", "travel", "budget", "retention policy"):
+            _vector, hit = await cache.embed(embedder, query)
+            hits.append(hit)
+        return hits
+
+    assert asyncio.run(_run()) == [False, True, False, False, False]
+    # The normalised repeat is served from cache; the third distinct query evicts the oldest entry.
+    assert embedder.requested == ["retention policy", "travel", "budget", "retention policy"]
+    assert cache.hit_ratio == pytest.approx(1 / 5)
+
+
+def test_entries_expire_and_are_keyed_by_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(query_cache_module.time, "monotonic", lambda: clock[0])
+    cache = QueryEmbeddingCache(max_entries=10, ttl_seconds=30)
+    first, second = CountingEmbeddingClient("model-a"), CountingEmbeddingClient("model-b")
+
+    async def _run() -> None:
+        await cache.embed(first, "hello")
+        assert (await cache.embed(second, "hello"))[1] is False
+        clock[0] += 10
+        assert (await cache.embed(first, "hello"))[1] is True
+        clock[0] += 30
+        assert (await cache.embed(first, "hello"))[1] is False
+
+    asyncio.run(_run())
+    assert first.requested == ["hello", "hello"]
@@ -72,11 +72,11 @@ def test_prepare_chunks_includes_citation_image_url(tmp_path: Path) -> None:
     assert isinstance(citation, dict)
     assert citation["image_path"] == tmp_path.as_posix()
     assert citation["docling_hash"] == "hash"
-    assert citation["image_url"] == "/ingestion/documents/doc-1/pages/1/preview"
+    assert citation["image_url"] == "/ingestion/documents/doc-1/pages/1/preview?v=hash"
     assert citation["pages"] == [
         {
             "page_number": 1,
-            "image_url": "/ingestion/documents/doc-1/pages/1/preview",
+            "image_url": "/ingestion/documents/doc-1/pages/1/preview?v=hash",
             "image_path": tmp_path.as_posix(),
         }
     ]
@@ -103,16 +103,27 @@ def test_build_citation_includes_all_pages(tmp_path: Path) -> None:
     )
 
     assert citation["page_number"] == 1
-    assert citation["image_url"] == "/ingestion/documents/doc-1/pages/1/preview"
+    assert citation["image_url"] == "/ingestion/documents/doc-1/pages/1/preview?v=hash"
     assert citation["docling_hash"] == "hash"
     assert citation["pages"] == [
         {
             "page_number": 1,
-            "image_url": "/ingestion/documents/doc-1/pages/1/preview",
+            "image_url": "/ingestion/documents/doc-1/pages/1/preview?v=hash",
             "image_path": (tmp_path / "page1.png").as_posix(),
         },
         {
             "page_number": 2,
-            "image_url": "/ingestion/documents/doc-1/pages/2/preview",
+            "image_url": "/ingestion/documents/doc-1/pages/2/preview?v=hash",
         },
     ]
+
+
+def test_known_file_hash_ignores_client_parameters(tmp_path: Path) -> None:
+    source = tmp_path / "upload.pdf"
+    digest = "a" * 64
+    spoofed = SimpleNamespace(source=str(source), parameters={"source_sha256": digest}, source_sha256=None)
+    stored = SimpleNamespace(source=str(source), parameters=None, source_sha256=digest)
+
+    assert DocumentIngestionPipeline._known_file_hash(spoofed, source) is None
+    assert DocumentIngestionPipeline._known_file_hash(stored, source) == digest
+    assert DocumentIngestionPipeline._known_file_hash(stored, tmp_path / "other.pdf") is None
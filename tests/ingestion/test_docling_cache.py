@@ -0,0 +1,92 @@
+"""Split Docling cache tests."""
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+from src.config import DoclingSettings, StorageSettings
+from src.ingestion.docling_cache import manifest_path, read_docling_payload, read_manifest, read_page
+from src.ingestion.pipeline import DoclingParser, ParsedDocument, ParsedPage
+
+
+class FakeDoclingDocument:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.payload = payload
+
+    def model_dump(self, mode: str = "python") -> dict[str, Any]:
+        return json.loads(json.dumps(self.payload))
+
+
+def test_parser_cache_hit_reads_pages_without_loading_document(tmp_path: Path) -> None:
+    storage = StorageSettings(
+        docling_output_dir=tmp_path / "docling", docling_hash_index=tmp_path / "docling" / "index.json"
+    )
+    parser = DoclingParser(storage_settings=storage, docling_settings=DoclingSettings())
+    source = tmp_path / "report.pdf"
+    source.write_bytes(b"%PDF-1.4 report")
+    cache_dir = storage.docling_output_dir / parser._create_file_hash(source)
+    cache_dir.mkdir(parents=True)
+
+    image = {"uri": "data:image/png;base64,AAAA", "mimetype": "image/png"}
+    document = FakeDoclingDocument(
+        {"name": "report", "pages": {"1": {"page_no": 1, "image": image}, "2": {"page_no": 2, "image": None}}}
+    )
+    parser._persist_cache(
+        ParsedDocument(
+            title="Report",
+            pages=[
+                ParsedPage(number=1, content="First page", metadata={"page_number": 1}),
+                ParsedPage(number=2, content="Second page", metadata={"page_number": 2}),
+            ],
+            metadata={"docling_hash": cache_dir.name, "page_count": 2},
+            docling_document=document,
+        ),
+        cache_dir,
+    )
+
+    output_path = manifest_path(cache_dir)
+    manifest = read_manifest(output_path)
+    assert manifest is not None
+    # Page images live in the page files only, not in the serialised document.
+    assert read_docling_payload(output_path, manifest)["pages"]["1"]["image"] is None
+    assert read_page(output_path, 1).image == image
+
+    parsed = asyncio.run(parser.parse(source))
+
+    assert parsed.title == "Report"
+    assert [page.content for page in parsed.pages] == ["First page", "Second page"]
+    assert parsed.metadata["docling_output"] == str(output_path)
+    assert parsed.metadata["source_path"] == str(source)
+    assert parsed.docling_document is None
+    assert parsed.docling_loader is not None
+
+
+def test_parser_cache_hit_adopts_the_current_upload(tmp_path: Path) -> None:
+    storage = StorageSettings(
+        docling_output_dir=tmp_path / "docling", docling_hash_index=tmp_path / "docling" / "index.json"
+    )
+    parser = DoclingParser(storage_settings=storage, docling_settings=DoclingSettings())
+    first = tmp_path / "3f2a9c-upload.pdf"
+    second = tmp_path / "81bd07-upload.pdf"
+    for upload in (first, second):
+        upload.write_bytes(b"%PDF-1.4 same bytes")
+    cache_dir = storage.docling_output_dir / parser._create_file_hash(second)
+    cache_dir.mkdir(parents=True)
+    parser._persist_cache(
+        ParsedDocument(
+            title=first.stem,
+            pages=[ParsedPage(number=1, content="Only page", metadata={"page_number": 1})],
+            metadata={"docling_hash": cache_dir.name, "source_path": str(first), "page_count": 1},
+            docling_document=FakeDoclingDocument({"name": first.stem, "pages": {}}),
+        ),
+        cache_dir,
+    )
+
+    parsed = asyncio.run(parser.parse(second))
+
+    assert parsed.title == second.stem
+    assert parsed.metadata["source_path"] == str(second)
+    index = json.loads(storage.docling_hash_index.read_text(encoding="utf-8"))
+    assert index[str(second)]["hash"] == cache_dir.name
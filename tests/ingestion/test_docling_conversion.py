@@ -0,0 +1,59 @@
+"""Docling converter reuse tests."""
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import DoclingSettings
+from src.ingestion import docling_conversion
+
+
+def test_converter_is_built_once_per_pipeline_options(monkeypatch: pytest.MonkeyPatch) -> None:
+    built: list[dict[str, object]] = []
+
+    def _fake_build(key):
+        built.append(dict(key))
+        return object()
+
+    monkeypatch.setattr(docling_conversion, "_CONVERTERS", {})
+    monkeypatch.setattr(docling_conversion, "_build_converter", _fake_build)
+
+    default_key = docling_conversion.converter_key(DoclingSettings())
+    first = docling_conversion.get_converter(default_key)
+    second = docling_conversion.get_converter(docling_conversion.converter_key(DoclingSettings(worker_processes=4)))
+    fast_key = docling_conversion.converter_key(DoclingSettings(table_mode="fast"))
+    third = docling_conversion.get_converter(fast_key)
+
+    assert first is second
+    assert third is not first
+    assert [options["table_mode"] for options in built] == ["accurate", "fast"]
+
+
+def test_thread_conversions_do_not_share_the_converter_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    active: list[int] = []
+    overlaps: list[int] = []
+
+    class FakeConverter:
+        def convert(self, path):
+            active.append(1)
+            if len(active) > 1:
+                overlaps.append(len(active))
+            time.sleep(0.02)
+            active.pop()
+            return SimpleNamespace(document=SimpleNamespace(name=path.stem))
+
+    monkeypatch.setattr(docling_conversion, "_CONVERTERS", {})
+    monkeypatch.setattr(docling_conversion, "_build_converter", lambda key: FakeConverter())
+    monkeypatch.setattr(docling_conversion, "_extract_pages", lambda result, cache_dir: [])
+
+    key = docling_conversion.converter_key(DoclingSettings())
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        outputs = list(
+            pool.map(lambda name: docling_conversion.convert_document(f"{name}.pdf", "cache", key), "abcd")
+        )
+
+    assert [output.document_name for output in outputs] == ["a", "b", "c", "d"]
+    assert overlaps == []
@@ -5,6 +5,7 @@ import json
 from pathlib import Path
 
 from src.config import StorageSettings
+from src.ingestion.docling_cache import CachedPage, write_cache
 from src.ingestion.docling_images import DoclingImageLocator
 
 
@@ -54,6 +55,28 @@ def test_locator_materialises_from_json(tmp_path: Path) -> None:
     assert resolved.read_bytes() == base64.b64decode(SAMPLE_PIXEL)
 
 
+def test_locator_materialises_from_split_cache(tmp_path: Path) -> None:
+    storage_dir = tmp_path / "docling"
+    cache_dir = storage_dir / "hash"
+    cache_dir.mkdir(parents=True)
+    image = {"uri": f"data:image/png;base64,{SAMPLE_PIXEL}", "mimetype": "image/png"}
+    output_path = write_cache(
+        cache_dir,
+        title="hash",
+        metadata={},
+        pages=[CachedPage(number=1, content="one"), CachedPage(number=2, content="two", image=image)],
+        docling_payload=None,
+    )
+
+    locator = DoclingImageLocator(storage=StorageSettings(docling_output_dir=storage_dir))
+    metadata = {"docling_hash": "hash", "docling_output": str(output_path)}
+
+    assert locator.locate_from_metadata(metadata, 1) is None
+    resolved = locator.locate_from_metadata(metadata, 2)
+    assert resolved is not None
+    assert resolved.read_bytes() == base64.b64decode(SAMPLE_PIXEL)
+
+
 def test_locator_rejects_outside_directory(tmp_path: Path) -> None:
     storage_dir = tmp_path / "docling"
     storage_dir.mkdir(parents=True)
@@ -2,14 +2,24 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import importlib
 import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from src.config import load_settings
+from src import dependencies
+from src.config import PreviewSettings, load_settings
 
+from src.infrastructure.embeddings.local import LocalEmbeddingClient
 from src.infrastructure.database import (
     Chunk,
     Document,
@@ -18,7 +28,8 @@ from src.infrastructure.database import (
     IngestionStatus,
     IngestionStep,
 )
-from src.infrastructure.repositories.document_repo import DocumentRepository
+from src.infrastructure.repositories.document_repo import DocumentRepository, _retarget_chunk_metadata
+from src.ingestion.page_previews import _render, derivative_path, preview_etag
 from src.ingestion.pipeline import DocumentIngestionPipeline, ParsedDocument, ParsedPage, IngestionError
 
 
@@ -111,7 +122,7 @@ def test_pipeline_raises_when_no_chunks(session_factory: async_sessionmaker, tmp
                 "docling_hash": "hash-empty",
                 "docling_output": str(tmp_path / "hash-empty.json"),
                 "image_dir": str(tmp_path / "images"),
-                "source_path": source,
+                "source_path": str(source),
                 "page_count": 1,
             }
             page = ParsedPage(number=1, content="   ", metadata={"docling_hash": "hash-empty"})
@@ -155,12 +166,315 @@ def test_pipeline_raises_when_no_chunks(session_factory: async_sessionmaker, tmp
     asyncio.run(_run())
 
 
+def test_pipeline_persists_chunks_in_bulk(session_factory: async_sessionmaker, tmp_path) -> None:
+    class StaticParser:
+        async def parse(self, source) -> ParsedDocument:
+            metadata = {"docling_hash": "hash-bulk", "source_path": str(source), "page_count": 2}
+            pages = [
+                ParsedPage(
+                    number=number,
+                    content=f"Page {number} " + "lorem ipsum " * 120,
+                    metadata={"image_path": f"storage/docling/hash-bulk/page-{number:04d}.png"} if number == 1 else {},
+                )
+                for number in (1, 2)
+            ]
+            return ParsedDocument(title="Bulk", pages=pages, metadata=metadata, docling_document=None)
+
+    async def _run() -> None:
+        async with session_factory() as session:
+            repo = DocumentRepository(session)
+            collection = await repo.ensure_collection("bulk", "Bulk collection")
+            source = tmp_path / "bulk.pdf"
+            source.write_text("placeholder", encoding="utf-8")
+            job = await repo.create_ingestion_job(
+                user_id=None,
+                source=str(source),
+                chunk_size=300,
+                chunk_overlap=30,
+                parameters=None,
+                collection=collection,
+            )
+            await repo.commit()
+            await session.refresh(job, attribute_names=["collection"])
+
+            pipeline = DocumentIngestionPipeline(
+                repo,
+                StaticParser(),
+                LocalEmbeddingClient(dimension=8),
+                chunk_size=300,
+                chunk_overlap=30,
+            )
+            await pipeline.run(job)
+
+            chunks = list((await session.execute(select(Chunk))).scalars())
+            assert len(chunks) > 2
+            assert {chunk.collection_id for chunk in chunks} == {collection.id}
+            assert len({chunk.id for chunk in chunks}) == len(chunks)
+            assert all(chunk.embedding_model == "local-deterministic-embedding" for chunk in chunks)
+            assert all(chunk.metadata_json for chunk in chunks)
+
+            document_id = chunks[0].document_id
+            first_page = await repo.get_page_preview(document_id, 1)
+            assert first_page.image_path == "storage/docling/hash-bulk/page-0001.png"
+            assert first_page.mimetype == "image/png"
+            assert first_page.collection_id == collection.id
+            second_page = await repo.get_page_preview(document_id, 2)
+            assert second_page.image_path is None
+            assert second_page.docling_hash == "hash-bulk"
+
+    asyncio.run(_run())
+
+
+def test_pipeline_streams_multiple_documents_through_stages(
+    session_factory: async_sessionmaker, tmp_path
+) -> None:
+    class PageParser:
+        async def parse(self, source) -> ParsedDocument:
+            page = ParsedPage(number=1, content=f"{source.stem} " + "dolor sit amet " * 60, metadata={})
+            metadata = {"docling_hash": f"hash-{source.stem}", "source_path": str(source), "page_count": 1}
+            return ParsedDocument(title=source.stem, pages=[page], metadata=metadata, docling_document=None)
+
+    class RecordingEmbedder(LocalEmbeddingClient):
+        def __init__(self) -> None:
+            super().__init__(dimension=4)
+            self.batch_sizes: list[int] = []
+
+        async def embed(self, texts):
+            self.batch_sizes.append(len(texts))
+            return await super().embed(texts)
+
+    async def _run() -> None:
+        async with session_factory() as session:
+            repo = DocumentRepository(session)
+            collection = await repo.ensure_collection("streamed", "Streamed collection")
+            source_dir = tmp_path / "sources"
+            source_dir.mkdir()
+            for name in ("alpha", "beta", "gamma"):
+                (source_dir / f"{name}.txt").write_text(name, encoding="utf-8")
+            job = await repo.create_ingestion_job(
+                user_id=None,
+                source=str(source_dir),
+                chunk_size=200,
+                chunk_overlap=20,
+                parameters=None,
+                collection=collection,
+            )
+            await repo.commit()
+            await session.refresh(job, attribute_names=["collection"])
+
+            embedder = RecordingEmbedder()
+            pipeline = DocumentIngestionPipeline(
+                repo,
+                PageParser(),
+                embedder,
+                chunk_size=200,
+                chunk_overlap=20,
+                queue_size=1,
+                embed_batch_size=2,
+            )
+            await pipeline.run(job)
+
+            documents = list((await session.execute(select(Document))).scalars())
+            chunks = list((await session.execute(select(Chunk))).scalars())
+            events = await repo.list_job_events(job.id)
+
+            assert sorted(document.title for document in documents) == ["alpha", "beta", "gamma"]
+            assert max(embedder.batch_sizes) == 2
+            assert sum(embedder.batch_sizes) == len(chunks)
+            assert {event.step for event in events} == set(IngestionStep)
+            assert all(event.status is IngestionEventStatus.success for event in events)
+
+    asyncio.run(_run())
+
+
+def test_pipeline_replaces_document_and_embeds_only_changed_chunks(
+    session_factory: async_sessionmaker, tmp_path
+) -> None:
+    versions = {
+        "v1": ["Unchanged introduction " + "alpha " * 80, "Original section " + "beta " * 80],
+        "v2": ["Unchanged introduction " + "alpha " * 80, "Revised section " + "gamma " * 80],
+    }
+
+    class VersionedParser:
+        async def parse(self, source) -> ParsedDocument:
+            pages = [
+                ParsedPage(number=number, content=content, metadata={})
+                for number, content in enumerate(versions[source.stem], start=1)
+            ]
+            metadata = {"docling_hash": f"hash-{source.stem}", "source_path": str(source), "page_count": len(pages)}
+            return ParsedDocument(title="Manual", pages=pages, metadata=metadata, docling_document=None)
+
+    class CountingEmbedder(LocalEmbeddingClient):
+        def __init__(self) -> None:
+            super().__init__(dimension=4)
+            self.embedded: list[str] = []
+
+        async def embed(self, texts):
+            self.embedded.extend(texts)
+            return await super().embed(texts)
+
+    async def _ingest(repo: DocumentRepository, collection, version: str, embedder, *, replace: bool):
+        source = tmp_path / f"{version}.pdf"
+        source.write_text(version, encoding="utf-8")
+        parameters: dict[str, object] = {"original_filename": "manual.pdf"}
+        if replace:
+            parameters["replace_existing"] = True
+        job = await repo.create_ingestion_job(
+            user_id=None,
+            source=str(source),
+            chunk_size=200,
+            chunk_overlap=20,
+            parameters=parameters,
+            collection=collection,
+        )
+        await repo.commit()
+        await repo.session.refresh(job, attribute_names=["collection"])
+        pipeline = DocumentIngestionPipeline(repo, VersionedParser(), embedder, chunk_size=200, chunk_overlap=20)
+        await pipeline.run(job)
+        return job
+
+    async def _run() -> None:
+        async with session_factory() as session:
+            repo = DocumentRepository(session)
+            collection = await repo.ensure_collection("versioned", "Versioned collection")
+            first_embedder = CountingEmbedder()
+            await _ingest(repo, collection, "v1", first_embedder, replace=False)
+            before = {chunk.content: chunk.id for chunk in (await session.execute(select(Chunk))).scalars()}
+
+            second_embedder = CountingEmbedder()
+            job = await _ingest(repo, collection, "v2", second_embedder, replace=True)
+            session.expire_all()
+            documents = list((await session.execute(select(Document))).scalars())
+            chunks = list((await session.execute(select(Chunk))).scalars())
+
+            assert len(documents) == 1
+            assert documents[0].ingestion_job_id == job.id
+            assert documents[0].source_key == "manual.pdf"
+            assert documents[0].metadata_json["docling_hash"] == "hash-v2"
+            assert all("beta" not in chunk.content for chunk in chunks)
+            assert any("gamma" in chunk.content for chunk in chunks)
+            unchanged = [chunk for chunk in chunks if chunk.content in before]
+            assert unchanged and all(chunk.id == before[chunk.content] for chunk in unchanged)
+            assert all(chunk.metadata_json["ingestion_job_id"] == job.id for chunk in chunks)
+            assert sorted(second_embedder.embedded) == sorted(c.content for c in chunks if c.content not in before)
+            assert len(second_embedder.embedded) < len(first_embedder.embedded)
+
+    asyncio.run(_run())
+
+
+def test_pipeline_clones_chunks_of_identical_file(session_factory: async_sessionmaker, tmp_path) -> None:
+    class HashedParser:
+        async def parse(self, source) -> ParsedDocument:
+            pages = [ParsedPage(number=1, content="Shared handbook " + "delta " * 120, metadata={})]
+            metadata = {"docling_hash": "hash-shared", "source_path": str(source), "page_count": 1}
+            return ParsedDocument(title="Handbook", pages=pages, metadata=metadata, docling_document=None)
+
+    class CountingEmbedder(LocalEmbeddingClient):
+        def __init__(self) -> None:
+            super().__init__(dimension=4)
+            self.calls = 0
+
+        async def embed(self, texts):
+            self.calls += 1
+            return await super().embed(texts)
+
+    async def _ingest(repo: DocumentRepository, collection_name: str, embedder) -> tuple[str, str]:
+        collection = await repo.ensure_collection(collection_name, collection_name)
+        source = tmp_path / f"{collection_name}.pdf"
+        source.write_text("same bytes", encoding="utf-8")
+        job = await repo.create_ingestion_job(
+            user_id=None,
+            source=str(source),
+            chunk_size=200,
+            chunk_overlap=20,
+            parameters=None,
+            collection=collection,
+        )
+        await repo.commit()
+        await repo.session.refresh(job, attribute_names=["collection"])
+        await DocumentIngestionPipeline(repo, HashedParser(), embedder, chunk_size=200, chunk_overlap=20).run(job)
+        await repo.update_job_status(job, status=IngestionStatus.success)
+        await repo.commit()
+        return job.id, collection.id
+
+    async def _run() -> None:
+        async with session_factory() as session:
+            repo = DocumentRepository(session)
+            first_job, _ = await _ingest(repo, "originals", CountingEmbedder())
+            second_embedder = CountingEmbedder()
+            second_job, second_collection = await _ingest(repo, "copies", second_embedder)
+
+            assert second_embedder.calls == 0
+            documents = {
+                document.ingestion_job_id: document
+                for document in (await session.execute(select(Document))).scalars()
+            }
+            original = documents[first_job]
+            copy = documents[second_job]
+            assert copy.docling_hash == "hash-shared"
+            original_chunks = list(
+                (await session.execute(select(Chunk).where(Chunk.document_id == original.id))).scalars()
+            )
+            copied_chunks = list((await session.execute(select(Chunk).where(Chunk.document_id == copy.id))).scalars())
+            assert len(copied_chunks) == len(original_chunks) > 1
+            assert {chunk.collection_id for chunk in copied_chunks} == {second_collection}
+            assert sorted(list(chunk.embedding) for chunk in copied_chunks) == sorted(
+                list(chunk.embedding) for chunk in original_chunks
+            )
+            for chunk in copied_chunks:
+                assert chunk.metadata_json["document_id"] == copy.id
+                assert chunk.metadata_json["ingestion_job_id"] == second_job
+                assert chunk.metadata_json["collection"] == "copies"
+                assert chunk.metadata_json["citation"]["image_url"].startswith(f"/ingestion/documents/{copy.id}/")
+                assert all(copy.id in page["image_url"] for page in chunk.metadata_json["citation"]["pages"])
+            events = await repo.list_job_events(second_job)
+            chunk_event = next(event for event in events if event.step is IngestionStep.chunk_assembly)
+            assert chunk_event.detail["cloned_from"] == original.id
+            citation_event = next(event for event in events if event.step is IngestionStep.citation_enrichment)
+            citations = citation_event.detail["citations"]
+            assert len(citations) == len(copied_chunks)
+            assert [citation["chunk_index"] for citation in citations] == sorted(
+                chunk.metadata_json["chunk_index"] for chunk in copied_chunks
+            )
+            assert all(copy.id in citation["image_url"] for citation in citations)
+
+    asyncio.run(_run())
+
+
+
+def test_cloned_chunk_metadata_rewrites_only_ids_and_preview_urls() -> None:
+    preview = "/ingestion/documents/doc-a/pages/2/preview?v=hash"
+    metadata = {
+        "document_id": "doc-a",
+        "ingestion_job_id": "job-a",
+        "headings": ["Appendix doc-a", "job-a checklist"],
+        "source_path": "/uploads/doc-a.pdf",
+        "citation": {
+            "image_url": preview,
+            "image_path": "storage/docling/doc-a/page-0002.png",
+            "pages": [{"page_number": 2, "image_url": preview}],
+        },
+    }
+
+    cloned = _retarget_chunk_metadata(
+        metadata, source_id="doc-a", target_id="doc-b", job_id="job-b", overrides={"source_path": "/uploads/b.pdf"}
+    )
+
+    assert cloned["document_id"] == "doc-b"
+    assert cloned["ingestion_job_id"] == "job-b"
+    assert cloned["headings"] == ["Appendix doc-a", "job-a checklist"]
+    assert cloned["source_path"] == "/uploads/b.pdf"
+    assert cloned["citation"]["image_url"] == "/ingestion/documents/doc-b/pages/2/preview?v=hash"
+    assert cloned["citation"]["image_path"] == "storage/docling/doc-a/page-0002.png"
+    assert cloned["citation"]["pages"] == [{"page_number": 2, "image_url": cloned["citation"]["image_url"]}]
+    assert metadata["citation"]["pages"][0]["image_url"] == preview
+
 def test_delete_ingestion_job_removes_artifacts(app: FastAPI, session_factory: async_sessionmaker) -> None:
     async def _run() -> None:
         async with app.router.lifespan_context(app):
             transport = ASGITransport(app=app)
             async with AsyncClient(transport=transport, base_url="http://testserver") as client:
-                settings = load_settings()
+                settings = dependencies.get_settings()
                 login = await client.post(
                     "/auth/jwt/login",
                     data={
@@ -243,3 +557,224 @@ def test_delete_ingestion_job_removes_artifacts(app: FastAPI, session_factory: a
                     assert await session.get(IngestionEvent, event_id) is None
 
     asyncio.run(_run())
+
+
+def test_document_page_preview_is_cacheable(app: FastAPI, session_factory: async_sessionmaker) -> None:
+    async def _run() -> None:
+        async with app.router.lifespan_context(app):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+                settings = dependencies.get_settings()
+                login = await client.post(
+                    "/auth/jwt/login",
+                    data={
+                        "username": settings.bootstrap.admin_email,
+                        "password": settings.bootstrap.admin_password,
+                    },
+                )
+                assert login.status_code == 200
+                headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+                create_job = await client.post(
+                    "/ingestion/jobs",
+                    json={"source": "preview.pdf", "collection_name": "compliance"},
+                    headers=headers,
+                )
+                assert create_job.status_code == 201
+                job_id = create_job.json()["id"]
+
+                docling_dir = settings.storage.docling_output_dir / "hash-preview"
+                docling_dir.mkdir(parents=True, exist_ok=True)
+                (docling_dir / "page-0001.png").write_bytes(b"png-data")
+                recorded_image = docling_dir / "rendered" / "second.png"
+                recorded_image.parent.mkdir(parents=True, exist_ok=True)
+                recorded_image.write_bytes(b"second-page")
+
+                async with session_factory() as session:
+                    repo = DocumentRepository(session)
+                    job = await repo.get_job(job_id)
+                    assert job is not None
+                    document = await repo.create_document(
+                        title="Preview",
+                        source_path="preview.pdf",
+                        collection_name="compliance",
+                        metadata={"docling_hash": "hash-preview", "image_dir": str(docling_dir)},
+                        job=job,
+                    )
+                    await repo.set_document_pages(document.id, [(2, str(recorded_image), "image/png")])
+                    await repo.commit()
+                    document_id = document.id
+
+                url = f"/ingestion/documents/{document_id}/pages/1/preview?size=thumb"
+                response = await client.get(url, headers=headers)
+                assert response.status_code == 200
+                assert response.headers["etag"].startswith('"hash-preview-1-thumb')
+                assert response.headers["cache-control"] == "private, no-cache"
+
+                pinned = await client.get(f"{url}&v=hash-preview", headers=headers)
+                assert pinned.headers["etag"] == response.headers["etag"]
+                assert "immutable" in pinned.headers["cache-control"]
+                stale = await client.get(f"{url}&v=hash-old", headers=headers)
+                assert "immutable" not in stale.headers["cache-control"]
+
+                revalidated = await client.get(
+                    url, headers={**headers, "If-None-Match": response.headers["etag"]}
+                )
+                assert revalidated.status_code == 304
+                assert revalidated.content == b""
+
+                recorded = await client.get(f"/ingestion/documents/{document_id}/pages/2/preview", headers=headers)
+                assert recorded.status_code == 200
+                assert recorded.content == b"second-page"
+                missing = await client.get(f"/ingestion/documents/{document_id}/pages/3/preview", headers=headers)
+                assert missing.status_code == 404
+
+    asyncio.run(_run())
+
+
+def test_preview_derivatives_are_keyed_by_their_settings(tmp_path: Path) -> None:
+    image = tmp_path / "page-0001.png"
+    image.write_bytes(b"png-data")
+    default = PreviewSettings()
+    smaller = PreviewSettings(thumb_max_edge=240)
+    sharper = PreviewSettings(quality=95)
+
+    paths = {derivative_path(image, "thumb", settings) for settings in (default, smaller, sharper)}
+    assert len(paths) == 3
+    etags = {preview_etag("hash", 1, "thumb", image, settings) for settings in (default, smaller, sharper)}
+    assert len(etags) == 3
+    assert derivative_path(image, "medium", default) == tmp_path / "previews" / "page-0001-medium-1280-q80.webp"
+
+
+
+def test_concurrent_preview_renders_write_separate_temporary_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    saved: list[Path] = []
+
+    class FakeImage:
+        mode = "RGB"
+
+        def __enter__(self) -> "FakeImage":
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            return None
+
+        def thumbnail(self, size: tuple[int, int]) -> None:
+            return None
+
+        def save(self, path: Path, **options: object) -> None:
+            saved.append(Path(path))
+            if len(saved) == 3:
+                raise OSError("disk full")
+            Path(path).write_bytes(b"webp")
+
+    monkeypatch.setitem(sys.modules, "PIL", SimpleNamespace(Image=SimpleNamespace(open=lambda path: FakeImage())))
+    image = tmp_path / "page-0001.png"
+    target = derivative_path(image, "thumb", PreviewSettings())
+
+    _render(image, target, max_edge=320, settings=PreviewSettings())
+    _render(image, target, max_edge=320, settings=PreviewSettings())
+    with pytest.raises(OSError):
+        _render(image, target, max_edge=320, settings=PreviewSettings())
+
+    assert len(set(saved)) == 3
+    assert target not in saved
+    assert [path.name for path in target.parent.iterdir()] == [target.name]
+
+def test_upload_streams_files_and_creates_jobs_in_bulk(app: FastAPI, session_factory: async_sessionmaker) -> None:
+    async def _run() -> None:
+        async with app.router.lifespan_context(app):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+                settings = load_settings()
+                login = await client.post(
+                    "/auth/jwt/login",
+                    data={
+                        "username": settings.bootstrap.admin_email,
+                        "password": settings.bootstrap.admin_password,
+                    },
+                )
+                assert login.status_code == 200
+                headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+                # Larger than one upload slice, so the file is written in several pieces.
+                scan = b"%PDF-1.4\n" + bytes(range(256)) * 10_000
+                memo = b"%PDF-1.4\nmemo"
+                response = await client.post(
+                    "/ingestion/jobs/upload",
+                    data={"collection": "compliance", "chunk_size": "600"},
+                    files=[
+                        ("files", ("scan.pdf", scan, "application/pdf")),
+                        ("files", ("memo.pdf", memo, "application/pdf")),
+                    ],
+                    headers=headers,
+                )
+                assert response.status_code == 201
+                jobs = response.json()
+                assert [job["metadata"]["original_filename"] for job in jobs] == ["scan.pdf", "memo.pdf"]
+                for job, content in zip(jobs, (scan, memo)):
+                    assert job["collection_name"] == "compliance"
+                    assert job["chunk_size"] == 600
+                    assert "source_sha256" not in job["metadata"]
+                    assert [event["step"] for event in job["events"]] == [step.value for step in IngestionStep]
+                    assert Path(job["events"][0]["document_path"]).read_bytes() == content
+
+                async with session_factory() as session:
+                    repo = DocumentRepository(session)
+                    for job, content in zip(jobs, (scan, memo)):
+                        stored = await repo.get_job(job["id"])
+                        assert stored is not None
+                        assert stored.source_sha256 == hashlib.sha256(content).hexdigest()
+                        events = await repo.list_job_events(job["id"])
+                        assert [event.id for event in events] == [event["id"] for event in job["events"]]
+
+    asyncio.run(_run())
+
+
+def test_failed_upload_removes_files_already_stored(
+    app: FastAPI, session_factory: async_sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # ``src.ingestion.router`` is shadowed by the APIRouter re-exported from the package.
+    ingestion_router = importlib.import_module("src.ingestion.router")
+    stored: list[Path] = []
+    store_upload = ingestion_router._store_upload
+
+    async def _store_then_fail(file: Any, base_dir: Path) -> tuple[Path, str]:
+        if stored:
+            raise OSError("disk full")
+        result = await store_upload(file, base_dir)
+        stored.append(result[0])
+        return result
+
+    monkeypatch.setattr(ingestion_router, "_store_upload", _store_then_fail)
+
+    async def _run() -> None:
+        async with app.router.lifespan_context(app):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+                settings = load_settings()
+                login = await client.post(
+                    "/auth/jwt/login",
+                    data={
+                        "username": settings.bootstrap.admin_email,
+                        "password": settings.bootstrap.admin_password,
+                    },
+                )
+                headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+                with pytest.raises(OSError):
+                    await client.post(
+                        "/ingestion/jobs/upload",
+                        data={"collection": "compliance"},
+                        files=[
+                            ("files", ("first.pdf", b"%PDF-1.4 first", "application/pdf")),
+                            ("files", ("second.pdf", b"%PDF-1.4 second", "application/pdf")),
+                        ],
+                        headers=headers,
+                    )
+
+        assert len(stored) == 1
+        assert not stored[0].exists()
+
+    asyncio.run(_run())
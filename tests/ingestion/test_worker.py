@@ -0,0 +1,218 @@
+"""Concurrent ingestion worker tests."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.config import Settings
+from src.infrastructure.database import Chunk, IngestionStatus
+from src.infrastructure.embeddings.local import LocalEmbeddingClient
+from src.infrastructure.repositories.document_repo import DocumentRepository
+from src.ingestion import worker
+from src.ingestion.pipeline import ParsedDocument, ParsedPage
+
+
+async def _create_jobs(session_factory: async_sessionmaker, count: int) -> list[str]:
+    async with session_factory() as session:
+        repo = DocumentRepository(session)
+        collection = await repo.ensure_collection("worker", "Worker collection")
+        job_ids = []
+        for index in range(count):
+            job = await repo.create_ingestion_job(
+                user_id=None,
+                source=f"/tmp/source-{index}.pdf",
+                chunk_size=1200,
+                chunk_overlap=150,
+                parameters=None,
+                collection=collection,
+            )
+            job_ids.append(job.id)
+        await repo.commit()
+        return job_ids
+
+
+async def _job_statuses(session_factory: async_sessionmaker, job_ids: list[str]) -> list[IngestionStatus]:
+    async with session_factory() as session:
+        repo = DocumentRepository(session)
+        statuses = []
+        for job_id in job_ids:
+            job = await repo.get_job(job_id)
+            assert job is not None
+            await session.refresh(job)
+            statuses.append(job.status)
+        return statuses
+
+
+def _worker_settings(concurrency: int, grace: float) -> Settings:
+    settings = Settings()
+    settings.ingestion = settings.ingestion.model_copy(
+        update={"worker_concurrency": concurrency, "shutdown_grace_seconds": grace}
+    )
+    return settings
+
+
+def test_worker_runs_jobs_concurrently(
+    session_factory: async_sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    running: set[str] = set()
+    peak = 0
+    both_running = asyncio.Event()
+
+    async def fake_process_job(session, job, settings):
+        nonlocal peak
+        assert job.status is IngestionStatus.running
+        running.add(job.id)
+        peak = max(peak, len(running))
+        if len(running) == 2:
+            both_running.set()
+        await asyncio.wait_for(both_running.wait(), timeout=5)
+        job.status = IngestionStatus.success
+        await session.commit()
+        return job.status
+
+    monkeypatch.setattr(worker, "get_session_factory", lambda: session_factory)
+    monkeypatch.setattr(worker, "process_job", fake_process_job)
+
+    async def _run() -> None:
+        job_ids = await _create_jobs(session_factory, 2)
+        stop_event = asyncio.Event()
+        loop_task = asyncio.create_task(
+            worker.worker_loop(_worker_settings(2, 5.0), poll_interval=0.01, stop_event=stop_event)
+        )
+        await asyncio.wait_for(both_running.wait(), timeout=5)
+        await asyncio.sleep(0.05)
+        stop_event.set()
+        await asyncio.wait_for(loop_task, timeout=5)
+
+        assert peak == 2
+        assert await _job_statuses(session_factory, job_ids) == [IngestionStatus.success] * 2
+
+    asyncio.run(_run())
+
+
+def test_worker_requeues_jobs_still_running_after_grace_period(
+    session_factory: async_sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    started = asyncio.Event()
+
+    async def stuck_process_job(session, job, settings):
+        started.set()
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(worker, "get_session_factory", lambda: session_factory)
+    monkeypatch.setattr(worker, "process_job", stuck_process_job)
+
+    async def _run() -> None:
+        job_ids = await _create_jobs(session_factory, 1)
+        stop_event = asyncio.Event()
+        loop_task = asyncio.create_task(
+            worker.worker_loop(_worker_settings(1, 0.05), poll_interval=0.01, stop_event=stop_event)
+        )
+        await asyncio.wait_for(started.wait(), timeout=5)
+        stop_event.set()
+        await asyncio.wait_for(loop_task, timeout=5)
+
+        assert await _job_statuses(session_factory, job_ids) == [IngestionStatus.pending]
+
+    asyncio.run(_run())
+
+
+def test_job_notification_wakes_idle_worker(
+    session_factory: async_sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    listeners: list[FakeListener] = []
+    processed = asyncio.Event()
+
+    class FakeListener:
+        def __init__(self, settings, wake_event: asyncio.Event) -> None:
+            self.wake_event = wake_event
+            self.connected = True
+            self.enabled = True
+            listeners.append(self)
+
+        async def run(self, stop_event: asyncio.Event) -> None:
+            await stop_event.wait()
+
+    async def fake_process_job(session, job, settings):
+        job.status = IngestionStatus.success
+        await session.commit()
+        processed.set()
+        return job.status
+
+    monkeypatch.setattr(worker, "get_session_factory", lambda: session_factory)
+    monkeypatch.setattr(worker, "process_job", fake_process_job)
+    monkeypatch.setattr(worker, "JobNotificationListener", FakeListener)
+
+    async def _run() -> None:
+        stop_event = asyncio.Event()
+        loop_task = asyncio.create_task(
+            worker.worker_loop(_worker_settings(1, 1.0), poll_interval=30.0, stop_event=stop_event)
+        )
+        await asyncio.sleep(0.05)
+        await _create_jobs(session_factory, 1)
+        listeners[0].wake_event.set()
+        # Without the notification the idle slot would sleep for the 30s fallback interval.
+        await asyncio.wait_for(processed.wait(), timeout=2)
+        stop_event.set()
+        await asyncio.wait_for(loop_task, timeout=5)
+
+    asyncio.run(_run())
+
+
+def test_failed_job_commits_no_chunks_of_a_partly_embedded_document(
+    session_factory: async_sessionmaker, monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    class PagedParser:
+        async def parse(self, source, *, file_hash=None) -> ParsedDocument:
+            pages = [
+                ParsedPage(number=number, content=f"Page {number} " + "lorem ipsum " * 60, metadata={})
+                for number in (1, 2, 3)
+            ]
+            metadata = {"docling_hash": "hash-partial", "source_path": str(source), "page_count": 3}
+            return ParsedDocument(title="Partial", pages=pages, metadata=metadata, docling_document=None)
+
+    class FlakyEmbedder(LocalEmbeddingClient):
+        def __init__(self) -> None:
+            super().__init__(dimension=4)
+            self.calls = 0
+
+        async def embed(self, texts):
+            self.calls += 1
+            if self.calls == 3:
+                raise RuntimeError("embedding backend unavailable")
+            return await super().embed(texts)
+
+    embedder = FlakyEmbedder()
+    monkeypatch.setattr(worker, "DoclingParser", lambda **_: PagedParser())
+    monkeypatch.setattr(worker, "create_embedding_client", lambda _settings: embedder)
+
+    async def _run() -> None:
+        source = tmp_path / "partial.pdf"
+        source.write_text("placeholder", encoding="utf-8")
+        async with session_factory() as session:
+            repo = DocumentRepository(session)
+            collection = await repo.ensure_collection("partial", "Partial collection")
+            job = await repo.create_ingestion_job(
+                user_id=None,
+                source=str(source),
+                chunk_size=200,
+                chunk_overlap=20,
+                parameters=None,
+                collection=collection,
+            )
+            await repo.commit()
+            settings = Settings()
+            settings.chunking = settings.chunking.model_copy(update={"default_size": 200, "default_overlap": 20})
+            settings.ingestion = settings.ingestion.model_copy(update={"embed_batch_size": 2})
+            status = await worker.process_job(session, job, settings)
+
+        assert status is IngestionStatus.failed
+        assert embedder.calls == 3
+        async with session_factory() as session:
+            chunk_count = (await session.execute(select(func.count()).select_from(Chunk))).scalar_one()
+            assert chunk_count == 0
+
+    asyncio.run(_run())
@@ -0,0 +1,133 @@
+"""Semantic answer cache tests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Mapping, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.config import AnswerCacheSettings
+from src.infrastructure.database import AnswerCacheEntry, Collection
+from src.infrastructure.embeddings.base import EMBEDDING_DIMENSION, EmbeddingClient
+from src.infrastructure.llm.base import LLMClient
+from src.infrastructure.repositories.document_repo import DocumentRepository
+from src.infrastructure.vectorstore.base import VectorStoreClient
+from src.retrieval.cache import SemanticAnswerCache
+from src.retrieval.strategies.base import RetrievalContext
+from src.retrieval.strategies.rag import RAGStrategy
+
+
+class KeywordEmbedder(EmbeddingClient):
+    """Map texts onto one axis per known keyword so similarity is predictable."""
+
+    model_name = "keyword-embed"
+    keywords = ("retention", "travel", "budget")
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        vectors = []
+        for text in texts:
+            vector = [0.0] * EMBEDDING_DIMENSION
+            for index, keyword in enumerate(self.keywords):
+                if keyword in text.lower():
+                    vector[index] = 1.0
+            vector[-1] = 0.01 * len(text.split())
+            vectors.append(vector)
+        return vectors
+
+
+class CountingVectorStore(VectorStoreClient):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def similarity_search(
+        self, query: str, *, k: int = 5, collection_ids: Sequence[str] | None = None
+    ) -> Sequence[Mapping[str, Any]]:
+        self.calls += 1
+        return [{"chunk_id": "c1", "document_id": "d1", "content": "Keep records for ten years.", "score": 0.9}]
+
+
+class CountingLLM(LLMClient):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, prompt: str, *, context: Sequence[str] | None = None) -> AsyncGenerator[str, None]:
+        self.calls += 1
+        yield "Ten years "
+        yield "[1]."
+
+
+def test_similar_questions_replay_cached_answers(session_factory: async_sessionmaker) -> None:
+    async def _ask(
+        strategy: RAGStrategy, query: str, collection_ids: list[str], mode: str | None = None
+    ) -> list[Any]:
+        context = RetrievalContext(
+            conversation_id="conv", query=query, mode=mode, user_roles=[], collection_ids=collection_ids
+        )
+        return [event async for event in strategy.run(context)]
+
+    async def _run() -> None:
+        async with session_factory() as session:
+            document_repo = DocumentRepository(session)
+            finance = await document_repo.ensure_collection("finance")
+            hr = await document_repo.ensure_collection("hr")
+            # Collections last changed well before any answer is cached.
+            await session.execute(
+                update(Collection).values(updated_at=datetime.now(timezone.utc) - timedelta(days=1))
+            )
+            await session.commit()
+
+            store, llm = CountingVectorStore(), CountingLLM()
+            cache = SemanticAnswerCache(
+                session,
+                KeywordEmbedder(),
+                model_key="test-llm|keyword-embed",
+                settings=AnswerCacheSettings(similarity_threshold=0.95),
+            )
+            strategy = RAGStrategy(store, llm, answer_cache=cache)
+
+            first = await _ask(strategy, "What is the retention period?", [finance.id])
+            await session.commit()
+            assert llm.calls == 1 and store.calls == 1
+            assert "".join(e.data["text"] for e in first if e.type == "token") == "Ten years [1]."
+
+            replay = await _ask(strategy, "what is the RETENTION period", [finance.id])
+            assert llm.calls == 1 and store.calls == 1
+            assert [e.data["text"] for e in replay if e.type == "token"] == ["Ten years [1]."]
+            citations = next(e for e in replay if e.type == "citations").data["citations"]
+            assert citations[0]["chunk_id"] == "c1"
+            assert replay[-1].type == "done"
+
+            # A different question, or the same one under another role scope, is not served from cache.
+            await _ask(strategy, "What is the travel budget?", [finance.id])
+            await _ask(strategy, "What is the retention period?", [finance.id, hr.id])
+            assert llm.calls == 3
+            await session.commit()
+
+            # Answers generated from hybrid retrieval are cached separately from pure vector ones.
+            await _ask(strategy, "What is the retention period?", [finance.id], mode="hybrid")
+            assert llm.calls == 4
+            await session.commit()
+            await _ask(strategy, "What is the retention period?", [finance.id], mode="HYBRID")
+            assert llm.calls == 4
+
+            # New content in the collection invalidates its cached answers.
+            await session.execute(
+                update(Collection).where(Collection.id == finance.id).values(updated_at=datetime.now(timezone.utc))
+            )
+            await session.commit()
+            await _ask(strategy, "What is the retention period?", [finance.id])
+            assert llm.calls == 5
+            await session.commit()
+
+            # Expired entries are ignored as well.
+            await session.execute(
+                update(AnswerCacheEntry).values(expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+            )
+            await session.commit()
+            await _ask(strategy, "What is the retention period?", [finance.id])
+            assert llm.calls == 6
+
+    asyncio.run(_run())
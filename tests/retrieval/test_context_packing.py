@@ -0,0 +1,97 @@
+"""Prompt context packing tests."""
+from __future__ import annotations
+
+from src.config import RetrievalSettings
+from src.retrieval.context_packing import estimate_tokens, pack_context
+from src.retrieval.strategies.rag import RetrievedChunk
+
+
+def _chunk(label: str, content: str, *, document_id: str = "doc-1", page: int | None = 1) -> RetrievedChunk:
+    return RetrievedChunk(
+        label=label,
+        chunk_id=f"chunk-{label}",
+        document_id=document_id,
+        content=content,
+        snippet=content[:20],
+        score=0.9,
+        chunk_metadata={"page_number": page, "docling_chunk": {"huge": "x" * 500}},
+        document_title="Operations Manual",
+        document_metadata={"ingestion": {"chunk_size": 1200}},
+    )
+
+
+def test_llm_block_uses_compact_citation_header() -> None:
+    block = _chunk("[1]", "Valves must be inspected monthly.", page=7).llm_block()
+    assert block == "[1] Operations Manual (p. 7)\nValves must be inspected monthly."
+
+
+def test_pack_context_removes_overlap_between_chunks_of_one_document() -> None:
+    first = "Section A describes pumps. " * 4 + "Shared overlap sentence about valve inspection intervals."
+    second = "Shared overlap sentence about valve inspection intervals." + " Section B covers filters."
+    other = "Shared overlap sentence about valve inspection intervals. Elsewhere."
+    packed = pack_context(
+        [_chunk("[1]", first), _chunk("[2]", second), _chunk("[3]", other, document_id="doc-2")],
+        RetrievalSettings(context_token_budget=1000),
+    )
+
+    assert [chunk.content for chunk in packed.chunks] == [first, "Section B covers filters.", other]
+    assert packed.deduplicated_chars == len(second) - len("Section B covers filters.")
+
+
+def test_pack_context_skips_contained_chunks_and_relabels() -> None:
+    packed = pack_context(
+        [_chunk("[1]", "alpha beta gamma delta"), _chunk("[2]", "beta gamma"), _chunk("[3]", "other text", page=2)],
+        RetrievalSettings(context_token_budget=1000),
+    )
+    assert [chunk.label for chunk in packed.chunks] == ["[1]", "[2]"]
+    assert packed.chunks[1].content == "other text"
+    assert packed.dropped == 1
+
+
+def test_pack_context_respects_token_budget() -> None:
+    settings = RetrievalSettings(context_token_budget=200, chars_per_token=4.0)
+    chunks = [_chunk(f"[{index}]", f"chunk {index} " + "word " * 100, page=index) for index in range(1, 6)]
+    packed = pack_context(chunks, settings)
+
+    assert packed.tokens <= settings.context_token_budget
+    assert sum(estimate_tokens(block) for block in packed.blocks()) == packed.tokens
+    assert len(packed.chunks) == 2
+    assert packed.chunks[-1].content.endswith("…")
+    assert packed.dropped == len(chunks) - len(packed.chunks)
+
+
+def _window(label: str, text: str, index: int, start: int, end: int, *, page: int = 1) -> RetrievedChunk:
+    chunk = _chunk(label, text[start:end], page=page)
+    chunk.chunk_id = f"chunk-{index}"
+    chunk.chunk_metadata.update({"chunk_index": index, "character_start": start, "character_end": end})
+    return chunk
+
+
+def test_merge_adjacent_chunks_coalesces_overlapping_windows() -> None:
+    text = "".join(f"sentence {number:02d}. " for number in range(30))
+    windows = [(0, 0, 120), (1, 100, 220), (2, 200, 320), (3, 300, len(text))]
+    retrieved = [
+        _window("[1]", text, 2, *windows[2][1:]),
+        _window("[2]", text, 0, *windows[0][1:], page=2),
+        _window("[3]", text, 1, *windows[1][1:]),
+        _window("[4]", text, 3, *windows[3][1:]),
+    ]
+    settings = RetrievalSettings(context_token_budget=1000)
+    packed = pack_context(retrieved, settings)
+
+    # Index 0 sits on another page, so only windows 1-3 are merged, at the rank of the best member.
+    assert [chunk.label for chunk in packed.chunks] == ["[1]", "[2]"]
+    merged = packed.chunks[0]
+    assert merged.content == text[100:].strip()
+    assert merged.merged_chunk_ids == ["chunk-1", "chunk-2", "chunk-3"]
+    assert merged.citation_payload()["chunk_ids"] == ["chunk-1", "chunk-2", "chunk-3"]
+    assert merged.chunk_metadata["character_start"] == 100
+    assert merged.chunk_metadata["character_end"] == len(text)
+    assert packed.chunks[1].content == text[0:120].strip()
+
+
+def test_merge_adjacent_chunks_ignores_restarted_offsets() -> None:
+    # Docling chunks are sliced separately, so a new chunk's offsets restart at zero.
+    first = _window("[1]", "a" * 50, 0, 0, 50)
+    second = _window("[2]", "b" * 50, 1, 0, 50)
+    assert len(pack_context([first, second], RetrievalSettings()).chunks) == 2
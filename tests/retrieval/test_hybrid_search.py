@@ -0,0 +1,85 @@
+"""Hybrid retrieval helpers and mode selection tests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Mapping, Sequence
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from src.infrastructure.database import Base, Chunk
+from src.infrastructure.llm.base import LLMClient
+from src.infrastructure.vectorstore.base import VectorStoreClient
+from src.infrastructure.vectorstore.pgvector import lexical_query_text, reciprocal_rank_fusion
+from src.retrieval.strategies.base import RetrievalContext
+from src.retrieval.strategies.rag import RAGStrategy
+
+
+def test_lexical_query_keeps_identifiers_whole() -> None:
+    text = lexical_query_text("Does RN-2023-118 apply under 2016/679, Art. 5?")
+    assert text == "RN-2023-118 or apply or 2016/679 or Art or 5"
+
+
+def test_lexical_query_drops_stopwords_and_short_words() -> None:
+    assert lexical_query_text("what is the retention period under 2016/679") == "retention or period or 2016/679"
+    assert lexical_query_text("Was ist die Frist in der DSGVO?") == "Frist or DSGVO"
+    assert lexical_query_text("is it a") == ""
+
+
+def test_chunk_fulltext_column_is_declared_for_postgres_only() -> None:
+    ddl = str(CreateTable(Chunk.__table__).compile(dialect=postgresql.dialect()))
+    assert "content_tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector(" in ddl
+    gin_index = next(index for index in Chunk.__table__.indexes if index.name == "ix_chunks_content_tsv")
+    assert "USING gin (content_tsv)" in str(CreateIndex(gin_index).compile(dialect=postgresql.dialect()))
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    columns = {column["name"] for column in inspect(engine).get_columns("chunks")}
+    assert "content" in columns
+    assert "content_tsv" not in columns
+
+
+def test_reciprocal_rank_fusion_rewards_agreement() -> None:
+    scores = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]], k=60)
+    assert max(scores, key=scores.__getitem__) == "c"
+    assert scores["a"] == pytest.approx(1 / 61)
+    assert scores["c"] == pytest.approx(1 / 63 + 1 / 61)
+
+
+class RecordingStore(VectorStoreClient):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def similarity_search(
+        self, query: str, *, k: int = 5, collection_ids: Sequence[str] | None = None
+    ) -> Sequence[Mapping[str, Any]]:
+        self.calls.append("vector")
+        return []
+
+    async def hybrid_search(
+        self, query: str, *, k: int = 5, collection_ids: Sequence[str] | None = None
+    ) -> Sequence[Mapping[str, Any]]:
+        self.calls.append("hybrid")
+        return []
+
+
+class EchoLLM(LLMClient):
+    async def generate(self, prompt: str, *, context: Sequence[str] | None = None) -> AsyncGenerator[str, None]:
+        yield prompt
+
+
+def test_hybrid_mode_selects_hybrid_search() -> None:
+    store = RecordingStore()
+    strategy = RAGStrategy(store, EchoLLM())
+
+    async def _run(mode: str | None) -> None:
+        context = RetrievalContext(conversation_id="c", query="KX-200", mode=mode, user_roles=[])
+        async for _ in strategy.run(context):
+            pass
+
+    asyncio.run(_run("hybrid"))
+    asyncio.run(_run(None))
+    assert store.calls == ["hybrid", "vector"]
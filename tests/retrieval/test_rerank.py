@@ -0,0 +1,82 @@
+"""Reranking stage tests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Mapping, Sequence
+from typing import Any
+
+from src.infrastructure.llm.base import LLMClient
+from src.infrastructure.rerank import LocalReranker
+from src.infrastructure.vectorstore.base import VectorStoreClient
+from src.retrieval.strategies.base import RetrievalContext
+from src.retrieval.strategies.rag import RAGStrategy
+
+PASSAGES = [
+    "Quarterly revenue grew in the retail segment.",
+    "The office coffee machine is on the second floor.",
+    "Data retention for customer records is ten years under the retention policy.",
+    "Retention of customer records follows the archive schedule.",
+]
+
+
+class FixedStore(VectorStoreClient):
+    def __init__(self) -> None:
+        self.requested_k: list[int] = []
+
+    async def similarity_search(
+        self, query: str, *, k: int = 5, collection_ids: Sequence[str] | None = None
+    ) -> Sequence[Mapping[str, Any]]:
+        self.requested_k.append(k)
+        return [
+            {"chunk_id": f"c{index}", "document_id": "d", "content": text, "score": 0.5}
+            for index, text in enumerate(PASSAGES[:k])
+        ]
+
+
+class RecordingLLM(LLMClient):
+    def __init__(self) -> None:
+        self.contexts: list[Sequence[str] | None] = []
+
+    async def generate(self, prompt: str, *, context: Sequence[str] | None = None) -> AsyncGenerator[str, None]:
+        self.contexts.append(context)
+        yield "ok"
+
+
+def test_local_reranker_scores_term_overlap() -> None:
+    scores = asyncio.run(LocalReranker().score("customer retention policy", PASSAGES))
+    assert scores[2] == 1.0
+    assert scores[1] == 0.0
+    assert scores[3] > scores[0]
+
+
+def test_rag_strategy_reranks_candidate_pool_to_top_k() -> None:
+    store = FixedStore()
+    llm = RecordingLLM()
+    strategy = RAGStrategy(store, llm, reranker=LocalReranker(), rerank_candidates=50, top_k=2)
+
+    async def _run() -> list[Any]:
+        context = RetrievalContext(conversation_id="c", query="customer retention policy", mode=None, user_roles=[])
+        return [event async for event in strategy.run(context)]
+
+    events = asyncio.run(_run())
+    assert store.requested_k == [50]
+    stages = [event.data.get("stage") for event in events if event.type == "status"]
+    assert stages.index("reranking") < stages.index("reranked") < stages.index("generating")
+    reranked = next(event for event in events if event.data.get("stage") == "reranked")
+    assert reranked.data["duration_ms"] >= 0
+    context_event = next(event for event in events if event.type == "context")
+    assert [chunk["chunk_id"] for chunk in context_event.data["chunks"]] == ["c2", "c3"]
+    assert len(llm.contexts[0] or []) == 2
+
+
+def test_rag_strategy_without_reranker_fetches_top_k() -> None:
+    store = FixedStore()
+    strategy = RAGStrategy(store, RecordingLLM(), top_k=3)
+
+    async def _run() -> None:
+        context = RetrievalContext(conversation_id="c", query="retention", mode=None, user_roles=[])
+        async for _ in strategy.run(context):
+            pass
+
+    asyncio.run(_run())
+    assert store.requested_k == [3]
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from src.infrastructure.database import RoleCategory
 from src.infrastructure.repositories.conversation_repo import ConversationRepository
+from src.infrastructure.repositories.document_repo import DocumentRepository
 from src.infrastructure.repositories.user_repo import UserRepository
 from src.retrieval.dependencies import get_retrieval_service
 from src.retrieval.service import RetrievalService
@@ -41,7 +42,12 @@ def _install_retrieval_override(
     async def override() -> AsyncGenerator[RetrievalService, None]:
         async with session_factory() as session:
             repo = ConversationRepository(session)
-            service = RetrievalService(repo, rag_strategy, graphrag_strategy)
+            service = RetrievalService(
+                repo,
+                rag_strategy,
+                graphrag_strategy,
+                document_repo=DocumentRepository(session),
+            )
             yield service
 
     app.dependency_overrides[get_retrieval_service] = override
@@ -152,3 +158,115 @@ def test_graphrag_role_triggers_graphrag_strategy(
         asyncio.run(_run())
     finally:
         app.dependency_overrides.pop(get_retrieval_service, None)
+
+
+def test_rag_search_is_scoped_to_workspace_collections(
+    app: FastAPI, session_factory: async_sessionmaker
+) -> None:
+    rag_strategy = RecordingStrategy("rag")
+    graphrag_strategy = RecordingStrategy("graphrag")
+    _install_retrieval_override(app, session_factory, rag_strategy, graphrag_strategy)
+
+    async def _run() -> None:
+        async with app.router.lifespan_context(app):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+                payload = {"email": "erin@example.com", "password": "ErinSecret5!", "full_name": "Erin"}
+                register = await client.post("/auth/register", json=payload)
+                assert register.status_code == 201
+                login = await client.post(
+                    "/auth/jwt/login",
+                    data={"username": payload["email"], "password": payload["password"]},
+                )
+                assert login.status_code == 200
+                headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+                async with session_factory() as session:
+                    user_repo = UserRepository(session)
+                    document_repo = DocumentRepository(session)
+                    user = await user_repo.get_by_email(payload["email"])
+                    assert user is not None
+                    workspace = await user_repo.ensure_role("finance", "Finance workspace", RoleCategory.workspace)
+                    await user_repo.assign_role(user, workspace)
+                    allowed = await document_repo.ensure_collection("finance-docs")
+                    await document_repo.ensure_collection("hr-docs")
+                    await document_repo.assign_collection_to_role(allowed, workspace)
+                    await document_repo.commit()
+                    allowed_id = allowed.id
+
+                session_response = await client.post("/chat/sessions", json={"title": "Erin Session"}, headers=headers)
+                assert session_response.status_code == 201
+                session_id = session_response.json()["id"]
+
+                message_response = await client.post(
+                    f"/chat/{session_id}/messages",
+                    json={"query": "Budget?", "mode": None},
+                    headers=headers,
+                )
+                assert message_response.status_code == 200
+                async for _ in message_response.aiter_lines():
+                    pass
+                assert len(rag_strategy.calls) == 1
+                assert rag_strategy.calls[0].collection_ids == [allowed_id]
+
+    try:
+        asyncio.run(_run())
+    finally:
+        app.dependency_overrides.pop(get_retrieval_service, None)
+
+
+def test_sessions_and_messages_are_keyset_paginated(app: FastAPI, session_factory: async_sessionmaker) -> None:
+    async def _run() -> None:
+        async with app.router.lifespan_context(app):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+                payload = {"email": "frank@example.com", "password": "PagedSecret5!", "full_name": "Frank"}
+                register = await client.post("/auth/register", json=payload)
+                assert register.status_code == 201
+                user_id = register.json()["id"]
+                login = await client.post(
+                    "/auth/jwt/login",
+                    data={"username": payload["email"], "password": payload["password"]},
+                )
+                headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+                async with session_factory() as session:
+                    repo = ConversationRepository(session)
+                    conversation_ids = []
+                    for index in range(5):
+                        conversation = await repo.create_conversation(user_id, f"Session {index}")
+                        conversation_ids.append(conversation.id)
+                        # Adding a message marks the conversation as the most recently active one.
+                        await repo.add_message(conversation.id, "user", f"hello {index}")
+                    busy_id = conversation_ids[0]
+                    for turn in range(7):
+                        await repo.add_message(busy_id, "assistant", f"turn {turn}", context=[{"label": "S1"}])
+                    await session.commit()
+
+                first = await client.get("/chat/sessions", params={"limit": 2}, headers=headers)
+                assert first.status_code == 200
+                assert [item["id"] for item in first.json()] == [busy_id, conversation_ids[4]]
+                cursor = first.headers["X-Next-Cursor"]
+                seen = [item["id"] for item in first.json()]
+                while cursor:
+                    page = await client.get("/chat/sessions", params={"limit": 2, "before": cursor}, headers=headers)
+                    seen += [item["id"] for item in page.json()]
+                    cursor = page.headers.get("X-Next-Cursor")
+                assert seen == [busy_id, *reversed(conversation_ids[1:])]
+
+                latest = await client.get(f"/chat/{busy_id}/messages", params={"limit": 3}, headers=headers)
+                assert [item["content"] for item in latest.json()] == ["turn 4", "turn 5", "turn 6"]
+                assert latest.json()[0]["context"] == [{"label": "S1"}]
+                older = await client.get(
+                    f"/chat/{busy_id}/messages",
+                    params={"limit": 10, "before": latest.headers["X-Next-Cursor"], "include_context": "false"},
+                    headers=headers,
+                )
+                assert [item["content"] for item in older.json()] == ["hello 0", "turn 0", "turn 1", "turn 2", "turn 3"]
+                assert all(item["context"] is None and item["citations"] is None for item in older.json())
+                assert "X-Next-Cursor" not in older.headers
+
+                invalid = await client.get("/chat/sessions", params={"before": "not-a-cursor"}, headers=headers)
+                assert invalid.status_code == 400
+
+    asyncio.run(_run())